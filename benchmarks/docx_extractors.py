@@ -0,0 +1,134 @@
+"""
+DOCX 추출 백엔드 벤치마크
+
+Word 문서(.docx) 코퍼스에 대해 직접 추출(native)과 unstructured 로더의
+처리 시간, 최대 메모리 사용량, 추출 결과 유사도를 비교합니다.
+
+사용법:
+    python benchmarks/docx_extractors.py <코퍼스_디렉토리_또는_파일> [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_processor import _process_word_sync
+
+BACKENDS = ['unstructured', 'native']
+
+
+def load_corpus(corpus_path: str) -> list:
+    """
+    디렉토리(또는 파일 하나)에서 .docx 파일 경로들을 모으는 함수
+    
+    Args:
+        corpus_path (str): 코퍼스 디렉토리 또는 .docx 파일 경로
+        
+    Returns:
+        list: .docx 파일 경로 리스트
+    """
+    if os.path.isfile(corpus_path):
+        return [corpus_path]
+    
+    paths = []
+    for root, _, files in os.walk(corpus_path):
+        for name in sorted(files):
+            if name.lower().endswith('.docx') and not name.startswith('~$'):
+                paths.append(os.path.join(root, name))
+    return paths
+
+
+def run_benchmark(paths: list, repeat: int = 3) -> dict:
+    """
+    백엔드별 처리 시간, 최대 메모리, 결과를 측정하는 함수
+    
+    시간은 tracemalloc 없이 repeat번 측정한 최솟값이고, 메모리는 한 번 더 실행하여
+    tracemalloc으로 측정합니다. 첫 실행에는 백엔드 import 시간이 포함됩니다.
+    
+    Args:
+        paths (list): .docx 파일 경로 리스트
+        repeat (int): 반복 횟수 (최솟값 사용)
+        
+    Returns:
+        dict: {백엔드: {'first_seconds', 'seconds', 'peak_bytes', 'outputs', 'errors'}}
+    """
+    results = {}
+    for backend in BACKENDS:
+        timings = []
+        outputs = []
+        errors = 0
+        for _ in range(repeat):
+            outputs, errors = [], 0
+            start = time.perf_counter()
+            for path in paths:
+                try:
+                    outputs.append(_process_word_sync(path, backend=backend))
+                except Exception as e:
+                    print(f"{backend} 백엔드 처리 실패 ({path}): {e}")
+                    outputs.append(None)
+                    errors += 1
+            timings.append(time.perf_counter() - start)
+        
+        tracemalloc.start()
+        for path in paths:
+            try:
+                _process_word_sync(path, backend=backend)
+            except Exception:
+                pass
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        results[backend] = {
+            'first_seconds': timings[0],
+            'seconds': min(timings),
+            'peak_bytes': peak_bytes,
+            'outputs': outputs,
+            'errors': errors
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DOCX 추출 백엔드 벤치마크')
+    parser.add_argument('corpus_path', help='.docx 파일 디렉토리 또는 파일')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+    
+    paths = load_corpus(args.corpus_path)
+    if not paths:
+        print(f"DOCX 파일을 찾을 수 없습니다: {args.corpus_path}")
+        return
+    
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    print(f"문서 수: {len(paths)}, 총 크기: {total_bytes / 1024 / 1024:.1f}MB")
+    
+    results = run_benchmark(paths, args.repeat)
+    for backend in BACKENDS:
+        result = results[backend]
+        print(f"{backend:>12}: {result['seconds']:.3f}초 (첫 실행 {result['first_seconds']:.3f}초), "
+              f"최대 메모리 {result['peak_bytes'] / 1024 / 1024:.1f}MB, 실패 {result['errors']}건")
+    
+    if results['unstructured']['errors'] == len(paths):
+        print("unstructured 백엔드가 모든 문서에서 실패하여 비교할 수 없습니다")
+        return
+    
+    baseline = results['unstructured']['seconds']
+    print(f"속도 향상 (unstructured 대비 native): {baseline / results['native']['seconds']:.2f}배")
+    
+    # 두 백엔드가 모두 성공한 문서의 추출 결과 유사도
+    pairs = [
+        (a, b) for a, b in zip(results['unstructured']['outputs'], results['native']['outputs'])
+        if a is not None and b is not None
+    ]
+    ratios = [SequenceMatcher(None, a, b).ratio() for a, b in pairs]
+    identical = sum(1 for a, b in pairs if a == b)
+    print(f"결과 일치: {identical}/{len(pairs)}, 평균 유사도: {sum(ratios) / len(ratios):.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+HTML 추출 백엔드 벤치마크
+
+저장된 웹페이지(.html, .htm) 코퍼스에 대해 lxml 백엔드와 BeautifulSoup 백엔드의
+처리 시간과 추출 결과 유사도를 비교합니다.
+
+사용법:
+    python benchmarks/html_backends.py <코퍼스_디렉토리> [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.encoding_utils import safe_decode_text
+from utils.html_extractor import extract_content_from_html
+
+BACKENDS = ['bs4', 'lxml']
+
+
+def load_corpus(corpus_dir: str) -> list:
+    """
+    디렉토리에서 저장된 HTML 페이지들을 읽어오는 함수
+    
+    Args:
+        corpus_dir (str): 코퍼스 디렉토리
+        
+    Returns:
+        list: (파일 경로, HTML 문자열) 리스트
+    """
+    pages = []
+    for root, _, files in os.walk(corpus_dir):
+        for name in sorted(files):
+            if name.lower().endswith(('.html', '.htm')):
+                path = os.path.join(root, name)
+                with open(path, 'rb') as f:
+                    pages.append((path, safe_decode_text(f.read())))
+    return pages
+
+
+def run_benchmark(pages: list, repeat: int = 3) -> dict:
+    """
+    백엔드별 처리 시간과 결과를 측정하는 함수
+    
+    Args:
+        pages (list): (파일 경로, HTML 문자열) 리스트
+        repeat (int): 반복 횟수 (최솟값 사용)
+        
+    Returns:
+        dict: {백엔드: {'seconds': 최소 소요 시간, 'outputs': 추출 결과 리스트}}
+    """
+    results = {}
+    for backend in BACKENDS:
+        best = None
+        outputs = []
+        for _ in range(repeat):
+            outputs = []
+            start = time.perf_counter()
+            for _, html_content in pages:
+                outputs.append(extract_content_from_html(html_content, backend=backend))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[backend] = {'seconds': best, 'outputs': outputs}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 추출 백엔드 벤치마크')
+    parser.add_argument('corpus_dir', help='저장된 HTML 페이지 디렉토리')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+    
+    pages = load_corpus(args.corpus_dir)
+    if not pages:
+        print(f"HTML 파일을 찾을 수 없습니다: {args.corpus_dir}")
+        return
+    
+    total_bytes = sum(len(html_content.encode('utf-8')) for _, html_content in pages)
+    print(f"페이지 수: {len(pages)}, 총 크기: {total_bytes / 1024 / 1024:.1f}MB")
+    
+    results = run_benchmark(pages, args.repeat)
+    for backend in BACKENDS:
+        seconds = results[backend]['seconds']
+        print(f"{backend:>5}: {seconds:.3f}초 ({len(pages) / seconds:.1f} 페이지/초)")
+    
+    baseline = results['bs4']['seconds']
+    print(f"속도 향상 (bs4 대비 lxml): {baseline / results['lxml']['seconds']:.2f}배")
+    
+    # 두 백엔드의 추출 결과 유사도
+    ratios = [
+        SequenceMatcher(None, a, b).ratio()
+        for a, b in zip(results['bs4']['outputs'], results['lxml']['outputs'])
+    ]
+    identical = sum(1 for a, b in zip(results['bs4']['outputs'], results['lxml']['outputs']) if a == b)
+    print(f"결과 일치: {identical}/{len(pages)}, 평균 유사도: {sum(ratios) / len(ratios):.3f}")
+
+
+if __name__ == '__main__':
+    main()
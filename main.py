@@ -1,3 +1,6 @@
-from utils import extract_text_only
+import sys
 
-text = extract_text_only("data/arxiv_paper.pdf")
\ No newline at end of file
+from utils.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 모듈 검색 경로에 추가하고, 테스트용 문서를 만드는 픽스처를 제공합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def write_pdf(path: str, pages: list) -> str:
+    """
+    페이지마다 주어진 줄들을 쓴 간단한 PDF 파일을 만드는 함수
+    
+    Args:
+        path (str): 저장할 경로
+        pages (list): 페이지별 줄 목록 (List[List[str]])
+        
+    Returns:
+        str: 저장한 경로
+    """
+    page_count = len(pages)
+    # 1: 카탈로그, 2: 페이지 트리, 3: 글꼴, 이후 페이지마다 (페이지, 내용) 객체
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{4 + index * 2} 0 R" for index in range(page_count)), page_count)).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index, lines in enumerate(pages):
+        commands = ["BT", "/F1 12 Tf", "14 TL", "72 720 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            commands.append(f"({escaped}) Tj T*")
+        commands.append("ET")
+        stream = "\n".join(commands).encode('latin-1')
+        objects.append(("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                        "/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + index * 2)).encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    
+    with open(path, 'wb') as f:
+        f.write(bytes(output))
+    return path
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """write_pdf로 임시 디렉토리에 PDF를 만드는 픽스처"""
+    def factory(pages: list, name: str = 'document.pdf') -> str:
+        return write_pdf(str(tmp_path / name), pages)
+    return factory
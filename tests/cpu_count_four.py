@@ -0,0 +1,9 @@
+"""
+워커 프로세스에서 CPU 수를 4로 보이게 하는 모듈 (WarmWorkerPool의 warm_modules로 불러옴)
+
+CPU가 하나뿐인 환경에서도 워커 안의 추출기가 프로세스 풀을 만들려는 경우를 재현합니다.
+"""
+
+import os
+
+os.cpu_count = lambda: 4
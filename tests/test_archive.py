@@ -0,0 +1,67 @@
+"""
+압축 파일 처리 테스트
+"""
+
+import zipfile
+
+import utils.archive_ingest as archive_ingest
+from utils.text_processor import batch_process_files, to_text_data_sync
+
+
+def _make_zip(path) -> str:
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('first.txt', 'first member')
+        archive.writestr('second.txt', 'second member')
+    return str(path)
+
+
+def _record_max_workers(monkeypatch) -> list:
+    calls = []
+    extract_archive = archive_ingest.extract_archive
+    
+    def recording(archive_path, max_workers=None, *args, **kwargs):
+        calls.append(max_workers)
+        return extract_archive(archive_path, 1, *args, **kwargs)
+    
+    monkeypatch.setattr(archive_ingest, 'extract_archive', recording)
+    return calls
+
+
+def test_archive_workers_option(tmp_path, monkeypatch):
+    calls = _record_max_workers(monkeypatch)
+    file_path = _make_zip(tmp_path / 'docs.zip')
+    
+    assert to_text_data_sync(file_path, archive_workers=3) == 'first member\nsecond member'
+    assert calls == [3]
+
+
+def test_batch_extracts_archives_serially(tmp_path, monkeypatch):
+    calls = _record_max_workers(monkeypatch)
+    file_path = _make_zip(tmp_path / 'docs.zip')
+    
+    results = batch_process_files([file_path])
+    
+    assert results[file_path]['text'] == 'first member\nsecond member'
+    assert calls == [1]
+
+
+def test_archive_bytes(tmp_path):
+    file_path = _make_zip(tmp_path / 'docs.zip')
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    assert to_text_data_sync(data) == 'first member\nsecond member'
+    result = to_text_data_sync(memoryview(data), include_metadata=True, name='docs.zip', archive_workers=1)
+    assert result['success'], result
+    assert result['file_type'] == 'archive'
+    assert result['text'] == 'first member\nsecond member'
+
+
+def test_nested_archive_member_is_skipped(tmp_path):
+    inner = _make_zip(tmp_path / 'inner.zip')
+    outer = tmp_path / 'outer.zip'
+    with zipfile.ZipFile(outer, 'w') as archive:
+        archive.write(inner, 'inner.zip')
+        archive.writestr('notes.txt', 'outer member')
+    
+    assert to_text_data_sync(str(outer), archive_workers=1) == 'outer member'
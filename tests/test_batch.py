@@ -0,0 +1,49 @@
+"""
+일괄 처리 테스트
+"""
+
+import threading
+from concurrent.futures import Future
+
+from utils.text_processor import _iter_batch_results, batch_process_files
+
+
+class _DelayedPool:
+    """slow에 있는 파일만 늦게 끝나는 워커 풀 대역"""
+    
+    def __init__(self, slow: set, delay: float = 0.5):
+        self.max_workers = 1
+        self.slow = slow
+        self.delay = delay
+        self.submitted = []
+    
+    def submit(self, file_path, **options):
+        future = Future()
+        result = {'file_path': file_path, 'text': file_path, 'success': True}
+        self.submitted.append(file_path)
+        if file_path in self.slow:
+            threading.Timer(self.delay, future.set_result, (result,)).start()
+        else:
+            future.set_result(result)
+        return future
+
+
+def test_pool_results_are_returned_as_they_finish():
+    file_paths = [f"file{index}.txt" for index in range(12)]
+    pool = _DelayedPool(slow={'file0.txt'})
+    
+    order = [file_path for file_path, _, _ in _iter_batch_results(file_paths, {}, pool=pool)]
+    
+    # 느린 파일을 기다리는 동안 나머지 파일을 모두 넣고 끝난 결과부터 반환
+    assert pool.submitted == file_paths
+    assert order[-1] == 'file0.txt'
+    assert sorted(order) == sorted(file_paths)
+
+
+def test_batch_results_keep_input_order():
+    file_paths = [f"file{index}.txt" for index in range(6)]
+    pool = _DelayedPool(slow={'file0.txt', 'file3.txt'}, delay=0.2)
+    
+    results = batch_process_files(file_paths, pool=pool)
+    
+    assert list(results) == file_paths
@@ -0,0 +1,28 @@
+"""
+명령줄 일괄 추출 테스트
+"""
+
+import json
+
+from utils.cli import load_latest_records, main
+
+
+def test_resume_retries_failures_and_last_record_wins(tmp_path):
+    file_path = tmp_path / 'note.txt'
+    file_path.write_text("retried text", encoding='utf-8')
+    output = tmp_path / 'results.jsonl'
+    failed = {'file_path': str(file_path), 'text': '', 'success': False, 'error': 'boom', 'error_type': 'error'}
+    output.write_text(json.dumps(failed) + '\n', encoding='utf-8')
+    
+    assert main([str(file_path), '-o', str(output), '-w', '1', '--resume']) == 0
+    
+    lines = output.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    latest = load_latest_records(str(output))
+    assert list(latest) == [str(file_path)]
+    assert latest[str(file_path)]['success']
+    assert latest[str(file_path)]['text'] == "retried text"
+    
+    # 성공으로 기록된 파일은 다시 처리하지 않음
+    assert main([str(file_path), '-o', str(output), '-w', '1', '--resume']) == 0
+    assert len(output.read_text(encoding='utf-8').splitlines()) == 2
@@ -0,0 +1,22 @@
+"""
+내용 기반 파일 타입 감지 테스트
+"""
+
+from utils.content_sniffer import sniff_bytes, sniff_file_type
+
+
+def test_pdf_signature_at_start(make_pdf):
+    file_path = make_pdf([["Hello"]])
+    
+    assert sniff_file_type(file_path) == 'pdf'
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    assert sniff_bytes(b'\xef\xbb\xbf' + data) == 'pdf'
+    assert sniff_bytes(b'\r\n  ' + data) == 'pdf'
+
+
+def test_text_mentioning_pdf_signature_is_not_pdf(tmp_path):
+    file_path = tmp_path / 'notes.txt'
+    file_path.write_text("Every PDF starts with a %PDF-1.4 header line.\n", encoding='utf-8')
+    
+    assert sniff_file_type(str(file_path)) != 'pdf'
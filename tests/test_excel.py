@@ -0,0 +1,43 @@
+"""
+Excel 처리 테스트
+"""
+
+import pandas as pd
+
+import utils.text_processor as text_processor
+from utils.text_processor import to_text_data_sync
+
+
+def _make_workbook(path, rows: int) -> str:
+    pd.DataFrame({'id': range(rows), 'name': [f"item {index}" for index in range(rows)]}).to_excel(path, index=False)
+    return str(path)
+
+
+def test_max_chars_stops_reading_early(tmp_path, monkeypatch):
+    file_path = _make_workbook(tmp_path / 'large.xlsx', 20000)
+    read_rows = []
+    read_excel = pd.read_excel
+    
+    def recording(*args, **kwargs):
+        read_rows.append(kwargs.get('nrows'))
+        return read_excel(*args, **kwargs)
+    
+    monkeypatch.setattr(text_processor.pd, 'read_excel', recording)
+    result = to_text_data_sync(file_path, include_metadata=True, max_chars=500)
+    
+    assert result['success'], result
+    assert len(result['text']) == 500
+    assert result['truncated'] is True
+    assert read_rows == [text_processor.EXCEL_INITIAL_ROWS]
+
+
+def test_budget_keeps_small_workbook_complete(tmp_path):
+    file_path = _make_workbook(tmp_path / 'small.xlsx', 10)
+    
+    full = to_text_data_sync(file_path)
+    result = to_text_data_sync(file_path, include_metadata=True, max_chars=100000)
+    
+    assert result['text'] == full
+    assert result['truncated'] is False
+    with open(file_path, 'rb') as f:
+        assert to_text_data_sync(f.read(), max_chars=100000) == full
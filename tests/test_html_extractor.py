@@ -0,0 +1,67 @@
+"""
+HTML 본문 추출 테스트
+"""
+
+import pytest
+
+import utils.html_extractor as html_extractor
+from utils.html_extractor import DEFAULT_MAX_FETCH_BYTES, extract_content_from_html, extract_html_content
+from utils.html_templates import DomainTemplateCache
+
+
+def _article_page(number: int) -> str:
+    body = " ".join(f"Sentence {index} of article {number} has enough words to count." for index in range(200))
+    return (f"<html><body><nav><a href='/'>Home</a></nav>"
+            f"<div id='content'><article><p>{body}</p></article></div>"
+            f"<footer>Copyright</footer></body></html>")
+
+
+def test_template_hit_respects_max_length():
+    cache = DomainTemplateCache(min_consistent_pages=2)
+    for number in range(2):
+        extract_content_from_html(_article_page(number), url=f"https://example.com/articles/{number}",
+                                  template_cache=cache)
+    assert cache.lookup('example.com')
+    
+    text = extract_content_from_html(_article_page(2), max_length=500,
+                                     url="https://example.com/articles/2", template_cache=cache)
+    assert 0 < len(text) <= 500
+    assert text.startswith("Sentence 0 of article 2")
+
+
+def test_stream_rejects_other_backends():
+    with pytest.raises(ValueError):
+        extract_html_content("https://example.com/", backend='bs4', stream=True)
+
+
+def test_stream_uses_default_max_bytes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(html_extractor, '_extract_html_streaming',
+                        lambda session, url, encoding, max_bytes, *args, **kwargs: calls.append(max_bytes) or "")
+    
+    extract_html_content("https://example.com/", stream=True)
+    extract_html_content("https://example.com/", backend='lxml', stream=True, max_bytes=1024)
+    
+    assert calls == [DEFAULT_MAX_FETCH_BYTES, 1024]
+
+
+def test_template_ignores_matches_inside_pruned_blocks():
+    def page(number: int, decoy: bool) -> str:
+        body = " ".join(f"Main story {number} sentence {index} carries the real content." for index in range(60))
+        aside = ""
+        if decoy:
+            related = " ".join(f"Related teaser {index} links to another story elsewhere." for index in range(40))
+            aside = f"<aside><article><p>{related}</p></article></aside>"
+        return f"<html><body>{aside}<article><p>{body}</p></article></body></html>"
+    
+    for backend in ('lxml', 'bs4'):
+        cache = DomainTemplateCache(min_consistent_pages=2)
+        for number in range(2):
+            extract_content_from_html(page(number, decoy=False), backend=backend,
+                                      url=f"https://news.example.com/{number}", template_cache=cache)
+        assert cache.lookup('news.example.com') == 'article'
+        
+        text = extract_content_from_html(page(2, decoy=True), backend=backend,
+                                         url="https://news.example.com/2", template_cache=cache)
+        assert text.startswith("Main story 2"), backend
+        assert "Related teaser" not in text
@@ -0,0 +1,45 @@
+"""
+메트릭 기록 테스트
+"""
+
+from utils.metrics import ERRORS, FILES_PROCESSED, OUTPUT_BYTES
+from utils.quarantine import Quarantine
+from utils.text_processor import batch_process_files, to_text_data_sync
+from utils.worker_pool import WarmWorkerPool
+
+
+def test_output_bytes_are_utf8_bytes(tmp_path):
+    file_path = tmp_path / 'note.txt'
+    file_path.write_text("한글 text", encoding='utf-8')
+    before = OUTPUT_BYTES.value('txt')
+    
+    text = to_text_data_sync(str(file_path))
+    
+    assert OUTPUT_BYTES.value('txt') - before == len(text.encode('utf-8'))
+
+
+def test_timeout_in_pool_is_counted(make_pdf):
+    lines = [f"Line {index} with some words to parse" for index in range(50)]
+    file_path = make_pdf([lines] * 2000, 'slow.pdf')
+    before = ERRORS.value('pdf', 'timeout')
+    failed_before = FILES_PROCESSED.value('pdf', 'failed')
+    
+    with WarmWorkerPool(max_workers=1, task_timeout=0.2) as pool:
+        results = batch_process_files([file_path], pool=pool)
+    
+    assert results[file_path]['error_type'] == 'timeout'
+    assert ERRORS.value('pdf', 'timeout') - before == 1
+    assert FILES_PROCESSED.value('pdf', 'failed') - failed_before == 1
+
+
+def test_quarantined_file_is_counted(tmp_path):
+    file_path = tmp_path / 'bad.txt'
+    file_path.write_text("text", encoding='utf-8')
+    quarantine = Quarantine(str(tmp_path / 'quarantine.jsonl'))
+    quarantine.add(str(file_path), 'timeout', "처리 시간 제한을 넘었습니다")
+    before = ERRORS.value('txt', 'quarantined')
+    
+    results = batch_process_files([str(file_path)], quarantine=quarantine)
+    
+    assert results[str(file_path)]['error_type'] == 'quarantined'
+    assert ERRORS.value('txt', 'quarantined') - before == 1
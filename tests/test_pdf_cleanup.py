@@ -0,0 +1,67 @@
+"""
+PDF 후처리(반복 머리글/바닥글 제거) 테스트
+"""
+
+from utils.pdf_cleanup import clean_pdf_pages
+from utils.text_processor import smart_batch_processing
+
+
+def _invoice_pages(count: int) -> list:
+    return [
+        [
+            "ACME Corporation",
+            f"Invoice No. {1000 + number}",
+            f"Amount due: {120 + number}.50 USD",
+            f"Due date: 2024-{number % 12 + 1:02d}-{number % 28 + 1:02d}",
+            f"Page {number + 1} of {count}",
+        ]
+        for number in range(count)
+    ]
+
+
+def test_numbers_in_body_lines_are_kept():
+    pages = _invoice_pages(8)
+    cleaned = dict(clean_pdf_pages((number, '\n'.join(lines)) for number, lines in enumerate(pages)))
+    
+    assert len(cleaned) == 8
+    for number, text in cleaned.items():
+        assert f"Invoice No. {1000 + number}" in text
+        assert f"Amount due: {120 + number}.50 USD" in text
+        assert "Due date: 2024-" in text
+        # 모든 페이지에 반복되는 머리글과 쪽 번호는 제거
+        assert "ACME Corporation" not in text
+        assert "Page " not in text
+
+
+def test_short_pages_are_never_emptied():
+    # 머리글/바닥글 후보 줄이 페이지의 모든 줄인 짧은 페이지
+    pages = [(number, f"Report\nSection {number}\nBody {number}\nPage {number + 1}") for number in range(300)]
+    cleaned = list(clean_pdf_pages(pages))
+    
+    assert len(cleaned) == 300
+    for number, text in cleaned:
+        assert f"Section {number}\nBody {number}" in text
+
+
+def test_fully_repeated_pages_are_kept():
+    pages = [(number, "Confidential\nDraft") for number in range(10)]
+    cleaned = list(clean_pdf_pages(pages))
+    
+    assert [text for _, text in cleaned] == ["Confidential\nDraft"] * 10
+
+
+def test_empty_pages_are_dropped():
+    pages = [(0, "First page"), (1, "\f"), (2, "  \n "), (3, "Last page")]
+    
+    assert list(clean_pdf_pages(pages)) == [(0, "First page"), (3, "Last page")]
+
+
+def test_invoice_pdf_keeps_numbers(make_pdf):
+    file_path = make_pdf(_invoice_pages(6), 'invoice.pdf')
+    result = smart_batch_processing([file_path])['results'][file_path]
+    
+    assert result['success'], result
+    for number in range(6):
+        assert f"Invoice No. {1000 + number}" in result['text']
+        assert f"Amount due: {120 + number}.50 USD" in result['text']
+    assert "ACME Corporation" not in result['text']
@@ -0,0 +1,63 @@
+"""
+추출 서비스 테스트
+"""
+
+from concurrent.futures import Future
+
+from utils.service import ExtractionService
+
+
+class _ManualPool:
+    """Future를 직접 완료시키는 워커 풀 대역"""
+    
+    def __init__(self):
+        self.futures = []
+    
+    def submit(self, file_path, **options):
+        future = Future()
+        self.futures.append(future)
+        return future
+    
+    def stats(self):
+        return {}
+
+
+def test_cancelled_job_is_marked_failed():
+    pool = _ManualPool()
+    service = ExtractionService(port=0, pool=pool)
+    try:
+        cancelled_id, done_id = service.submit(['a.txt', 'b.txt'], {})
+        
+        pool.futures[0].cancel()
+        pool.futures[1].set_result({'success': True, 'text': 'b'})
+        
+        cancelled = service.get_job(cancelled_id)
+        assert cancelled['status'] == 'failed'
+        assert cancelled['error']
+        assert service.get_job(done_id)['status'] == 'done'
+        assert service.health()['outstanding'] == 0
+    finally:
+        service.shutdown()
+
+
+def test_exception_without_message_is_marked_failed():
+    pool = _ManualPool()
+    service = ExtractionService(port=0, pool=pool)
+    try:
+        job_id, = service.submit(['a.txt'], {})
+        pool.futures[0].set_exception(RuntimeError())
+        
+        job = service.get_job(job_id)
+        assert job['status'] == 'failed'
+        assert job['error'] == 'RuntimeError'
+        assert service.health()['outstanding'] == 0
+    finally:
+        service.shutdown()
+
+
+def test_shutdown_with_and_without_start():
+    with ExtractionService(port=0, pool=_ManualPool()):
+        pass
+    
+    service = ExtractionService(port=0, pool=_ManualPool()).start()
+    service.shutdown()
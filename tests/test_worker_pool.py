@@ -0,0 +1,39 @@
+"""
+WarmWorkerPool 테스트
+"""
+
+import multiprocessing
+
+from utils.pdf_parallel import PARALLEL_PDF_MIN_PAGES, resolve_max_workers
+from utils.worker_pool import WarmWorkerPool
+
+
+def _report_max_workers(queue) -> None:
+    queue.put(resolve_max_workers(4))
+
+
+def test_resolve_max_workers_in_daemon_process():
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_report_max_workers, args=(queue,), daemon=True)
+    process.start()
+    try:
+        assert queue.get(timeout=60) == 1
+    finally:
+        process.join()
+    assert resolve_max_workers(4) == 4
+
+
+def test_large_pdf_in_pool_worker(make_pdf):
+    # 병렬 추출 기준을 넘는 PDF를 CPU가 4개인 것처럼 보이는 워커에서 처리
+    page_count = 300
+    assert page_count >= PARALLEL_PDF_MIN_PAGES
+    file_path = make_pdf([[f"Page body {number}"] for number in range(page_count)], 'large.pdf')
+    
+    with WarmWorkerPool(max_workers=1, warm_modules=['cpu_count_four', 'utils.text_processor'],
+                        task_timeout=300) as pool:
+        result = pool.submit(file_path, include_metadata=True).result()
+    
+    assert result['success'], result
+    assert 'Page body 0' in result['text']
+    assert 'Page body 299' in result['text']
@@ -20,9 +20,23 @@ from .text_processor import (
     smart_batch_processing,
     get_file_info
 )
-from .file_detector import extract_file_type
-from .html_extractor import extract_html_content
+from .file_detector import extract_file_type, detect_file_types
+from .content_sniffer import sniff_file_type, sniff_bytes
+from .html_extractor import extract_html_content, extract_content_from_html
 from .encoding_utils import detect_and_decode, fix_encoding_issues
+from .bulk_html import bulk_extract_html, iter_html_records
+from .archive_ingest import extract_archive
+from .worker_pool import WarmWorkerPool
+from .quarantine import Quarantine
+from .scheduler import BatchScheduler, CostModel
+from .dedup import find_duplicates
+from .near_dedup import NearDuplicateIndex, find_near_duplicates
+from .text_stats import TextStats
+from .service import ExtractionService, run_service
+from .sinks import JsonlSink, GzipJsonlSink, ParquetSink, CallbackSink, open_sink
+from .metrics import METRICS, MetricsRegistry
+from .profiling import DocumentProfiler, read_profile_index
+from .html_templates import DomainTemplateCache
 
 # 버전 정보
 __version__ = "1.0.0"
@@ -40,11 +54,44 @@ __all__ = [
     'batch_process_files',
     'batch_process_with_progress',
     'smart_batch_processing',
+    'bulk_extract_html',
+    'iter_html_records',
+    'extract_archive',
+    'WarmWorkerPool',
+    'Quarantine',
+    'BatchScheduler',
+    'CostModel',
+    'find_duplicates',
+    'NearDuplicateIndex',
+    'find_near_duplicates',
+    
+    # 결과 저장소
+    'JsonlSink',
+    'GzipJsonlSink',
+    'ParquetSink',
+    'CallbackSink',
+    'open_sink',
+    
+    # 추출 서비스
+    'ExtractionService',
+    'run_service',
+    
+    # 메트릭 및 프로파일링
+    'METRICS',
+    'MetricsRegistry',
+    'DocumentProfiler',
+    'read_profile_index',
     
     # 유틸리티 함수들
     'extract_file_type',
+    'detect_file_types',
+    'sniff_file_type',
+    'sniff_bytes',
     'extract_html_content',
+    'extract_content_from_html',
+    'DomainTemplateCache',
     'detect_and_decode',
     'fix_encoding_issues',
+    'TextStats',
     'get_file_info'
 ]
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+압축 파일 처리 모듈
+
+ZIP/TAR 압축 파일을 디스크에 풀지 않고 멤버를 하나씩 메모리로 읽어
+내용으로 파일 타입을 감지한 뒤 프로세스 풀에서 텍스트를 추출합니다.
+경로가 필요한 로더(Word, PowerPoint)만 멤버 하나 크기의 임시 파일을 사용합니다.
+"""
+
+import os
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterator, Optional, Tuple
+
+from .file_detector import detect_bytes_type
+from .pdf_parallel import resolve_max_workers
+from .text_processor import _process_bytes_sync, _create_metadata_response, create_error_response
+
+
+def extract_archive(archive_path: str, max_workers: Optional[int] = None,
+                    max_member_bytes: int = 200 * 1024 * 1024) -> Iterator[dict]:
+    """
+    압축 파일 안의 문서들에서 텍스트를 추출하는 함수
+    
+    결과는 처리가 끝나는 순서대로 하나씩 반환되며, 한 번에 풀에 넣는 멤버 수를
+    제한하므로 압축 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        archive_path (str): ZIP 또는 TAR(.tar, .tar.gz 등) 파일 경로
+        max_workers (int, optional): 프로세스 수. 기본값은 CPU 수 (1이거나 데몬 프로세스 안이면 현재 프로세스에서 처리)
+        max_member_bytes (int): 처리할 최대 멤버 크기 (초과하는 멤버는 오류 결과로 반환)
+        
+    Yields:
+        dict: 멤버별 결과 (_create_metadata_response 형식에 'archive_path', 'member_name',
+              'member_index' 추가)
+              
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: ZIP/TAR 파일이 아닌 경우
+    """
+    max_workers = resolve_max_workers(max_workers)
+    members = iter_archive_members(archive_path, max_member_bytes)
+    
+    if max_workers == 1:
+        for index, name, data in members:
+            yield _extract_archive_member(archive_path, index, name, data)
+        return
+    
+    max_pending = max_workers * PENDING_TASKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for index, name, data in members:
+            pending.add(executor.submit(_extract_archive_member, archive_path, index, name, data))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def iter_archive_members(archive_path: str,
+                         max_member_bytes: int = 200 * 1024 * 1024) -> Iterator[Tuple[int, str, Optional[bytes]]]:
+    """
+    압축 파일의 일반 파일 멤버를 하나씩 메모리로 읽어오는 함수
+    
+    디렉토리, 링크, 숨김 파일(__MACOSX, .DS_Store 등)은 건너뜁니다.
+    
+    Args:
+        archive_path (str): ZIP 또는 TAR 파일 경로
+        max_member_bytes (int): 읽을 최대 멤버 크기 (초과하면 내용 대신 None 반환)
+        
+    Yields:
+        Tuple[int, str, Optional[bytes]]: (멤버 순서, 멤버 이름, 내용)
+        
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: ZIP/TAR 파일이 아닌 경우
+    """
+    if not os.path.exists(archive_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {archive_path}")
+    
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            index = 0
+            for info in archive.infolist():
+                if info.is_dir() or _is_hidden_member(info.filename):
+                    continue
+                # 압축 해제 전 크기로 확인 (압축 폭탄 방지)
+                data = archive.read(info) if info.file_size <= max_member_bytes else None
+                yield index, info.filename, data
+                index += 1
+        return
+    
+    try:
+        archive = tarfile.open(archive_path, mode='r:*')
+    except tarfile.TarError:
+        raise ValueError(f"ZIP/TAR 압축 파일이 아닙니다: {archive_path}")
+    
+    with archive:
+        index = 0
+        # 압축된 TAR도 처음부터 순서대로만 읽도록 멤버를 하나씩 가져옴
+        for info in archive:
+            if not info.isfile() or _is_hidden_member(info.name):
+                continue
+            data = None
+            if info.size <= max_member_bytes:
+                member_file = archive.extractfile(info)
+                data = member_file.read() if member_file is not None else None
+            yield index, info.name, data
+            index += 1
+
+
+def _extract_archive_member(archive_path: str, index: int, name: str, data: Optional[bytes]) -> dict:
+    """
+    멤버 하나의 텍스트를 추출하는 함수 (워커 프로세스에서 실행)
+    
+    Args:
+        archive_path (str): 압축 파일 경로
+        index (int): 멤버 순서
+        name (str): 멤버 이름
+        data (bytes): 멤버 내용 (너무 커서 읽지 않았으면 None)
+        
+    Returns:
+        dict: 추출 결과
+    """
+    member_path = f"{archive_path}{MEMBER_SEPARATOR}{name}"
+    try:
+        if data is None:
+            raise ValueError(f"최대 크기를 넘는 멤버입니다: {name}")
+        
+        file_type = detect_bytes_type(data, name)
+        if file_type == 'archive':
+            # 압축 파일을 겹쳐 만든 압축 폭탄을 막기 위해 풀지 않음
+            raise ValueError(f"압축 파일 안의 압축 파일은 지원하지 않습니다: {name}")
+        text = _process_bytes_sync(data, file_type, name)
+        result = _create_metadata_response(member_path, text, file_type)
+    except Exception as e:
+        result = create_error_response(member_path, str(e))
+    
+    result['archive_path'] = archive_path
+    result['member_name'] = name
+    result['member_index'] = index
+    return result
+
+
+def _is_hidden_member(name: str) -> bool:
+    """운영체제가 만든 숨김 파일/디렉토리 멤버인지 확인"""
+    parts = name.replace('\\', '/').split('/')
+    return any(
+        (part.startswith('.') and part not in ('.', '..')) or part == '__MACOSX'
+        for part in parts
+    )
+
+
+# 상수들
+MEMBER_SEPARATOR = '!'
+PENDING_TASKS_PER_WORKER = 4
@@ -0,0 +1,127 @@
+"""
+추출 예산 모듈
+
+분류나 미리보기처럼 문서 앞부분만 필요한 경우를 위해 페이지 범위, 최대 글자 수,
+시간 예산을 하나의 객체로 묶어 각 추출기에 전달합니다. 추출기는 페이지/요소/행을
+하나씩 처리하면서 예산을 확인하고, 예산이 다 되면 나머지를 읽지 않고 중단합니다.
+"""
+
+import time
+from typing import Iterable, List, Optional, Union
+
+
+class ExtractionBudget:
+    """
+    추출 예산 (페이지 범위, 최대 글자 수, 시간 제한)
+    
+    Args:
+        pages (int or Iterable[int], optional): 정수 N이면 앞쪽 N페이지, 목록이면 해당 페이지들
+            (페이지/슬라이드 번호는 0부터 시작)
+        max_chars (int, optional): 최대 글자 수
+        time_budget (float, optional): 추출에 쓸 최대 시간(초)
+    """
+    
+    def __init__(self, pages: Union[int, Iterable[int], None] = None,
+                 max_chars: Optional[int] = None, time_budget: Optional[float] = None):
+        self.pages = pages if pages is None or isinstance(pages, int) else frozenset(pages)
+        self.max_chars = max_chars
+        self.time_budget = time_budget
+        self.deadline = time.monotonic() + time_budget if time_budget is not None else None
+        self.char_count = 0
+        # 예산 때문에 문서 일부를 읽지 않았는지 여부
+        self.truncated = False
+    
+    @property
+    def stops_early(self) -> bool:
+        """글자 수나 시간 제한이 있어 순차적으로 처리하면서 중단해야 하는지 여부"""
+        return self.max_chars is not None or self.deadline is not None
+    
+    def select_pages(self, page_count: int) -> List[int]:
+        """
+        전체 페이지 중 추출할 페이지 번호 목록
+        
+        Args:
+            page_count (int): 전체 페이지 수
+            
+        Returns:
+            List[int]: 추출할 페이지 번호 (오름차순)
+        """
+        if self.pages is None:
+            selected = list(range(page_count))
+        elif isinstance(self.pages, int):
+            selected = list(range(min(self.pages, page_count)))
+        else:
+            selected = sorted(page for page in self.pages if 0 <= page < page_count)
+        
+        if len(selected) < page_count:
+            self.truncated = True
+        return selected
+    
+    def accepts_page(self, page_number: Optional[int]) -> bool:
+        """
+        페이지 번호를 알 수 있는 요소가 페이지 범위 안에 있는지 확인
+        
+        Args:
+            page_number (int, optional): 0부터 시작하는 페이지 번호 (모르면 None)
+            
+        Returns:
+            bool: 추출해야 하면 True
+        """
+        if self.pages is None or page_number is None:
+            return True
+        if isinstance(self.pages, int):
+            accepted = page_number < self.pages
+        else:
+            accepted = page_number in self.pages
+        if not accepted:
+            self.truncated = True
+        return accepted
+    
+    def should_stop(self) -> bool:
+        """
+        다음 단위(페이지, 요소, 행)를 처리하기 전에 예산이 다 되었는지 확인
+        
+        처리할 내용이 남아 있을 때만 호출하므로, True를 반환하면 결과가 잘린 것으로 기록합니다.
+        
+        Returns:
+            bool: 중단해야 하면 True
+        """
+        exhausted = (
+            (self.max_chars is not None and self.char_count >= self.max_chars)
+            or (self.deadline is not None and time.monotonic() >= self.deadline)
+        )
+        if exhausted:
+            self.truncated = True
+        return exhausted
+    
+    def consume(self, text: str, separator_length: int = 1) -> None:
+        """처리한 텍스트 길이를 예산에 반영 (구분자 길이 포함)"""
+        self.char_count += len(text) + separator_length
+    
+    def apply(self, text: str) -> str:
+        """
+        최종 텍스트를 최대 글자 수에 맞게 자름
+        
+        Args:
+            text (str): 추출된 텍스트
+            
+        Returns:
+            str: 최대 글자 수 이하의 텍스트
+        """
+        if self.max_chars is not None and len(text) > self.max_chars:
+            self.truncated = True
+            return text[:self.max_chars]
+        return text
+
+
+def make_budget(pages: Union[int, Iterable[int], None] = None, max_chars: Optional[int] = None,
+                time_budget: Optional[float] = None) -> Optional[ExtractionBudget]:
+    """
+    옵션이 하나라도 지정되었을 때만 추출 예산을 만드는 함수
+    
+    Returns:
+        ExtractionBudget: 추출 예산. 옵션이 모두 None이면 None
+    """
+    if pages is None and max_chars is None and time_budget is None:
+        return None
+    return ExtractionBudget(pages, max_chars, time_budget)
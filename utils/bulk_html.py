@@ -0,0 +1,278 @@
+"""
+오프라인 HTML 일괄 추출 모듈
+
+크롤링 덤프(.html 파일 디렉토리, WARC 아카이브)에서 HTML 레코드를 스트림으로 읽고
+프로세스 풀에서 본문 추출(readability 알고리즘)을 수행합니다. 네트워크는 사용하지 않습니다.
+"""
+
+import os
+import gzip
+import zlib
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterable, Iterator, Optional, Union
+
+from .encoding_utils import decode_html_bytes
+from .html_extractor import extract_content_from_html
+from .text_processor import _create_metadata_response, create_error_response
+
+
+def bulk_extract_html(sources: Union[str, Iterable[str]], max_workers: Optional[int] = None,
+                      backend: Optional[str] = None) -> Iterator[dict]:
+    """
+    저장된 HTML 파일과 WARC 아카이브에서 본문을 일괄 추출하는 함수
+    
+    결과는 처리가 끝나는 순서대로 하나씩 반환되며, 한 번에 풀에 넣는 레코드 수를
+    제한하므로 아카이브 크기와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        sources (str or Iterable[str]): 파일 또는 디렉토리 경로 (하나 또는 여러 개)
+        max_workers (int, optional): 프로세스 수. 기본값은 CPU 수
+        backend (str, optional): HTML 추출 백엔드 ('lxml' 또는 'bs4')
+        
+    Yields:
+        dict: 레코드별 메타데이터 결과 (_create_metadata_response 형식에 'url' 추가)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_workers * PENDING_TASKS_PER_WORKER
+    records = iter_html_records(sources)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for record in records:
+            pending.add(executor.submit(_extract_html_record, record, backend))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def iter_html_records(sources: Union[str, Iterable[str]]) -> Iterator[dict]:
+    """
+    파일/디렉토리에서 HTML 레코드를 하나씩 읽어오는 함수
+    
+    Args:
+        sources (str or Iterable[str]): 파일 또는 디렉토리 경로 (하나 또는 여러 개)
+        
+    Yields:
+        dict: {'record_id', 'url', 'content_type', 'content'} 형태의 레코드
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    if _is_warc_path(path) or path.lower().endswith(HTML_EXTENSIONS):
+                        yield from _iter_file_records(path)
+        elif os.path.exists(source):
+            yield from _iter_file_records(source)
+        else:
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {source}")
+
+
+def iter_warc_records(warc_path: str, max_record_bytes: int = 20 * 1024 * 1024) -> Iterator[dict]:
+    """
+    WARC 아카이브에서 HTML 응답 레코드만 스트림으로 읽어오는 함수
+    
+    gzip으로 압축된 WARC(.warc.gz)도 지원하며, HTML이 아니거나 너무 큰 레코드는
+    본문을 읽지 않고 건너뜁니다.
+    
+    Args:
+        warc_path (str): WARC 파일 경로
+        max_record_bytes (int): 처리할 최대 레코드 크기
+        
+    Yields:
+        dict: {'record_id', 'url', 'content_type', 'content'} 형태의 레코드
+    """
+    with open(warc_path, 'rb') as raw:
+        is_gzip = raw.read(2) == b'\x1f\x8b'
+    opener = gzip.open if is_gzip else open
+    
+    with opener(warc_path, 'rb') as f:
+        while True:
+            offset = f.tell()
+            headers = _read_warc_headers(f)
+            if headers is None:
+                break
+            
+            length = int(headers.get('content-length', '0'))
+            record_type = headers.get('warc-type', '')
+            block_type = headers.get('content-type', '').lower()
+            
+            wanted = (
+                (record_type == 'response' and block_type.startswith('application/http'))
+                or (record_type == 'resource' and _is_html_type(block_type))
+            )
+            if not wanted or length > max_record_bytes:
+                _skip_bytes(f, length)
+                continue
+            
+            block = f.read(length)
+            if record_type == 'response':
+                content_type, content = _parse_http_payload(block)
+            else:
+                content_type, content = block_type, block
+            
+            if not _is_html_type(content_type) or not content:
+                continue
+            
+            yield {
+                'record_id': f"{warc_path}#{offset}",
+                'url': headers.get('warc-target-uri'),
+                'content_type': content_type,
+                'content': content
+            }
+
+
+def _iter_file_records(path: str) -> Iterator[dict]:
+    """파일 하나에서 HTML 레코드를 읽어오는 함수 (WARC 또는 HTML 파일)"""
+    if _is_warc_path(path):
+        yield from iter_warc_records(path)
+        return
+    
+    with open(path, 'rb') as f:
+        content = f.read()
+    yield {
+        'record_id': path,
+        'url': None,
+        'content_type': '',
+        'content': content
+    }
+
+
+def _extract_html_record(record: dict, backend: Optional[str] = None) -> dict:
+    """
+    레코드 하나의 본문을 추출하는 함수 (워커 프로세스에서 실행)
+    
+    Args:
+        record (dict): iter_html_records가 반환한 레코드
+        backend (str, optional): HTML 추출 백엔드
+        
+    Returns:
+        dict: 추출 결과
+    """
+    try:
+        html_content = decode_html_bytes(record['content'], record['content_type'])
+        text = extract_content_from_html(html_content, backend=backend)
+        result = _create_metadata_response(record['record_id'], text, 'html')
+    except Exception as e:
+        result = create_error_response(record['record_id'], str(e))
+    
+    result['url'] = record['url']
+    return result
+
+
+def _read_warc_headers(f) -> Optional[dict]:
+    """
+    WARC 레코드 헤더를 읽는 함수
+    
+    Returns:
+        dict: 소문자 키의 헤더 딕셔너리. 파일 끝이면 None
+    """
+    # 레코드 사이의 빈 줄 건너뛰기
+    line = f.readline()
+    while line in (b'\r\n', b'\n'):
+        line = f.readline()
+    if not line:
+        return None
+    if not line.startswith(b'WARC/'):
+        raise ValueError(f"올바른 WARC 레코드가 아닙니다: {line[:50]!r}")
+    
+    headers = {}
+    for line in iter(f.readline, b''):
+        line = line.rstrip(b'\r\n')
+        if not line:
+            break
+        name, _, value = line.partition(b':')
+        headers[name.strip().lower().decode('latin-1')] = value.strip().decode('utf-8', errors='ignore')
+    return headers
+
+
+def _parse_http_payload(block: bytes) -> tuple:
+    """
+    WARC response 블록에서 HTTP 헤더를 분리하고 본문을 반환하는 함수
+    
+    Returns:
+        tuple: (Content-Type, 본문 바이트)
+    """
+    header_end = block.find(b'\r\n\r\n')
+    separator_length = 4
+    if header_end < 0:
+        header_end = block.find(b'\n\n')
+        separator_length = 2
+    if header_end < 0:
+        return '', b''
+    
+    headers = {}
+    for line in block[:header_end].split(b'\n')[1:]:
+        name, _, value = line.partition(b':')
+        headers[name.strip().lower().decode('latin-1')] = value.strip().decode('latin-1')
+    
+    body = block[header_end + separator_length:]
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        body = _decode_chunked(body)
+    
+    content_encoding = headers.get('content-encoding', '').lower()
+    try:
+        if content_encoding in ('gzip', 'x-gzip'):
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif content_encoding == 'deflate':
+            body = zlib.decompress(body)
+    except zlib.error:
+        # 이미 압축이 풀린 채로 저장된 경우
+        pass
+    
+    return headers.get('content-type', ''), body
+
+
+def _decode_chunked(body: bytes) -> bytes:
+    """HTTP chunked 전송 인코딩을 해제 (잘못된 형식이면 원본 반환)"""
+    chunks = []
+    position = 0
+    try:
+        while position < len(body):
+            line_end = body.index(b'\r\n', position)
+            size = int(body[position:line_end].split(b';')[0], 16)
+            if size == 0:
+                break
+            start = line_end + 2
+            chunks.append(body[start:start + size])
+            position = start + size + 2
+    except ValueError:
+        return body
+    return b''.join(chunks)
+
+
+def _skip_bytes(f, length: int) -> None:
+    """본문을 메모리에 올리지 않고 length 바이트만큼 건너뜀"""
+    remaining = length
+    while remaining > 0:
+        data = f.read(min(remaining, 1024 * 1024))
+        if not data:
+            break
+        remaining -= len(data)
+
+
+def _is_warc_path(path: str) -> bool:
+    """WARC 파일 경로인지 확인"""
+    return path.lower().endswith(WARC_EXTENSIONS)
+
+
+def _is_html_type(content_type: str) -> bool:
+    """Content-Type이 HTML인지 확인 (없으면 HTML로 간주)"""
+    mime_type = content_type.split(';')[0].strip().lower()
+    return not mime_type or mime_type in ('text/html', 'application/xhtml+xml')
+
+
+# 상수들
+HTML_EXTENSIONS = ('.html', '.htm')
+WARC_EXTENSIONS = ('.warc', '.warc.gz')
+PENDING_TASKS_PER_WORKER = 4
@@ -0,0 +1,363 @@
+"""
+명령줄 일괄 추출 모듈
+
+파일 경로, glob 패턴, 디렉토리를 받아 여러 워커로 텍스트를 추출하고, 파일 하나가 끝날
+때마다 메타데이터 결과를 JSONL 한 줄로 기록합니다. 중단된 출력 파일에서 이어서 처리할 수
+있고(--resume), 끝나면 처리량 요약을 출력합니다. 이어서 처리할 때 이전에 실패한 파일은 다시
+시도해 새 줄을 추가하므로 같은 file_path가 여러 번 나올 수 있으며, 이때는 마지막 줄이 최종
+결과입니다 (load_latest_records 참고). 파일당 처리 시간과 워커 메모리를 제한하면
+제한을 넘은 파일은 격리 목록(--quarantine)에 기록되어 다음 실행부터 다시 시도하지 않습니다.
+--schedule을 주면 예상 처리 시간이 긴 파일부터 처리하고, 입력 순서 대비 makespan을 출력합니다.
+
+사용법:
+    python main.py data/ "docs/**/*.pdf" -o results.jsonl --workers 4 --resume
+    python main.py data/ -o results.jsonl --timeout 120 --memory-limit-mb 2048 --quarantine quarantine.jsonl
+    python main.py data/ -o results.jsonl --profile-dir profiles/ --profile-min-seconds 10
+    python main.py data/ -o results.jsonl --workers 8 --cost-model cost_model.json --dedup --near-dedup 0.8
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .file_detector import detect_file_types, is_url
+from .profiling import DocumentProfiler
+from .dedup import duplicate_result, split_duplicates
+from .near_dedup import NearDuplicateIndex, mark_near_duplicate
+from .quarantine import Quarantine
+from .scheduler import BatchScheduler, CostModel
+from .text_processor import (
+    to_text_data_sync, create_error_response, classify_error, quarantined_error, update_quarantine
+)
+from .worker_pool import WarmWorkerPool
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령줄 진입점
+    
+    Args:
+        argv (List[str], optional): 명령줄 인자 (기본값은 sys.argv[1:])
+        
+    Returns:
+        int: 종료 코드 (실패한 파일이 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+    options = {
+        'max_chars': args.max_chars,
+        'time_budget': args.time_budget,
+        'office_backend': args.office_backend,
+    }
+    if args.profile_dir:
+        options['profiler'] = DocumentProfiler(args.profile_dir, min_seconds=args.profile_min_seconds,
+                                               min_memory_mb=args.profile_min_memory_mb)
+    limits = {
+        'timeout': args.timeout,
+        'memory_limit_mb': args.memory_limit_mb,
+        'quarantine': Quarantine(args.quarantine) if args.quarantine else None,
+    }
+    scheduler = None
+    if args.schedule or args.cost_model:
+        scheduler = BatchScheduler(CostModel(args.cost_model))
+    near_duplicates = NearDuplicateIndex(args.near_dedup) if args.near_dedup else None
+    
+    file_types = expand_inputs(args.inputs, recursive=not args.no_recursive)
+    if not file_types:
+        print("처리할 파일이 없습니다", file=sys.stderr)
+        return 1
+    done = load_completed_paths(args.output) if args.resume else set()
+    tasks = [(path, file_type) for path, file_type in file_types.items() if path not in done]
+    
+    mode = 'a' if args.resume else 'w'
+    output = sys.stdout if args.output == '-' else open(args.output, mode, encoding='utf-8')
+    summary = {'files': 0, 'success': 0, 'failed': 0, 'skipped': len(file_types) - len(tasks),
+               'input_bytes': 0, 'chars': 0}
+    start = time.perf_counter()
+    try:
+        for record in run_extraction(tasks, args.workers, options, scheduler=scheduler, dedup=args.dedup, **limits):
+            if near_duplicates is not None:
+                mark_near_duplicate(near_duplicates, record)
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+            output.flush()
+            _update_summary(summary, record)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    print_summary(summary, time.perf_counter() - start)
+    if scheduler is not None and scheduler.last_report is not None:
+        print_schedule_report(scheduler.last_report)
+    return 1 if summary['failed'] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서 생성"""
+    parser = argparse.ArgumentParser(description='파일에서 텍스트를 추출하여 JSONL로 저장합니다')
+    parser.add_argument('inputs', nargs='+', help='파일 경로, glob 패턴(**/*.pdf) 또는 디렉토리')
+    parser.add_argument('-o', '--output', default='-', help='JSONL 출력 파일 (기본값: 표준 출력)')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='워커 프로세스 수 (1이면 현재 프로세스에서 처리)')
+    parser.add_argument('--resume', action='store_true',
+                        help='출력 파일에 이미 성공으로 기록된 파일은 건너뛰고 이어서 기록 '
+                             '(실패한 파일은 다시 시도해 새 줄을 추가하므로 경로별 마지막 줄이 최종 결과)')
+    parser.add_argument('--no-recursive', action='store_true', help='디렉토리의 하위 디렉토리는 처리하지 않음')
+    parser.add_argument('--max-chars', type=int, default=None, help='파일당 최대 글자 수')
+    parser.add_argument('--time-budget', type=float, default=None, help='파일당 최대 추출 시간(초)')
+    parser.add_argument('--office-backend', choices=['native', 'unstructured'], default=None,
+                        help='Word/PowerPoint 추출 백엔드')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='파일당 최대 처리 시간(초). 넘으면 워커를 강제 종료')
+    parser.add_argument('--memory-limit-mb', type=float, default=None,
+                        help='워커의 메모리 한도(MB, RSS). 넘으면 워커를 강제 종료')
+    parser.add_argument('--quarantine', default=None,
+                        help='제한을 넘은 파일을 기록하고 다음 실행부터 건너뛸 격리 목록 파일 (JSONL)')
+    parser.add_argument('--profile-dir', default=None,
+                        help='기준을 넘은 파일의 프로파일(cProfile, tracemalloc)을 저장할 디렉토리')
+    parser.add_argument('--profile-min-seconds', type=float, default=None,
+                        help='이 시간(초) 이상 걸린 파일만 프로파일 저장')
+    parser.add_argument('--profile-min-memory-mb', type=float, default=None,
+                        help='최대 메모리가 이 값(MB) 이상인 파일만 프로파일 저장')
+    parser.add_argument('--schedule', action='store_true',
+                        help='파일 크기와 타입으로 예상한 처리 시간이 긴 파일부터 처리')
+    parser.add_argument('--cost-model', default=None,
+                        help='처리 시간 학습 결과를 읽고 저장할 비용 모델 파일 (JSON, 지정하면 --schedule 적용)')
+    parser.add_argument('--dedup', action='store_true',
+                        help='내용이 같은 파일은 한 번만 추출하고 결과를 복사 (duplicate_of 필드 추가)')
+    parser.add_argument('--near-dedup', type=float, default=None, metavar='THRESHOLD',
+                        help='추정 유사도가 이 값(0~1) 이상인 문서에 near_duplicate_of 필드 추가 (MinHash LSH)')
+    return parser
+
+
+def expand_inputs(inputs: List[str], recursive: bool = True) -> dict:
+    """
+    경로, glob 패턴, 디렉토리를 파일 목록으로 펼치고 타입을 감지하는 함수
+    
+    Args:
+        inputs (List[str]): 명령줄 입력들
+        recursive (bool): 디렉토리를 재귀적으로 탐색할지 여부
+        
+    Returns:
+        dict: {파일 경로: 파일 타입} (입력 순서 유지). 디렉토리와 glob에서 찾은 파일 중
+            지원하지 않는 파일은 제외하고, 직접 지정한 경로는 오류 결과를 남기도록 그대로 둠
+    """
+    paths = []
+    for item in inputs:
+        if not is_url(item) and any(char in item for char in GLOB_CHARS):
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                print(f"일치하는 파일이 없습니다: {item}", file=sys.stderr)
+            paths.extend(matches)
+        else:
+            paths.append(item)
+    
+    explicit = set(inputs)
+    file_types = detect_file_types(list(dict.fromkeys(paths)), recursive=recursive, deep=True)
+    return {
+        path: file_type for path, file_type in file_types.items()
+        if path in explicit or file_type not in (None, 'unknown')
+    }
+
+
+def load_completed_paths(output_path: str) -> Set[str]:
+    """
+    이전 출력 파일에서 성공한 파일 경로들을 읽는 함수
+    
+    중단되면서 마지막 줄이 완전히 기록되지 않았으면 그 줄을 잘라내어
+    이어서 기록할 때 JSONL 형식이 깨지지 않도록 합니다.
+    
+    Args:
+        output_path (str): JSONL 출력 파일 경로
+        
+    Returns:
+        Set[str]: 성공으로 기록된 file_path 집합
+    """
+    if output_path == '-' or not os.path.exists(output_path):
+        return set()
+    
+    completed = set()
+    with open(output_path, 'rb+') as f:
+        valid_end = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            valid_end += len(line)
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('success'):
+                completed.add(record.get('file_path'))
+        f.truncate(valid_end)
+    return completed
+
+
+def load_latest_records(output_path: str) -> Dict[str, dict]:
+    """
+    출력 파일에서 파일 경로별 최종 결과를 읽는 함수
+    
+    --resume으로 다시 시도한 파일은 같은 file_path의 줄이 여러 개이므로 마지막 줄을 사용합니다.
+    완전히 기록되지 않은 줄과 JSON이 아닌 줄은 건너뜁니다.
+    
+    Args:
+        output_path (str): JSONL 출력 파일 경로
+        
+    Returns:
+        Dict[str, dict]: {file_path: 마지막 결과} (처음 기록된 순서)
+    """
+    records = {}
+    with open(output_path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record.get('file_path')] = record
+    return records
+
+
+def run_extraction(tasks: List[Tuple[str, Optional[str]]], workers: int, options: dict,
+                   timeout: Optional[float] = None, memory_limit_mb: Optional[float] = None,
+                   quarantine: Optional[Quarantine] = None,
+                   scheduler: Optional[BatchScheduler] = None, dedup: bool = False) -> Iterator[dict]:
+    """
+    파일들을 처리하고 끝나는 순서대로 결과를 반환하는 함수
+    
+    풀에 한 번에 넣는 작업 수를 제한하므로 파일 수와 관계없이 메모리 사용량이 일정합니다.
+    처리 시간이나 메모리를 제한하면 워커가 1개여도 워커 프로세스에서 처리합니다.
+    
+    Args:
+        tasks (List[Tuple[str, str]]): (파일 경로, 파일 타입) 리스트
+        workers (int): 워커 프로세스 수 (1이면 현재 프로세스에서 처리)
+        options (dict): to_text_data_sync 추가 옵션
+        timeout (float, optional): 파일당 최대 처리 시간(초)
+        memory_limit_mb (float, optional): 워커의 메모리 한도(MB)
+        quarantine (Quarantine, optional): 격리 목록 (격리된 파일은 건너뛰고, 제한을 넘은 파일은 추가)
+        scheduler (BatchScheduler, optional): 처리 순서를 정하고 파일별 처리 시간을 기록할 스케줄러
+            (끝나면 scheduler.last_report에 makespan 보고서를 남김)
+        dedup (bool): 내용이 같은 파일은 한 번만 추출하고, 대표 파일 결과 뒤에 복사한 결과를 반환
+        
+    Yields:
+        dict: 파일별 메타데이터 결과 (워커가 강제 종료된 파일은 error_type이 있는 오류 결과)
+    """
+    copies = {}
+    if dedup:
+        file_types = dict(tasks)
+        unique_paths, copies = split_duplicates(list(file_types))
+        tasks = [(path, file_types[path]) for path in unique_paths]
+    try:
+        for record in _run_tasks(tasks, workers, options, timeout, memory_limit_mb, quarantine, scheduler):
+            if quarantine is not None:
+                update_quarantine(quarantine, record['file_path'], record, None)
+            yield record
+            for path in copies.get(record['file_path'], ()):
+                yield duplicate_result(record, path, record['file_path'])
+    finally:
+        if scheduler is not None:
+            scheduler.finish()
+
+
+def _run_tasks(tasks: List[Tuple[str, Optional[str]]], workers: int, options: dict,
+               timeout: Optional[float], memory_limit_mb: Optional[float],
+               quarantine: Optional[Quarantine],
+               scheduler: Optional[BatchScheduler] = None) -> Iterator[dict]:
+    """격리되지 않은 파일을 처리하고 끝나는 순서대로 결과를 반환 (run_extraction 참고)"""
+    if quarantine is not None:
+        runnable = []
+        for path, file_type in tasks:
+            if path in quarantine:
+                error = quarantined_error(quarantine, path, file_type)
+                yield create_error_response(path, str(error), classify_error(error))
+            else:
+                runnable.append((path, file_type))
+        tasks = runnable
+    
+    inline = workers <= 1 and timeout is None and memory_limit_mb is None
+    workers = max(1, workers)
+    if scheduler is not None:
+        file_types = dict(tasks)
+        tasks = [(path, file_types[path]) for path in scheduler.plan(list(file_types), file_types, workers)]
+    
+    if inline:
+        # 워커 하나로 처리하므로 압축 파일 멤버도 현재 프로세스에서 처리
+        options = {'archive_workers': 1, **options}
+        for path, file_type in tasks:
+            started = time.perf_counter()
+            record = to_text_data_sync(path, include_metadata=True, file_type=file_type, **options)
+            if scheduler is not None:
+                scheduler.record(path, time.perf_counter() - started)
+            yield record
+        return
+    
+    max_pending = workers * PENDING_TASKS_PER_WORKER
+    with WarmWorkerPool(max_workers=workers, task_timeout=timeout, memory_limit_mb=memory_limit_mb) as pool:
+        # Future -> 파일 경로 (워커가 강제 종료되면 오류 결과에 경로를 기록)
+        pending = {}
+        for path, file_type in tasks:
+            pending[pool.submit(path, include_metadata=True, file_type=file_type, **options)] = path
+            if len(pending) >= max_pending:
+                yield from _collect_done(pending, scheduler)
+        
+        while pending:
+            yield from _collect_done(pending, scheduler)
+
+
+def _collect_done(pending: dict, scheduler: Optional[BatchScheduler] = None) -> Iterator[dict]:
+    """끝난 작업이 생길 때까지 기다린 뒤 그 결과들을 반환 (실패한 작업은 오류 결과로 변환)"""
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        path = pending.pop(future)
+        if scheduler is not None:
+            scheduler.record(path, getattr(future, 'elapsed', None))
+        try:
+            yield future.result()
+        except Exception as e:
+            yield create_error_response(path, str(e), classify_error(e))
+
+
+def print_summary(summary: dict, seconds: float) -> None:
+    """처리량 요약을 표준 에러로 출력"""
+    seconds = max(seconds, 1e-9)
+    print(
+        f"처리: {summary['files']}개 (성공 {summary['success']}, 실패 {summary['failed']}, "
+        f"건너뜀 {summary['skipped']}), {seconds:.2f}초\n"
+        f"처리량: {summary['files'] / seconds:.2f} 파일/초, "
+        f"{summary['input_bytes'] / 1024 / 1024 / seconds:.2f} MB/초, "
+        f"{summary['chars'] / seconds:,.0f} 글자/초",
+        file=sys.stderr
+    )
+
+
+def print_schedule_report(report: dict) -> None:
+    """스케줄링 결과(입력 순서 대비 makespan)를 표준 에러로 출력"""
+    print(
+        f"스케줄: 워커 {report['workers']}개, 실제 {report['makespan_seconds']:.2f}초 / "
+        f"실측 시간 기준 makespan {report['simulated']['scheduled']:.2f}초 "
+        f"(입력 순서 {report['simulated']['naive']:.2f}초, {report['speedup']:.2f}배), "
+        f"예상 {report['estimated']['scheduled']:.2f}초 (입력 순서 {report['estimated']['naive']:.2f}초)",
+        file=sys.stderr
+    )
+
+
+def _update_summary(summary: dict, record: dict) -> None:
+    """결과 하나를 요약 통계에 반영"""
+    summary['files'] += 1
+    summary['success' if record.get('success') else 'failed'] += 1
+    summary['chars'] += record.get('char_count') or 0
+    path = record.get('file_path')
+    if path and not is_url(path):
+        try:
+            summary['input_bytes'] += os.path.getsize(path)
+        except OSError:
+            pass
+
+
+# 상수들
+PENDING_TASKS_PER_WORKER = 4
+GLOB_CHARS = '*?['
@@ -0,0 +1,327 @@
+"""
+파일 내용 기반 타입 감지 모듈
+
+확장자를 믿지 않고 파일의 앞/뒤 몇 KB만 읽어 실제 형식을 판단합니다.
+ZIP 컨테이너는 중앙 디렉토리의 파일 이름([Content_Types].xml, word/, ppt/, xl/)으로,
+OLE(구 버전 Office) 컨테이너는 디렉토리 스트림의 항목 이름으로 구분하고,
+텍스트 파일은 HTML, Markdown, JSON, 일반 텍스트로 구분합니다.
+"""
+
+import os
+import re
+import mmap
+import json
+import codecs
+import struct
+from typing import Callable, Optional, Union
+
+import chardet
+
+from .encoding_utils import KOREAN_ENCODINGS
+
+
+def sniff_file_type(file_path: str) -> str:
+    """
+    파일 내용을 읽어 파일 타입을 판단하는 함수 (파일당 최대 몇 KB만 읽음)
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: 'pdf', 'word', 'ppt', 'excel', 'html', 'markdown', 'json', 'txt',
+             'zip', 'tar', 'unknown' 중 하나
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 'unknown'
+        
+        def read_at(offset: int, length: int) -> bytes:
+            return _read_window(f, offset, length, size)
+        
+        return _classify(read_at, size)
+
+
+def sniff_bytes(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    메모리에 있는 버퍼의 파일 타입을 판단하는 함수 (버퍼를 복사하지 않음)
+    
+    Args:
+        data (bytes, bytearray, memoryview): 파일 내용
+        
+    Returns:
+        str: sniff_file_type과 같은 형식의 파일 타입
+    """
+    view = memoryview(data).cast('B')
+    size = len(view)
+    if size == 0:
+        return 'unknown'
+    
+    def read_at(offset: int, length: int) -> bytes:
+        return bytes(view[offset:offset + length])
+    
+    return _classify(read_at, size)
+
+
+def _read_window(f, offset: int, length: int, size: int) -> bytes:
+    """
+    파일의 일부 구간만 mmap으로 매핑하여 읽는 함수
+    
+    Args:
+        f: 바이너리 모드로 연 파일 객체
+        offset (int): 읽을 위치
+        length (int): 읽을 길이
+        size (int): 파일 크기
+        
+    Returns:
+        bytes: 읽은 바이트 (파일 범위를 벗어난 부분은 잘림)
+    """
+    offset = max(0, offset)
+    length = min(length, size - offset)
+    if length <= 0:
+        return b''
+    
+    # mmap 시작 위치는 할당 단위에 맞춰야 함
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    try:
+        with mmap.mmap(f.fileno(), length + offset - aligned, access=mmap.ACCESS_READ,
+                       offset=aligned) as window:
+            return window[offset - aligned:offset - aligned + length]
+    except (OSError, ValueError):
+        # mmap을 지원하지 않는 파일 시스템
+        f.seek(offset)
+        return f.read(length)
+
+
+def _classify(read_at: Callable[[int, int], bytes], size: int) -> str:
+    """
+    앞부분과(ZIP이면) 끝부분만 읽어 파일 타입을 판단
+    
+    Args:
+        read_at (Callable): (위치, 길이) -> 바이트를 반환하는 함수
+        size (int): 전체 크기
+        
+    Returns:
+        str: 파일 타입
+    """
+    head = read_at(0, SNIFF_HEAD_BYTES)
+    
+    if head.startswith(b'PK\x03\x04') or head.startswith(b'PK\x05\x06'):
+        return _classify_zip(read_at, size)
+    
+    if head.startswith(OLE_SIGNATURE):
+        return _classify_ole(read_at, head)
+    
+    # PDF 시그니처는 파일 맨 앞에 있어야 함 (BOM과 공백은 허용, 본문에 %PDF-를 언급한 텍스트 파일 제외)
+    if _strip_leading(head).startswith(b'%PDF-'):
+        return 'pdf'
+    
+    if head[257:262] == b'ustar':
+        return 'tar'
+    
+    if head.startswith(BINARY_SIGNATURES):
+        return 'unknown'
+    
+    return _classify_text(head, complete=size <= len(head))
+
+
+def _strip_leading(head: bytes) -> bytes:
+    """앞쪽의 UTF-8 BOM과 공백 문자를 제거"""
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8):]
+    return head.lstrip(b' \t\r\n\f\x00')
+
+
+def _classify_zip(read_at: Callable[[int, int], bytes], size: int) -> str:
+    """
+    ZIP 중앙 디렉토리의 파일 이름으로 Office Open XML 문서 종류를 판단
+    
+    Returns:
+        str: 'word', 'ppt', 'excel' 또는 일반 ZIP이면 'zip'
+    """
+    # 파일 끝의 End Of Central Directory 레코드 찾기 (주석이 있으면 조금 앞에 있음)
+    tail_offset = max(0, size - SNIFF_TAIL_BYTES)
+    tail = read_at(tail_offset, SNIFF_TAIL_BYTES)
+    eocd = tail.rfind(b'PK\x05\x06')
+    if eocd < 0 or eocd + 22 > len(tail):
+        return 'zip'
+    
+    _, _, _, _, entry_count, directory_size, directory_offset, _ = struct.unpack(
+        '<4sHHHHIIH', tail[eocd:eocd + 22]
+    )
+    if directory_offset >= size:
+        return 'zip'
+    
+    # 중앙 디렉토리 앞부분만 읽음 (Office 문서는 주요 항목이 앞쪽에 있음)
+    directory = read_at(directory_offset, min(directory_size, SNIFF_DIRECTORY_BYTES))
+    names = []
+    position = 0
+    for _ in range(entry_count):
+        if position + 46 > len(directory) or directory[position:position + 4] != b'PK\x01\x02':
+            break
+        name_length, extra_length, comment_length = struct.unpack(
+            '<HHH', directory[position + 28:position + 34]
+        )
+        name = directory[position + 46:position + 46 + name_length]
+        if len(name) < name_length:
+            break
+        names.append(name.decode('utf-8', errors='ignore'))
+        position += 46 + name_length + extra_length + comment_length
+    
+    for name in names:
+        for prefix, file_type in OOXML_PREFIXES:
+            if name.startswith(prefix):
+                return file_type
+    return 'zip'
+
+
+def _classify_ole(read_at: Callable[[int, int], bytes], head: bytes) -> str:
+    """
+    OLE(Compound File) 디렉토리 스트림의 첫 섹터에서 항목 이름으로 문서 종류를 판단
+    
+    Returns:
+        str: 'word', 'ppt', 'excel' 또는 'unknown'
+    """
+    if len(head) < 512:
+        return 'unknown'
+    
+    sector_shift = struct.unpack('<H', head[0x1E:0x20])[0]
+    first_directory_sector = struct.unpack('<I', head[0x30:0x34])[0]
+    if sector_shift not in (9, 12) or first_directory_sector >= 0xFFFFFFFA:
+        return 'unknown'
+    
+    sector_size = 1 << sector_shift
+    directory = read_at((first_directory_sector + 1) * sector_size, sector_size)
+    
+    for position in range(0, len(directory) - 127, 128):
+        name_length = struct.unpack('<H', directory[position + 64:position + 66])[0]
+        if not 2 <= name_length <= 64:
+            continue
+        name = directory[position:position + name_length - 2].decode('utf-16-le', errors='ignore')
+        if name in OLE_STREAM_TYPES:
+            return OLE_STREAM_TYPES[name]
+    return 'unknown'
+
+
+def _classify_text(head: bytes, complete: bool = False) -> str:
+    """
+    앞부분을 텍스트로 디코딩하여 HTML, Markdown, JSON, 일반 텍스트를 구분
+    
+    Args:
+        head (bytes): 파일 앞부분
+        complete (bool): head가 파일 전체인지 여부
+        
+    Returns:
+        str: 'html', 'markdown', 'json', 'txt' 또는 텍스트가 아니면 'unknown'
+    """
+    text = _decode_head(head, complete)
+    if text is None:
+        return 'unknown'
+    
+    # 제어 문자가 많으면 텍스트가 아님
+    control_count = sum(1 for char in text if char < ' ' and char not in '\t\n\r\f\v\x1b')
+    if control_count > len(text) * MAX_CONTROL_CHAR_RATIO:
+        return 'unknown'
+    
+    stripped = text.lstrip()
+    lowered = stripped[:1024].lower()
+    if lowered.startswith(('<!doctype html', '<html')) or _HTML_RE.search(lowered):
+        return 'html'
+    
+    if stripped.startswith(('{', '[')):
+        if complete:
+            try:
+                json.loads(text)
+                return 'json'
+            except ValueError:
+                pass
+        elif _JSON_START_RE.match(stripped):
+            return 'json'
+    
+    if len(_MARKDOWN_RE.findall(text)) >= MIN_MARKDOWN_MARKERS:
+        return 'markdown'
+    
+    return 'txt'
+
+
+def _decode_head(head: bytes, complete: bool) -> Optional[str]:
+    """
+    파일 앞부분을 문자열로 디코딩 (BOM, UTF-8, chardet, 한국어 인코딩 순서)
+    
+    Returns:
+        str: 디코딩된 문자열. 텍스트로 볼 수 없으면 None
+    """
+    for bom, encoding in TEXT_BOMS:
+        if head.startswith(bom):
+            decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+            return decoder.decode(head, final=complete)
+    
+    if b'\x00' in head:
+        return None
+    
+    # 잘린 마지막 문자는 무시하도록 점진적 디코더 사용
+    try:
+        return codecs.getincrementaldecoder('utf-8')().decode(head, final=complete)
+    except UnicodeDecodeError:
+        pass
+    
+    detected = chardet.detect(head)
+    if detected['encoding'] and detected['confidence'] >= MIN_CHARDET_CONFIDENCE:
+        try:
+            return head.decode(detected['encoding'], errors='ignore')
+        except LookupError:
+            pass
+    
+    # 반복이 많은 한국어 텍스트는 chardet 신뢰도가 낮으므로 직접 시도
+    for encoding in KOREAN_ENCODINGS[1:]:
+        try:
+            return codecs.getincrementaldecoder(encoding)().decode(head, final=complete)
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+# 상수들
+SNIFF_HEAD_BYTES = 4096
+SNIFF_TAIL_BYTES = 1024
+SNIFF_DIRECTORY_BYTES = 4096
+MIN_CHARDET_CONFIDENCE = 0.5
+MAX_CONTROL_CHAR_RATIO = 0.05
+MIN_MARKDOWN_MARKERS = 2
+
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# 중앙 디렉토리 항목 이름 접두사 -> 파일 타입
+OOXML_PREFIXES = (
+    ('word/', 'word'),
+    ('ppt/', 'ppt'),
+    ('xl/', 'excel'),
+)
+
+# OLE 스트림 이름 -> 파일 타입
+OLE_STREAM_TYPES = {
+    'WordDocument': 'word',
+    'PowerPoint Document': 'ppt',
+    'Workbook': 'excel',
+    'Book': 'excel',
+}
+
+TEXT_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+BINARY_SIGNATURES = (
+    b'\x89PNG', b'GIF8', b'\xff\xd8\xff', b'\x1f\x8b', b'BZh', b'7z\xbc\xaf', b'Rar!',
+    b'ID3', b'OggS', b'RIFF', b'\x7fELF', b'MZ'
+)
+
+_HTML_RE = re.compile(r'<(?:head|body|meta|title)[\s>]')
+_JSON_START_RE = re.compile(r'[\{\[]\s*(?:"|\{|\[|-?\d|true|false|null|\]|\})')
+_MARKDOWN_RE = re.compile(
+    r'^(?:#{1,6} \S|```|[-*+] \S|\d+\. \S|> \S|\|.*\|\s*$|[-=]{3,}\s*$)|\[[^\]\n]+\]\([^)\n]+\)',
+    re.M
+)
@@ -0,0 +1,161 @@
+"""
+중복 파일 제거 모듈
+
+같은 PDF가 여러 곳에 첨부되는 것처럼 내용이 바이트 단위로 같은 파일이 많으면, 추출 전에
+중복을 찾아 내용마다 한 번만 추출하고 결과를 나머지 경로에 복사합니다.
+
+크기가 같은 파일끼리만 비교하므로 대부분의 파일은 해시를 계산하지 않고, 크기가 같은 파일도
+앞부분 해시로 먼저 거른 뒤 남은 파일만 전체 내용을 해시합니다. 파일은 고정 크기 버퍼로 나눠
+읽고, 해시 계산은 GIL을 놓으므로 여러 스레드에서 동시에 계산합니다.
+"""
+
+import hashlib
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .file_detector import is_url
+
+
+def find_duplicates(file_paths: List[str], max_workers: Optional[int] = None) -> Dict[str, str]:
+    """
+    내용이 같은 파일을 찾는 함수
+    
+    Args:
+        file_paths (List[str]): 파일 경로들 (URL, 디렉토리, 없는 파일은 비교하지 않음)
+        max_workers (int, optional): 해시를 계산할 스레드 수 (기본값은 ThreadPoolExecutor 기본값)
+        
+    Returns:
+        Dict[str, str]: {중복 파일 경로: 대표 파일 경로}. 대표 파일은 같은 내용 중 입력 순서가
+            가장 빠른 파일이고, 중복이 없는 파일은 포함하지 않음
+    """
+    by_size = defaultdict(list)
+    for file_path in dict.fromkeys(file_paths):
+        size = _regular_file_size(file_path)
+        if size is not None:
+            by_size[size].append(file_path)
+    candidates = {size: paths for size, paths in by_size.items() if len(paths) > 1}
+    if not candidates:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 큰 파일은 앞부분만 먼저 비교해 전체를 읽을 파일을 줄임
+        large = [paths for size, paths in candidates.items() if size > HEAD_BYTES]
+        small = [paths for size, paths in candidates.items() if size <= HEAD_BYTES]
+        groups = _split_by_digest(executor, large, HEAD_BYTES) + small
+        groups = _split_by_digest(executor, groups, None)
+    
+    duplicates = {}
+    for same_content in groups:
+        for file_path in same_content[1:]:
+            duplicates[file_path] = same_content[0]
+    return duplicates
+
+
+def split_duplicates(file_paths: List[str], max_workers: Optional[int] = None) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    처리할 대표 파일과 그 중복 파일들로 나누는 함수
+    
+    Args:
+        file_paths (List[str]): 파일 경로들
+        max_workers (int, optional): 해시를 계산할 스레드 수
+        
+    Returns:
+        Tuple[List[str], Dict[str, List[str]]]: (입력 순서의 대표 파일 경로들, {대표 파일 경로: 중복 파일 경로들})
+    """
+    duplicates = find_duplicates(file_paths, max_workers)
+    copies = defaultdict(list)
+    for file_path, original in duplicates.items():
+        copies[original].append(file_path)
+    unique_paths = [file_path for file_path in dict.fromkeys(file_paths) if file_path not in duplicates]
+    return unique_paths, dict(copies)
+
+
+def duplicate_result(result, file_path: str, original: str):
+    """
+    대표 파일의 추출 결과를 중복 파일의 결과로 복사
+    
+    Args:
+        result: 대표 파일의 결과 (메타데이터 딕셔너리 또는 텍스트)
+        file_path (str): 중복 파일 경로
+        original (str): 대표 파일 경로
+        
+    Returns:
+        메타데이터 결과면 file_path를 바꾸고 duplicate_of를 추가한 복사본, 텍스트면 그대로
+    """
+    if not isinstance(result, dict):
+        return result
+    copied = dict(result)
+    copied['file_path'] = file_path
+    copied['duplicate_of'] = original
+    return copied
+
+
+def file_digest(file_path: str, limit: Optional[int] = None) -> str:
+    """
+    파일 내용의 해시 (고정 크기 버퍼로 나눠 읽음)
+    
+    Args:
+        file_path (str): 파일 경로
+        limit (int, optional): 앞에서부터 이 바이트 수만 해시 (기본값은 전체)
+        
+    Returns:
+        str: BLAKE2b 해시 (16진수)
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    buffer = bytearray(READ_CHUNK_SIZE)
+    view = memoryview(buffer)
+    remaining = limit
+    with open(file_path, 'rb', buffering=0) as f:
+        while remaining is None or remaining > 0:
+            size = f.readinto(buffer if remaining is None or remaining >= len(buffer) else view[:remaining])
+            if not size:
+                break
+            digest.update(view[:size])
+            if remaining is not None:
+                remaining -= size
+    return digest.hexdigest()
+
+
+def _split_by_digest(executor: ThreadPoolExecutor, groups: List[List[str]], limit: Optional[int]) -> List[List[str]]:
+    """
+    각 묶음을 해시가 같은 파일끼리 다시 나눔 (모든 묶음의 파일을 한꺼번에 병렬로 해시)
+    
+    읽을 수 없는 파일과 하나만 남은 묶음은 제외하고, 묶음 안은 입력 순서를 유지합니다.
+    """
+    tasks = [(index, file_path) for index, paths in enumerate(groups) for file_path in paths]
+    digests = executor.map(lambda task: _safe_digest(task[1], limit), tasks)
+    split = defaultdict(list)
+    for (index, file_path), digest in zip(tasks, digests):
+        if digest is not None:
+            split[index, digest].append(file_path)
+    return [paths for paths in split.values() if len(paths) > 1]
+
+
+def _safe_digest(file_path: str, limit: Optional[int]) -> Optional[str]:
+    """해시 계산 (읽을 수 없으면 None)"""
+    try:
+        return file_digest(file_path, limit)
+    except OSError as e:
+        print(f"파일 해시 계산 중 오류 발생 ({file_path}): {e}")
+        return None
+
+
+def _regular_file_size(file_path: str) -> Optional[int]:
+    """일반 파일의 크기 (URL, 디렉토리, 없는 파일은 None)"""
+    if is_url(file_path):
+        return None
+    try:
+        file_stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else None
+
+
+# 상수들
+# 크기가 같은 큰 파일은 이 크기만큼 앞부분을 먼저 비교
+HEAD_BYTES = 64 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+DIGEST_SIZE = 32
@@ -0,0 +1,140 @@
+"""
+DOCX 직접 추출 모듈
+
+unstructured를 거치지 않고 .docx(zip) 안의 word/document.xml을 iterparse로 스트리밍하며
+문단과 표의 텍스트를 바로 추출합니다. 처리가 끝난 요소는 즉시 트리에서 제거하므로
+문서 크기와 관계없이 메모리 사용량이 작습니다.
+"""
+
+import zipfile
+from typing import BinaryIO, Iterator, Optional, Union
+
+from lxml import etree
+
+from .budget import ExtractionBudget
+
+
+def extract_docx_text(source: Union[str, BinaryIO], budget: Optional[ExtractionBudget] = None) -> str:
+    """
+    DOCX 파일에서 문단과 표의 텍스트를 추출하는 함수
+    
+    Args:
+        source (str or BinaryIO): .docx 파일 경로 또는 바이너리 파일 객체
+        budget (ExtractionBudget, optional): 추출 예산 (글자 수/시간 예산이 다 되면 중단)
+        
+    Returns:
+        str: 블록(문단, 표)별 텍스트를 줄바꿈으로 합친 텍스트
+        
+    Raises:
+        zipfile.BadZipFile: zip 파일이 아닌 경우
+        KeyError: word/document.xml이 없는 경우
+        lxml.etree.XMLSyntaxError: 문서 XML이 손상된 경우
+    """
+    blocks = []
+    for block in iter_docx_blocks(source):
+        if budget:
+            if budget.should_stop():
+                break
+            budget.consume(block)
+        blocks.append(block)
+    return "\n".join(blocks)
+
+
+def iter_docx_blocks(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """
+    word/document.xml을 스트리밍으로 읽으며 본문 블록의 텍스트를 하나씩 반환하는 함수
+    
+    문단은 한 블록, 표는 행마다 셀을 ' | '로 연결한 한 블록이 됩니다.
+    빈 문단은 건너뜁니다.
+    
+    Args:
+        source (str or BinaryIO): .docx 파일 경로 또는 바이너리 파일 객체
+        
+    Yields:
+        str: 블록 텍스트
+    """
+    with zipfile.ZipFile(source) as archive, archive.open(DOCUMENT_PART) as stream:
+        paragraph_depth = 0
+        table_depth = 0
+        rows = []
+        cells = []
+        
+        for event, element in etree.iterparse(stream, events=('start', 'end'), tag=_STREAM_TAGS):
+            tag = element.tag
+            if event == 'start':
+                if tag == W_P:
+                    paragraph_depth += 1
+                elif tag == W_TBL:
+                    table_depth += 1
+                continue
+            
+            if tag == MC_FALLBACK:
+                # 호환용 대체 콘텐츠는 AlternateContent의 Choice와 같은 내용이므로 버림
+                element.clear()
+            elif tag == W_P:
+                paragraph_depth -= 1
+                if paragraph_depth == 0 and table_depth == 0:
+                    text = _paragraph_text(element)
+                    _release(element)
+                    if text:
+                        yield text
+            elif table_depth == 1 and tag == W_TC:
+                cells.append(' '.join(
+                    text for text in (_paragraph_text(p) for p in _OUTER_PARAGRAPHS(element)) if text
+                ))
+            elif table_depth == 1 and tag == W_TR:
+                if any(cells):
+                    rows.append(' | '.join(cells))
+                cells = []
+            elif tag == W_TBL:
+                table_depth -= 1
+                if table_depth == 0:
+                    text = "\n".join(rows)
+                    rows = []
+                    _release(element)
+                    if text:
+                        yield text
+
+
+def _paragraph_text(paragraph) -> str:
+    """문단의 텍스트 (탭과 줄바꿈 포함, 텍스트 상자 내용 포함)"""
+    parts = []
+    for node in paragraph.iter(W_T, W_TAB, W_BR, W_CR):
+        if node.tag == W_T:
+            parts.append(node.text or '')
+        elif node.getparent().tag == W_R:
+            # 문단 속성의 탭 위치 정의(w:tabs/w:tab)는 제외
+            parts.append('\t' if node.tag == W_TAB else '\n')
+    return ''.join(parts).strip()
+
+
+def _release(element) -> None:
+    """처리가 끝난 최상위 블록과 그 앞의 형제들을 트리에서 제거하여 메모리 해제"""
+    element.clear()
+    parent = element.getparent()
+    if parent is None:
+        return
+    while element.getprevious() is not None:
+        del parent[0]
+
+
+# 상수들
+DOCUMENT_PART = 'word/document.xml'
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+
+W_P = f'{{{W_NS}}}p'
+W_R = f'{{{W_NS}}}r'
+W_T = f'{{{W_NS}}}t'
+W_TAB = f'{{{W_NS}}}tab'
+W_BR = f'{{{W_NS}}}br'
+W_CR = f'{{{W_NS}}}cr'
+W_TBL = f'{{{W_NS}}}tbl'
+W_TR = f'{{{W_NS}}}tr'
+W_TC = f'{{{W_NS}}}tc'
+MC_FALLBACK = f'{{{MC_NS}}}Fallback'
+
+_STREAM_TAGS = (W_P, W_TBL, W_TR, W_TC, MC_FALLBACK)
+# 셀 안에서 다른 문단(텍스트 상자 등)에 포함되지 않은 문단들
+_OUTER_PARAGRAPHS = etree.XPath('.//w:p[not(ancestor::w:p)]', namespaces={'w': W_NS})
@@ -6,6 +6,7 @@
 """
 
 import re
+import codecs
 import chardet
 from typing import Optional, Union
 import requests
@@ -22,51 +23,80 @@ def detect_and_decode(response: requests.Response, forced_encoding: Optional[str
     Returns:
         str: 디코딩된 텍스트
     """
-    if forced_encoding:
-        try:
-            return response.content.decode(forced_encoding, errors='ignore')
-        except:
-            pass
+    content_type = response.headers.get('content-type', '')
+    return decode_html_bytes(response.content, content_type, forced_encoding)
+
+
+def decode_html_bytes(content: bytes, content_type: str = '', forced_encoding: Optional[str] = None) -> str:
+    """
+    HTML 바이트 데이터를 올바른 인코딩으로 디코딩
+    
+    Args:
+        content (bytes): HTML 바이트 데이터
+        content_type (str): Content-Type 헤더 값 (없으면 빈 문자열)
+        forced_encoding (str, optional): 강제할 인코딩. 기본값은 None
+        
+    Returns:
+        str: 디코딩된 텍스트
+    """
+    encoding = detect_html_encoding(content, content_type, forced_encoding)
+    return content.decode(encoding, errors='ignore')
+
+
+def detect_html_encoding(content: bytes, content_type: str = '', forced_encoding: Optional[str] = None) -> str:
+    """
+    HTML 바이트 데이터의 인코딩을 감지
+    
+    강제 인코딩, HTTP 헤더의 charset, HTML meta 태그, chardet 순서로 확인하며
+    스트리밍 처리 시에는 첫 청크만 넘겨도 됩니다.
+    
+    Args:
+        content (bytes): HTML 바이트 데이터 (또는 앞부분)
+        content_type (str): Content-Type 헤더 값 (없으면 빈 문자열)
+        forced_encoding (str, optional): 강제할 인코딩. 기본값은 None
+        
+    Returns:
+        str: 파이썬에서 사용할 수 있는 인코딩 이름
+    """
+    if forced_encoding and _is_known_encoding(forced_encoding):
+        return forced_encoding
     
     # 1. HTTP 헤더에서 charset 확인
-    content_type = response.headers.get('content-type', '')
     charset_match = re.search(r'charset=([^;\s]+)', content_type, re.I)
     if charset_match:
-        try:
-            encoding = charset_match.group(1).strip('\'"')
-            return response.content.decode(encoding, errors='ignore')
-        except:
-            pass
+        encoding = charset_match.group(1).strip('\'"')
+        if _is_known_encoding(encoding):
+            return encoding
     
     # 2. HTML meta 태그에서 charset 확인
-    try:
-        partial_content = response.content[:2048].decode('utf-8', errors='ignore')
-        meta_match = re.search(r'<meta[^>]*charset["\s]*=["\s]*([^">\s]+)', partial_content, re.I)
-        if meta_match:
-            encoding = meta_match.group(1).strip('\'"')
-            return response.content.decode(encoding, errors='ignore')
-    except:
-        pass
+    partial_content = content[:2048].decode('utf-8', errors='ignore')
+    meta_match = re.search(r'<meta[^>]*charset["\s]*=["\s]*([^">\s]+)', partial_content, re.I)
+    if meta_match:
+        encoding = meta_match.group(1).strip('\'"')
+        if _is_known_encoding(encoding):
+            return encoding
     
     # 3. chardet 라이브러리로 자동 감지
     try:
-        detected = chardet.detect(response.content)
-        if detected['confidence'] > 0.7:
-            encoding = detected['encoding']
-            return response.content.decode(encoding, errors='ignore')
+        detected = chardet.detect(content)
+        if detected['confidence'] > 0.7 and _is_known_encoding(detected['encoding']):
+            return detected['encoding']
     except:
         pass
     
-    # 4. 일반적인 인코딩들 시도
-    common_encodings = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1', 'latin1']
-    for encoding in common_encodings:
-        try:
-            return response.content.decode(encoding, errors='ignore')
-        except:
-            continue
-    
-    # 5. 최후의 수단: utf-8로 강제 디코딩
-    return response.content.decode('utf-8', errors='ignore')
+    # 4. 최후의 수단: utf-8
+    return 'utf-8'
+
+
+def _is_known_encoding(encoding: Optional[str]) -> bool:
+    """파이썬 코덱으로 사용할 수 있는 인코딩인지 확인"""
+    if not encoding:
+        return False
+    try:
+        codecs.lookup(encoding)
+        return True
+    except LookupError:
+        return False
 
 
 def fix_encoding_issues(text: str) -> str:
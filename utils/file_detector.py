@@ -6,86 +6,280 @@
 """
 
 import os
+import stat
 import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from .content_sniffer import sniff_file_type, sniff_bytes
+from .metrics import CACHE_REQUESTS
 
-def extract_file_type(file_input: str) -> str:
+
+def extract_file_type(file_input: str, deep: bool = False) -> str:
     """
     파일 경로나 URL을 입력받아 파일 타입을 반환하는 함수.
     
     Args:
         file_input (str): 파일 경로 또는 URL
+        deep (bool): 확장자보다 파일 내용(앞부분 몇 KB)을 먼저 확인할지 여부.
+            확장자가 잘못 붙었거나 없는 Office 문서도 올바르게 감지합니다.
         
     Returns:
-        str: 'pdf', 'word', 'url', 'ppt', 'csv', 'txt', 'excel' 중 하나, 또는 'unknown'
+        str: 'pdf', 'word', 'url', 'ppt', 'csv', 'txt', 'excel', 'html', 'markdown', 'json',
+             'archive' 중 하나, 또는 'unknown'
+        
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+    """
+    file_type, _ = extract_file_type_with_stat(file_input, deep)
+    return file_type
+
+
+def extract_file_type_with_stat(file_input: str, deep: bool = False) -> Tuple[str, Optional[os.stat_result]]:
+    """
+    파일 타입과 함께 감지에 사용한 stat 결과를 반환하는 함수 (파일 크기 등을 다시 stat하지 않도록)
+    
+    Args:
+        file_input (str): 파일 경로 또는 URL
+        deep (bool): 확장자보다 파일 내용을 먼저 확인할지 여부
+        
+    Returns:
+        Tuple[str, Optional[os.stat_result]]: (파일 타입, stat 결과). URL이면 stat 결과는 None
         
     Raises:
         FileNotFoundError: 파일이 존재하지 않는 경우
     """
     
     # URL인지 먼저 확인
-    if _is_url(file_input):
-        return 'url'
+    if is_url(file_input):
+        return 'url', None
     
-    # 파일이 존재하는지 확인
-    if not os.path.exists(file_input):
+    # 파일이 존재하는지 확인 (stat 결과는 캐시 키로 재사용)
+    try:
+        stat_result = os.stat(file_input)
+    except (OSError, ValueError):
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_input}")
     
+    file_type = _detect_without_signature(file_input, stat_result, deep)
+    if file_type is None:
+        # 파일 내용으로 확인 (ZIP/OLE 디렉토리, 텍스트 형식)
+        file_type = _detect_by_signature(file_input, stat_result, deep)
+    
+    return file_type, stat_result
+
+
+def detect_file_types(inputs: Union[str, Iterable[str]], recursive: bool = True,
+                      max_workers: int = 8, expand_directories: bool = True,
+                      deep: bool = False) -> Dict[str, Optional[str]]:
+    """
+    여러 파일(또는 디렉토리)의 파일 타입을 한 번에 감지하는 함수
+    
+    디렉토리는 os.scandir로 순회하여 stat 결과를 재사용하고, 확장자/MIME 타입으로
+    판단할 수 없는 파일만 스레드 풀에서 헤더를 읽습니다. 결과는 (경로, 크기, 수정 시각)
+    기준으로 캐시되어 같은 파일을 다시 감지할 때는 파일을 읽지 않습니다.
+    
+    Args:
+        inputs (str or Iterable[str]): 파일 경로, URL, 디렉토리 (하나 또는 여러 개)
+        recursive (bool): 디렉토리를 하위 디렉토리까지 순회할지 여부
+        max_workers (int): 헤더 읽기에 사용할 스레드 수
+        expand_directories (bool): 디렉토리 입력을 안의 파일들로 펼칠지 여부
+            (False면 입력 경로 그대로 결과 키로 사용)
+        deep (bool): 모든 파일을 확장자보다 내용(앞부분 몇 KB)으로 먼저 판단할지 여부
+        
+    Returns:
+        Dict[str, Optional[str]]: {경로: 파일 타입} (존재하지 않는 파일은 None)
+    """
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    
+    results = {}
+    needs_signature = []
+    
+    for path, stat_source in _iter_input_stats(inputs, recursive, expand_directories):
+        if stat_source == 'url':
+            results[path] = 'url'
+        elif stat_source is None:
+            results[path] = None
+        else:
+            file_type = _detect_without_signature(path, stat_source, deep)
+            results[path] = file_type
+            if file_type is None:
+                needs_signature.append((path, stat_source, deep))
+    
+    # 헤더 읽기가 필요한 파일들만 스레드 풀에서 처리 (작업 단위 오버헤드를 줄이기 위해 묶어서 전달)
+    if needs_signature:
+        batches = [
+            needs_signature[i:i + SIGNATURE_BATCH_SIZE]
+            for i in range(0, len(needs_signature), SIGNATURE_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch, detected in zip(batches, executor.map(_detect_batch_by_signature, batches)):
+                for (path, _, _), file_type in zip(batch, detected):
+                    results[path] = file_type
+    
+    return results
+
+
+def detect_bytes_type(data: bytes, name: str = '') -> str:
+    """
+    메모리에 있는 파일 내용(압축 파일 멤버, 업로드 본문 등)의 파일 타입을 감지하는 함수
+    
+    Args:
+        data (bytes): 파일 내용
+        name (str): 원래 파일 이름 (있으면 텍스트 형식 구분에 사용)
+        
+    Returns:
+        str: 감지된 파일 타입 또는 'unknown'
+    """
+    return _resolve_file_type(name, _to_supported_type(sniff_bytes(data)), deep=True)
+
+
+def clear_detection_cache() -> None:
+    """파일 타입 감지 캐시를 비움"""
+    with _CACHE_LOCK:
+        _DETECTION_CACHE.clear()
+
+
+def _iter_input_stats(inputs: Iterable[str], recursive: bool, expand_directories: bool = True):
+    """
+    입력 경로들을 (경로, stat 정보) 쌍으로 펼치는 제너레이터
+    
+    stat 정보는 URL이면 'url', 존재하지 않으면 None, 디렉토리에서 찾은 파일이면
+    os.DirEntry(필요할 때만 stat 수행), 그 외에는 os.stat_result입니다.
+    """
+    for file_input in inputs:
+        if is_url(file_input):
+            yield file_input, 'url'
+            continue
+        
+        try:
+            stat_result = os.stat(file_input)
+        except (OSError, ValueError):
+            yield file_input, None
+            continue
+        
+        if expand_directories and stat.S_ISDIR(stat_result.st_mode):
+            yield from _scan_directory(file_input, recursive)
+        else:
+            yield file_input, stat_result
+
+
+def _scan_directory(directory: str, recursive: bool):
+    """os.scandir로 디렉토리를 순회하며 (경로, DirEntry) 쌍을 반환"""
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError as e:
+            print(f"디렉토리를 읽을 수 없습니다: {current} ({e})")
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir():
+                if recursive:
+                    subdirectories.append(entry.path)
+            elif entry.is_file():
+                yield entry.path, entry
+        pending.extend(reversed(subdirectories))
+
+
+def _detect_without_signature(file_path: str, stat_source, deep: bool = False) -> Optional[str]:
+    """
+    파일을 열지 않고 확장자, MIME 타입, 캐시로 파일 타입 판단
+    
+    Args:
+        file_path (str): 파일 경로
+        stat_source: os.stat_result 또는 os.DirEntry
+        deep (bool): 확장자보다 파일 내용을 먼저 확인할지 여부 (캐시된 내용 판단만 사용)
+        
+    Returns:
+        str: 감지된 파일 타입. 파일 내용을 읽어야 하면 None
+    """
+    if not deep:
+        file_type = _detect_by_name(file_path)
+        if file_type is not None:
+            return file_type
+    
+    sniffed = _DETECTION_CACHE.get(_cache_key(file_path, stat_source))
+    if sniffed is None:
+        CACHE_REQUESTS.inc('detection', 'miss')
+        return None
+    CACHE_REQUESTS.inc('detection', 'hit')
+    return _resolve_file_type(file_path, sniffed, deep)
+
+
+def _detect_by_name(file_path: str) -> Optional[str]:
+    """확장자와 MIME 타입으로 파일 타입 판단 (판단할 수 없으면 None)"""
     # 확장자 기반 확인
-    file_extension = os.path.splitext(file_input)[1].lower()
-    extension_map = {
-        '.pdf': 'pdf',
-        '.doc': 'word',
-        '.docx': 'word',
-        '.ppt': 'ppt',
-        '.pptx': 'ppt',
-        '.csv': 'csv',
-        '.txt': 'txt',
-        '.xlsx': 'excel',
-        '.xls': 'excel'
-    }
-    
-    if file_extension in extension_map:
-        return extension_map[file_extension]
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension in EXTENSION_MAP:
+        return EXTENSION_MAP[file_extension]
+    if file_path.lower().endswith(COMPRESSED_TAR_SUFFIXES):
+        return 'archive'
     
     # MIME 타입으로 확인 (내장 mimetypes 모듈 사용)
     try:
-        mime_type, _ = mimetypes.guess_type(file_input)
-        if mime_type:
-            mime_map = {
-                'application/pdf': 'pdf',
-                'application/msword': 'word',
-                'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'word',
-                'application/vnd.ms-powerpoint': 'ppt',
-                'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'ppt',
-                'text/csv': 'csv',
-                'application/csv': 'csv',
-                'text/plain': 'txt',
-                'application/vnd.ms-excel': 'excel',
-                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'excel'
-            }
-            
-            if mime_type in mime_map:
-                return mime_map[mime_type]
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if mime_type in MIME_MAP:
+            return MIME_MAP[mime_type]
     
     except Exception as e:
         print(f"MIME 타입 확인 중 오류 발생: {e}")
     
-    # 파일 시그니처로 확인 (바이너리 헤더 확인)
+    return None
+
+
+def _resolve_file_type(file_path: str, sniffed: str, deep: bool) -> str:
+    """
+    내용으로 판단한 타입과 이름으로 판단한 타입 중 최종 타입을 결정
+    
+    컨테이너 형식(PDF, ZIP/OLE 기반 Office 문서, 압축 파일)은 내용 판단을 우선하고,
+    텍스트 형식은 확장자가 더 구체적이므로(.csv를 'txt'로 보지 않도록) 이름 판단을 우선합니다.
+    """
+    if not deep or sniffed in CONTENT_AUTHORITATIVE_TYPES:
+        return sniffed
+    return _detect_by_name(file_path) or sniffed
+
+
+def _detect_by_signature(file_path: str, stat_source, deep: bool = False) -> str:
+    """파일 내용으로 타입을 판단하고 결과를 캐시에 저장"""
     try:
-        file_type = _check_file_signature(file_input)
-        if file_type != 'unknown':
-            return file_type
+        sniffed = _check_file_signature(file_path)
     except Exception as e:
         print(f"파일 시그니처 확인 중 오류 발생: {e}")
+        sniffed = 'unknown'
     
-    return 'unknown'
+    key = _cache_key(file_path, stat_source)
+    with _CACHE_LOCK:
+        if len(_DETECTION_CACHE) >= DETECTION_CACHE_SIZE:
+            # 가장 오래된 항목부터 제거
+            _DETECTION_CACHE.pop(next(iter(_DETECTION_CACHE)))
+        _DETECTION_CACHE[key] = sniffed
+    return _resolve_file_type(file_path, sniffed, deep)
+
+
+def _detect_batch_by_signature(batch: list) -> list:
+    """(경로, stat 정보, deep 여부) 묶음의 파일 내용을 차례로 확인"""
+    return [_detect_by_signature(path, stat_source, deep) for path, stat_source, deep in batch]
+
+
+def _cache_key(file_path: str, stat_source) -> tuple:
+    """감지 캐시 키 (경로, 크기, 수정 시각)"""
+    stat_result = stat_source.stat() if isinstance(stat_source, os.DirEntry) else stat_source
+    return (os.path.abspath(file_path), stat_result.st_size, stat_result.st_mtime_ns)
 
 
 def _check_file_signature(file_path: str) -> str:
     """
-    파일의 바이너리 시그니처를 확인하여 타입을 판단
+    파일 내용(앞/뒤 몇 KB)을 확인하여 타입을 판단
+    
+    ZIP/OLE 컨테이너는 디렉토리를 읽어 Word/PowerPoint/Excel을 구분하므로
+    확장자가 없거나 잘못된 경우에도 올바른 타입을 반환합니다.
     
     Args:
         file_path (str): 파일 경로
@@ -94,42 +288,19 @@ def _check_file_signature(file_path: str) -> str:
         str: 감지된 파일 타입 또는 'unknown'
     """
     try:
-        with open(file_path, 'rb') as f:
-            header = f.read(8)
-            
-        # PDF 파일 시그니처: %PDF
-        if header.startswith(b'%PDF'):
-            return 'pdf'
-            
-        # ZIP 기반 파일들 (docx, pptx, xlsx 등)
-        if header.startswith(b'PK\x03\x04'):
-            # ZIP 파일이지만 Office 문서일 수 있음
-            # 확장자로 다시 확인
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in ['.docx']:
-                return 'word'
-            elif ext in ['.pptx']:
-                return 'ppt'
-            elif ext in ['.xlsx']:
-                return 'excel'
-                
-        # 구 버전 MS Office 파일 시그니처
-        if header.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in ['.doc']:
-                return 'word'
-            elif ext in ['.ppt']:
-                return 'ppt'
-            elif ext in ['.xls']:
-                return 'excel'
-        
-    except Exception:
-        pass
-    
-    return 'unknown'
+        return _to_supported_type(sniff_file_type(file_path))
+    except OSError:
+        return 'unknown'
+
+
+def _to_supported_type(sniffed: str) -> str:
+    """내용 감지 결과를 지원하는 파일 타입으로 변환 (ZIP/TAR는 압축 파일, 그 외는 알 수 없음)"""
+    if sniffed in ('zip', 'tar'):
+        return 'archive'
+    return sniffed if sniffed in SUPPORTED_FILE_TYPES else 'unknown'
 
 
-def _is_url(string: str) -> bool:
+def is_url(string: str) -> bool:
     """
     문자열이 URL인지 확인하는 헬퍼 함수
     
@@ -147,7 +318,7 @@ def _is_url(string: str) -> bool:
 
 
 # 지원하는 파일 형식 상수
-SUPPORTED_FILE_TYPES = ['pdf', 'word', 'ppt', 'csv', 'txt', 'excel', 'url']
+SUPPORTED_FILE_TYPES = ['pdf', 'word', 'ppt', 'csv', 'txt', 'excel', 'html', 'markdown', 'json', 'archive', 'url']
 
 # 파일 확장자 매핑
 FILE_EXTENSIONS = {
@@ -156,5 +327,62 @@ FILE_EXTENSIONS = {
     'ppt': ['.ppt', '.pptx'],
     'csv': ['.csv'],
     'txt': ['.txt'],
-    'excel': ['.xls', '.xlsx']
-}
\ No newline at end of file
+    'excel': ['.xls', '.xlsx'],
+    'html': ['.html', '.htm'],
+    'markdown': ['.md', '.markdown'],
+    'json': ['.json'],
+    'archive': ['.zip', '.tar', '.tgz']
+}
+
+# 확장자 -> 파일 타입 매핑
+EXTENSION_MAP = {
+    '.pdf': 'pdf',
+    '.doc': 'word',
+    '.docx': 'word',
+    '.ppt': 'ppt',
+    '.pptx': 'ppt',
+    '.csv': 'csv',
+    '.txt': 'txt',
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+    '.html': 'html',
+    '.htm': 'html',
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    '.json': 'json',
+    '.zip': 'archive',
+    '.tar': 'archive',
+    '.tgz': 'archive'
+}
+
+# MIME 타입 -> 파일 타입 매핑
+MIME_MAP = {
+    'application/pdf': 'pdf',
+    'application/msword': 'word',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'word',
+    'application/vnd.ms-powerpoint': 'ppt',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': 'ppt',
+    'text/csv': 'csv',
+    'application/csv': 'csv',
+    'text/plain': 'txt',
+    'application/vnd.ms-excel': 'excel',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'excel',
+    'text/html': 'html',
+    'application/xhtml+xml': 'html',
+    'text/markdown': 'markdown',
+    'application/json': 'json',
+    'application/zip': 'archive',
+    'application/x-tar': 'archive'
+}
+
+# 확장자가 두 부분으로 된 압축 TAR 파일
+COMPRESSED_TAR_SUFFIXES = ('.tar.gz', '.tar.bz2', '.tar.xz')
+
+# 확장자보다 파일 내용 판단을 우선하는 타입 (deep 감지)
+CONTENT_AUTHORITATIVE_TYPES = ('pdf', 'word', 'ppt', 'excel', 'archive')
+
+# 파일 타입 감지 캐시 ((경로, 크기, 수정 시각) -> 파일 타입)
+DETECTION_CACHE_SIZE = 100000
+SIGNATURE_BATCH_SIZE = 256
+_DETECTION_CACHE = {}
+_CACHE_LOCK = threading.Lock()
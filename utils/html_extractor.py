@@ -7,41 +7,65 @@ readability 알고리즘을 사용하여 광고, 메뉴 등을 제거하고 순
 
 import re
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional, List, Tuple
+from bs4 import BeautifulSoup, NavigableString, Tag
+from typing import Optional, List, Tuple, NamedTuple, Callable
 from .encoding_utils import detect_and_decode, fix_encoding_issues
 
 
-def extract_html_content(url: str, encoding: Optional[str] = None) -> str:
+class NodeStats(NamedTuple):
+    """요소 하나의 텍스트 통계 (점수 계산용)"""
+    text_length: int
+    punctuation_count: int
+    link_count: int
+
+
+class HtmlBackend(NamedTuple):
+    """HTML 추출 백엔드 (트리 구현별 함수 묶음)"""
+    name: str
+    parse: Callable[[str], object]
+    prune: Callable[[object], None]
+    score: Callable[[object], List[Tuple[float, object, NodeStats]]]
+    element_text: Callable[[object], str]
+    select_one: Callable[[object, str], object]
+    node_info: Callable[[object], Tuple[str, str, List[str], object, int]]
+
+
+def extract_html_content(url: str, encoding: Optional[str] = None, backend: Optional[str] = None,
+                         stream: bool = False, max_bytes: Optional[int] = None,
+                         template_cache=None, max_length: int = 3000) -> str:
     """
     URL에서 스마트 추출 방법으로 본문 내용을 추출하는 함수 (readability 알고리즘 유사)
     
     Args:
         url (str): 추출할 웹페이지 URL
         encoding (str, optional): 강제할 인코딩
+        backend (str, optional): HTML 추출 백엔드 ('lxml' 또는 'bs4'). 기본값은 lxml 후 bs4
+        stream (bool): 스트리밍 모드 사용 여부. 응답을 청크 단위로 받아 점진적으로 파싱하고,
+            바이너리 응답이거나 충분한 본문이 모이면 다운로드를 중단합니다 (항상 lxml 백엔드 사용)
+        max_bytes (int, optional): 스트리밍 모드에서 받을 최대 바이트 수 (기본값 DEFAULT_MAX_FETCH_BYTES)
+        template_cache (DomainTemplateCache, optional): 도메인별 본문 위치 템플릿 캐시.
+            지정하면 학습된 도메인은 점수 계산 없이 템플릿 선택자로 바로 추출합니다
+        max_length (int): 최대 텍스트 길이 (본문이 이만큼 모이면 추출 중단)
         
     Returns:
         str: 추출된 본문 텍스트
+        
+    Raises:
+        ValueError: stream=True와 함께 lxml이 아닌 백엔드를 지정한 경우
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Cache-Control': 'no-cache',
-        'Connection': 'keep-alive',
-        'DNT': '1',
-        'Pragma': 'no-cache',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Upgrade-Insecure-Requests': '1'
-    }
+    if stream and backend not in (None, 'lxml'):
+        raise ValueError(f"스트리밍 모드는 lxml 백엔드만 지원합니다: {backend}")
+    if max_bytes is None:
+        max_bytes = DEFAULT_MAX_FETCH_BYTES
     
     try:
         # Session 사용으로 쿠키 및 연결 관리
         session = requests.Session()
-        session.headers.update(headers)
+        session.headers.update(REQUEST_HEADERS)
+        
+        if stream:
+            return _extract_html_streaming(session, url, encoding, max_bytes, max_length,
+                                           template_cache=template_cache)
         
         response = session.get(url, timeout=20, allow_redirects=True)
         response.raise_for_status()
@@ -53,33 +77,224 @@ def extract_html_content(url: str, encoding: Optional[str] = None) -> str:
         print(f"URL 요청 실패: {e}")
         return ""
     
-    # 여러 파서 시도
-    parsers = ['html.parser', 'lxml', 'html5lib']
-    soup = None
+    return extract_content_from_html(html_content, backend=backend, max_length=max_length, url=url,
+                                     template_cache=template_cache)
+
+
+def _extract_html_streaming(session: requests.Session, url: str, encoding: Optional[str],
+                            max_bytes: int, max_length: int = 3000, template_cache=None) -> str:
+    """
+    스트리밍으로 받은 HTML에서 본문 내용을 추출하는 함수
     
-    for parser in parsers:
+    Args:
+        session (requests.Session): 요청에 사용할 세션
+        url (str): 웹페이지 URL
+        encoding (str, optional): 강제할 인코딩
+        max_bytes (int): 받을 최대 바이트 수
+        max_length (int): 최대 텍스트 길이
+        template_cache (DomainTemplateCache, optional): 도메인별 본문 위치 템플릿 캐시
+        
+    Returns:
+        str: 추출된 본문 텍스트 (바이너리 응답이면 빈 문자열)
+    """
+    from .html_stream import fetch_html_tree
+    from .lxml_extractor import LXML_BACKEND
+    
+    root = fetch_html_tree(session, url, encoding, max_bytes,
+                           early_stop_chars=max_length * EARLY_STOP_FACTOR)
+    if root is None:
+        return ""
+    
+    main_texts = _extract_from_tree(LXML_BACKEND, root, max_length, url, template_cache)
+    
+    # 텍스트 정리 및 인코딩 문제 해결
+    result_text = clean_extracted_text('\n\n'.join(main_texts))
+    return fix_encoding_issues(result_text)
+
+
+def extract_content_from_html(html_content: str, backend: Optional[str] = None,
+                              max_length: int = 3000, url: Optional[str] = None,
+                              template_cache=None) -> str:
+    """
+    이미 받아온 HTML 문자열에서 본문 내용을 추출하는 함수
+    
+    backend를 지정하지 않으면 DEFAULT_HTML_BACKENDS 순서대로 시도하며,
+    앞의 백엔드가 실패하면 다음 백엔드(BeautifulSoup)로 넘어갑니다.
+    
+    Args:
+        html_content (str): HTML 문자열
+        backend (str, optional): 사용할 백엔드 이름 ('lxml' 또는 'bs4')
+        max_length (int): 최대 텍스트 길이
+        url (str, optional): 페이지 URL (템플릿 캐시의 도메인 키로 사용)
+        template_cache (DomainTemplateCache, optional): 도메인별 본문 위치 템플릿 캐시
+        
+    Returns:
+        str: 추출된 본문 텍스트
+    """
+    backend_names = [backend] if backend else DEFAULT_HTML_BACKENDS
+    
+    for name in backend_names:
+        try:
+            html_backend = get_html_backend(name)
+        except ImportError as e:
+            print(f"{name} 백엔드를 불러올 수 없습니다: {e}")
+            continue
+        
         try:
-            soup = BeautifulSoup(html_content, parser)
+            main_texts = _run_backend(html_backend, html_content, max_length, url, template_cache)
             break
-        except:
+        except Exception as e:
+            print(f"{name} 백엔드로 HTML 처리 실패: {e}")
             continue
-    
-    if not soup:
+    else:
         print("HTML 파싱 실패")
         return ""
     
+    # 텍스트 정리 및 인코딩 문제 해결
+    result_text = clean_extracted_text('\n\n'.join(main_texts))
+    return fix_encoding_issues(result_text)
+
+
+def get_html_backend(name: str) -> HtmlBackend:
+    """
+    이름으로 HTML 추출 백엔드를 가져오는 함수
+    
+    Args:
+        name (str): 백엔드 이름 ('lxml' 또는 'bs4')
+        
+    Returns:
+        HtmlBackend: 파싱, 정리, 점수 계산, 텍스트 추출 함수 묶음
+        
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    if name == 'bs4':
+        return HtmlBackend(
+            name='bs4',
+            parse=_parse_with_bs4,
+            prune=_remove_unwanted_elements,
+            score=_score_content_elements,
+            element_text=_element_text,
+            select_one=_select_one,
+            node_info=_node_info,
+        )
+    elif name == 'lxml':
+        # lxml 백엔드는 필요할 때만 import
+        from .lxml_extractor import LXML_BACKEND
+        return LXML_BACKEND
+    else:
+        raise ValueError(f"지원하지 않는 HTML 백엔드입니다: {name}")
+
+
+def _run_backend(html_backend: HtmlBackend, html_content: str, max_length: int,
+                 url: Optional[str] = None, template_cache=None) -> List[str]:
+    """
+    백엔드 하나로 파싱부터 상위 텍스트 선택까지 수행
+    
+    Args:
+        html_backend (HtmlBackend): 사용할 백엔드
+        html_content (str): HTML 문자열
+        max_length (int): 최대 텍스트 길이
+        url (str, optional): 페이지 URL (템플릿 캐시의 도메인 키)
+        template_cache (DomainTemplateCache, optional): 도메인별 본문 위치 템플릿 캐시
+        
+    Returns:
+        List[str]: 추출된 텍스트 리스트
+    """
+    root = html_backend.parse(html_content)
+    return _extract_from_tree(html_backend, root, max_length, url, template_cache)
+
+
+def _extract_from_tree(html_backend: HtmlBackend, root, max_length: int,
+                       url: Optional[str] = None, template_cache=None) -> List[str]:
+    """
+    이미 파싱된 트리에서 불필요한 요소 제거, 점수 계산, 상위 텍스트 선택 수행
+    
+    템플릿 캐시에 학습된 도메인이면 먼저 템플릿 선택자로 본문을 바로 추출하고,
+    실패하면 전체 점수 계산으로 돌아간 뒤 그 결과를 캐시에 다시 기록합니다.
+    
+    Args:
+        html_backend (HtmlBackend): 트리를 만든 백엔드
+        root: 파싱된 문서 루트
+        max_length (int): 최대 텍스트 길이
+        url (str, optional): 페이지 URL (템플릿 캐시의 도메인 키)
+        template_cache (DomainTemplateCache, optional): 도메인별 본문 위치 템플릿 캐시
+        
+    Returns:
+        List[str]: 추출된 텍스트 리스트
+    """
+    domain = None
+    if template_cache is not None and url:
+        from .html_templates import extract_with_template, build_selector_path, get_domain
+        
+        domain = get_domain(url)
+        selector = template_cache.lookup(domain)
+        if selector:
+            text = extract_with_template(html_backend, root, selector)
+            if text:
+                template_cache.record_hit(domain)
+                return [text[:max_length]]
+            template_cache.record_miss(domain)
+    
     # 불필요한 태그들 제거
-    _remove_unwanted_elements(soup)
+    html_backend.prune(root)
     
     # 각 요소의 점수 계산 (readability 알고리즘)
-    scored_elements = _score_content_elements(soup)
+    scored_elements = html_backend.score(root)
+    
+    # 가장 점수가 높은 요소의 위치를 템플릿 후보로 기록
+    if domain and scored_elements:
+        selector = build_selector_path(html_backend, root, scored_elements[0][1])
+        if selector:
+            template_cache.observe(domain, selector)
     
     # 상위 요소들의 텍스트 합치기
-    main_texts = _extract_top_content(scored_elements)
+    return _extract_top_content(scored_elements, max_length, html_backend.element_text)
+
+
+def _parse_with_bs4(html_content: str) -> BeautifulSoup:
+    """
+    여러 파서를 차례로 시도하여 BeautifulSoup 객체 생성
     
-    # 텍스트 정리 및 인코딩 문제 해결
-    result_text = clean_extracted_text('\n\n'.join(main_texts))
-    return fix_encoding_issues(result_text)
+    Args:
+        html_content (str): HTML 문자열
+        
+    Returns:
+        BeautifulSoup: 파싱된 객체
+        
+    Raises:
+        ValueError: 모든 파서가 실패한 경우
+    """
+    parsers = ['html.parser', 'lxml', 'html5lib']
+    
+    for parser in parsers:
+        try:
+            return BeautifulSoup(html_content, parser)
+        except:
+            continue
+    
+    raise ValueError("BeautifulSoup 파싱 실패")
+
+
+def _element_text(element) -> str:
+    """BeautifulSoup 요소의 텍스트 (공백 제거)"""
+    return element.get_text(strip=True)
+
+
+def _select_one(soup: BeautifulSoup, selector: str):
+    """CSS 선택자와 일치하는 첫 번째 요소 (없으면 None)"""
+    return soup.select_one(selector)
+
+
+def _node_info(element) -> Tuple[str, str, List[str], object, int]:
+    """
+    선택자 경로 생성을 위한 BeautifulSoup 요소 정보
+    
+    Returns:
+        Tuple: (태그명, id, 클래스 리스트, 부모 요소, 같은 태그 형제 중 순서(1부터))
+    """
+    nth_of_type = sum(1 for _ in element.find_previous_siblings(element.name)) + 1
+    return element.name, element.get('id', ''), element.get('class', []), element.parent, nth_of_type
 
 
 def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
@@ -90,25 +305,12 @@ def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
         soup (BeautifulSoup): BeautifulSoup 객체
     """
     # 불필요한 태그들 제거
-    remove_tags = [
-        'script', 'style', 'nav', 'header', 'footer', 'aside',
-        'iframe', 'noscript', 'form', 'button', 'input',
-        'select', 'textarea', 'option', 'meta', 'link',
-        'advertisement', 'ads', 'popup', 'modal'
-    ]
-    
-    for tag in remove_tags:
+    for tag in REMOVE_TAGS:
         for element in soup.find_all(tag):
             element.decompose()
     
     # 클래스나 ID로 불필요한 요소 제거
-    unwanted_patterns = [
-        'nav', 'menu', 'sidebar', 'footer', 'header', 'ad',
-        'advertisement', 'banner', 'popup', 'modal', 'comment',
-        'social', 'share', 'related', 'recommend', 'widget'
-    ]
-    
-    for pattern in unwanted_patterns:
+    for pattern in UNWANTED_PATTERNS:
         # 클래스명에 패턴이 포함된 요소 제거
         for element in soup.find_all(class_=re.compile(pattern, re.I)):
             element.decompose()
@@ -117,51 +319,105 @@ def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
             element.decompose()
 
 
-def _score_content_elements(soup: BeautifulSoup) -> List[Tuple[float, object, str]]:
+def _score_content_elements(soup: BeautifulSoup) -> List[Tuple[float, object, NodeStats]]:
     """
     각 요소의 본문 가능성 점수를 계산하는 함수
     
+    트리를 한 번만 후위 순회하면서 모든 노드의 텍스트 길이, 문장 부호 수,
+    링크 수를 자식에서 부모로 누적합니다. 요소마다 get_text/find_all을
+    다시 호출하지 않으므로 깊게 중첩된 문서에서도 선형 시간에 동작하며,
+    텍스트는 _extract_top_content에서 선택된 요소에 대해서만 생성됩니다.
+    
     Args:
         soup (BeautifulSoup): BeautifulSoup 객체
         
     Returns:
-        List[Tuple[float, object, str]]: (점수, 요소, 텍스트) 튜플 리스트
+        List[Tuple[float, object, NodeStats]]: (점수, 요소, 통계) 튜플 리스트
     """
     scored_elements = []
     
-    for element in soup.find_all(['p', 'div', 'article', 'section']):
-        text = element.get_text(strip=True)
-        if not text:
-            continue
-            
-        score = calculate_content_score(element, text)
+    for element, stats in _collect_node_stats(soup):
+        score = _score_from_stats(' '.join(element.get('class', [])), element.get('id', ''), stats)
         if score > 0:
-            scored_elements.append((score, element, text))
+            scored_elements.append((score, element, stats))
     
-    # 점수순으로 정렬
+    # 점수순으로 정렬 (동점이면 문서 순서 유지)
     scored_elements.sort(key=lambda x: x[0], reverse=True)
     return scored_elements
 
 
-def _extract_top_content(scored_elements: List[Tuple[float, object, str]], max_length: int = 3000) -> List[str]:
+def _collect_node_stats(soup: BeautifulSoup) -> List[Tuple[object, NodeStats]]:
+    """
+    후위 순회 한 번으로 후보 요소들의 통계를 계산하는 함수
+    
+    Args:
+        soup (BeautifulSoup): BeautifulSoup 객체
+        
+    Returns:
+        List[Tuple[object, NodeStats]]: 문서 순서의 (요소, 통계) 리스트 (텍스트가 없는 요소 제외)
+    """
+    slots = []
+    # 스택 프레임: [요소, 자식 이터레이터, 누적값(텍스트 길이, 문장 부호 수, 링크 수), 결과 슬롯]
+    stack = [[soup, iter(soup.contents), [0, 0, 0], None]]
+    
+    while stack:
+        frame = stack[-1]
+        child = next(frame[1], None)
+        
+        if child is None:
+            # 모든 자식 처리 완료: 부모에게 누적값 전달
+            stack.pop()
+            element, _, acc, slot = frame
+            if slot is not None and acc[0] > 0:
+                slots[slot] = (element, NodeStats(acc[0], acc[1], acc[2]))
+            if stack:
+                parent_acc = stack[-1][2]
+                parent_acc[0] += acc[0]
+                parent_acc[1] += acc[1]
+                parent_acc[2] += acc[2] + (1 if element.name == 'a' else 0)
+            continue
+        
+        if isinstance(child, Tag):
+            slot = None
+            if child.name in CANDIDATE_TAGS:
+                # 동점 요소의 순서를 기존과 같게 하기 위해 문서 순서로 자리 확보
+                slot = len(slots)
+                slots.append(None)
+            stack.append([child, iter(child.contents), [0, 0, 0], slot])
+        elif type(child) is NavigableString:
+            # get_text(strip=True)와 동일하게 주석 등은 제외하고 공백을 제거한 길이만 계산
+            stripped = child.strip()
+            if stripped:
+                acc = frame[2]
+                acc[0] += len(stripped)
+                acc[1] += stripped.count('.') + stripped.count('!') + stripped.count('?')
+    
+    return [entry for entry in slots if entry is not None]
+
+
+def _extract_top_content(scored_elements: List[Tuple[float, object, NodeStats]], max_length: int = 3000,
+                         element_text: Callable[[object], str] = None) -> List[str]:
     """
     상위 점수 요소들의 텍스트를 추출하는 함수
     
     Args:
-        scored_elements (List[Tuple[float, object, str]]): 점수가 매겨진 요소들
+        scored_elements (List[Tuple[float, object, NodeStats]]): 점수가 매겨진 요소들
         max_length (int): 최대 텍스트 길이
+        element_text (Callable, optional): 요소에서 텍스트를 꺼내는 함수. 기본값은 BeautifulSoup용
         
     Returns:
         List[str]: 추출된 텍스트 리스트
     """
+    element_text = element_text or _element_text
     main_texts = []
     total_length = 0
     
-    for score, element, text in scored_elements:
+    for score, element, stats in scored_elements:
         if total_length > max_length:  # 충분한 텍스트가 모이면 중단
             break
-        main_texts.append(text)
-        total_length += len(text)
+        # 선택된 요소에 대해서만 텍스트 생성
+        main_texts.append(element_text(element))
+        total_length += stats.text_length
     
     return main_texts
 
@@ -174,39 +430,55 @@ def calculate_content_score(element, text: str) -> float:
         element: BeautifulSoup 요소
         text (str): 요소의 텍스트 내용
         
+    Returns:
+        float: 본문 가능성 점수
+    """
+    stats = NodeStats(
+        text_length=len(text),
+        punctuation_count=len(re.findall(r'[.!?]', text)),
+        link_count=len(element.find_all('a'))
+    )
+    return _score_from_stats(' '.join(element.get('class', [])), element.get('id', ''), stats)
+
+
+def _score_from_stats(class_names: str, id_name: str, stats: NodeStats) -> float:
+    """
+    미리 계산된 통계로 요소의 본문 가능성 점수 계산
+    
+    Args:
+        class_names (str): 요소의 class 속성 (공백으로 구분)
+        id_name (str): 요소의 id 속성
+        stats (NodeStats): 요소의 텍스트 통계
+        
     Returns:
         float: 본문 가능성 점수
     """
     score = 0.0
     
     # 텍스트 길이에 따른 점수
-    text_length = len(text)
+    text_length = stats.text_length
     if text_length > 50:
         score += min(text_length / 100, 5)
     
     # 문장 부호가 많으면 본문일 가능성 증가
-    punctuation_count = len(re.findall(r'[.!?]', text))
-    score += punctuation_count * 0.5
+    score += stats.punctuation_count * 0.5
     
     # 클래스명이나 ID로 점수 조정
-    class_names = ' '.join(element.get('class', []))
-    id_name = element.get('id', '')
+    class_names = class_names.lower()
+    id_name = id_name.lower()
     
     # 본문을 나타내는 키워드
-    content_keywords = ['content', 'article', 'post', 'main', 'body', 'text', 'story']
-    for keyword in content_keywords:
-        if keyword in class_names.lower() or keyword in id_name.lower():
+    for keyword in CONTENT_KEYWORDS:
+        if keyword in class_names or keyword in id_name:
             score += 2
     
     # 불필요한 요소를 나타내는 키워드
-    unwanted_keywords = ['nav', 'menu', 'sidebar', 'footer', 'header', 'ad', 'comment', 'widget']
-    for keyword in unwanted_keywords:
-        if keyword in class_names.lower() or keyword in id_name.lower():
+    for keyword in UNWANTED_KEYWORDS:
+        if keyword in class_names or keyword in id_name:
             score -= 3
     
     # 링크가 많으면 메뉴나 네비게이션일 가능성
-    links = element.find_all('a')
-    if len(links) > text_length / 100:  # 텍스트 대비 링크가 많으면
+    if stats.link_count > text_length / 100:  # 텍스트 대비 링크가 많으면
         score -= 2
     
     return max(0, score)
@@ -330,10 +602,36 @@ def extract_basic_content(url: str) -> str:
 
 
 # 상수들
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    'DNT': '1',
+    'Pragma': 'no-cache',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Upgrade-Insecure-Requests': '1'
+}
 DEFAULT_MAX_CONTENT_LENGTH = 3000
 MIN_TEXT_LENGTH_FOR_CONTENT = 10
 CONTENT_KEYWORDS = ['content', 'article', 'post', 'main', 'body', 'text', 'story']
 UNWANTED_KEYWORDS = ['nav', 'menu', 'sidebar', 'footer', 'header', 'ad', 'comment', 'widget']
+CANDIDATE_TAGS = ('p', 'div', 'article', 'section')
+REMOVE_TAGS = [
+    'script', 'style', 'nav', 'header', 'footer', 'aside',
+    'iframe', 'noscript', 'form', 'button', 'input',
+    'select', 'textarea', 'option', 'meta', 'link',
+    'advertisement', 'ads', 'popup', 'modal'
+]
+UNWANTED_PATTERNS = [
+    'nav', 'menu', 'sidebar', 'footer', 'header', 'ad',
+    'advertisement', 'banner', 'popup', 'modal', 'comment',
+    'social', 'share', 'related', 'recommend', 'widget'
+]
 CONTENT_SELECTORS = [
     'article',
     '.content', '.main-content', '.post-content', '.entry-content',
@@ -342,4 +640,11 @@ CONTENT_SELECTORS = [
     'main', '.main', '#main',
     '.post-body', '.entry-body', '.article-body',
     '.news-content', '.blog-content'
-]
\ No newline at end of file
+]
+
+# HTML 추출 백엔드 (앞에서부터 시도)
+DEFAULT_HTML_BACKENDS = ['lxml', 'bs4']
+
+# 스트리밍 모드 설정
+DEFAULT_MAX_FETCH_BYTES = 5 * 1024 * 1024
+EARLY_STOP_FACTOR = 2  # 최대 텍스트 길이의 몇 배만큼 고득점 본문이 모이면 다운로드 중단
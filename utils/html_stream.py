@@ -0,0 +1,162 @@
+"""
+스트리밍 HTML 가져오기 모듈
+
+응답 본문 전체를 메모리에 올리지 않고 청크 단위로 받아 lxml 풀 파서에 넘깁니다.
+첫 청크로 바이너리 여부를 판단하고, 최대 바이트 수를 넘거나 점수가 높은 본문이
+충분히 모이면 다운로드를 중단합니다.
+"""
+
+import codecs
+import requests
+from typing import Optional
+from lxml import etree
+import lxml.html
+
+from .encoding_utils import detect_html_encoding
+from .html_extractor import DEFAULT_MAX_FETCH_BYTES, NodeStats, _score_from_stats
+from .lxml_extractor import _element_text_lxml, _UNWANTED_PATTERN_RE
+
+
+def fetch_html_tree(session: requests.Session, url: str, forced_encoding: Optional[str] = None,
+                    max_bytes: int = DEFAULT_MAX_FETCH_BYTES, early_stop_chars: int = 6000,
+                    chunk_size: int = 16384):
+    """
+    URL을 스트리밍으로 받아 점진적으로 파싱한 lxml 트리를 반환하는 함수
+    
+    Args:
+        session (requests.Session): 요청에 사용할 세션
+        url (str): 웹페이지 URL
+        forced_encoding (str, optional): 강제할 인코딩
+        max_bytes (int): 받을 최대 바이트 수 (초과분은 버림)
+        early_stop_chars (int): 고득점 문단이 이만큼 모이면 다운로드 중단 (0이면 끝까지 받음)
+        chunk_size (int): 청크 크기
+        
+    Returns:
+        lxml 루트 요소. 요청 실패, 바이너리 응답, 빈 문서이면 None
+    """
+    try:
+        response = session.get(url, timeout=20, allow_redirects=True, stream=True)
+    except requests.RequestException as e:
+        print(f"URL 요청 실패: {e}")
+        return None
+    
+    try:
+        response.raise_for_status()
+        content_type = response.headers.get('content-type', '')
+        chunks = response.iter_content(chunk_size=chunk_size)
+        
+        first_chunk = next(chunks, b'')
+        if not first_chunk:
+            return None
+        
+        # 첫 청크로 바이너리 응답 판별
+        if is_binary_content(first_chunk, content_type):
+            print(f"HTML이 아닌 응답이므로 건너뜁니다: {url} ({content_type or '알 수 없는 형식'})")
+            return None
+        
+        # 첫 청크로 인코딩을 정하고 이후는 점진적으로 디코딩
+        encoding = detect_html_encoding(first_chunk, content_type, forced_encoding)
+        decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+        parser = etree.HTMLPullParser(events=('end',), tag='p')
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        
+        received = 0
+        content_chars = 0
+        chunk = first_chunk
+        while chunk:
+            if received + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - received]
+                print(f"최대 크기({max_bytes} 바이트)를 넘어 다운로드를 중단합니다: {url}")
+            received += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            
+            # 닫힌 문단들 중 본문으로 보이는 것의 길이 누적
+            for _, paragraph in parser.read_events():
+                content_chars += _high_scoring_length(paragraph)
+            
+            if received >= max_bytes or (early_stop_chars and content_chars >= early_stop_chars):
+                break
+            chunk = next(chunks, b'')
+        
+        parser.feed(decoder.decode(b'', final=True))
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            return None
+            
+    except requests.RequestException as e:
+        print(f"URL 요청 실패: {e}")
+        return None
+    finally:
+        # 남은 본문을 받지 않고 연결 종료
+        response.close()
+
+
+def is_binary_content(head: bytes, content_type: str = '') -> bool:
+    """
+    응답의 첫 부분과 Content-Type으로 HTML/텍스트가 아닌 응답인지 판단
+    
+    Args:
+        head (bytes): 응답 본문의 앞부분
+        content_type (str): Content-Type 헤더 값
+        
+    Returns:
+        bool: 바이너리 응답이면 True
+    """
+    mime_type = content_type.split(';')[0].strip().lower()
+    if mime_type and not (mime_type.startswith('text/') or mime_type in TEXT_MIME_TYPES):
+        return True
+    
+    if head.startswith(BINARY_SIGNATURES):
+        return True
+    
+    # UTF-16 BOM이 없는데 NUL 바이트가 있으면 바이너리
+    sample = head[:1024]
+    if sample.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return False
+    return b'\x00' in sample
+
+
+def _high_scoring_length(paragraph) -> int:
+    """
+    닫힌 문단이 본문으로 보이면 그 텍스트 길이를, 아니면 0을 반환
+    
+    Args:
+        paragraph: 파싱이 끝난 p 요소
+        
+    Returns:
+        int: 본문으로 인정된 텍스트 길이
+    """
+    text = _element_text_lxml(paragraph)
+    if not text:
+        return 0
+    
+    stats = NodeStats(
+        text_length=len(text),
+        punctuation_count=text.count('.') + text.count('!') + text.count('?'),
+        link_count=sum(1 for _ in paragraph.iter('a'))
+    )
+    if _score_from_stats(paragraph.get('class', ''), paragraph.get('id', ''), stats) < EARLY_STOP_MIN_SCORE:
+        return 0
+    
+    # 나중에 제거될 영역(메뉴, 광고 등) 안의 문단은 제외
+    for ancestor in paragraph.iterancestors():
+        if ancestor.tag in UNWANTED_ANCESTOR_TAGS:
+            return 0
+        if (_UNWANTED_PATTERN_RE.search(ancestor.get('class', ''))
+                or _UNWANTED_PATTERN_RE.search(ancestor.get('id', ''))):
+            return 0
+    
+    return stats.text_length
+
+
+# 상수들
+TEXT_MIME_TYPES = (
+    'application/xhtml+xml', 'application/xml', 'application/rss+xml', 'application/atom+xml'
+)
+BINARY_SIGNATURES = (
+    b'%PDF', b'PK\x03\x04', b'\xd0\xcf\x11\xe0', b'\x89PNG', b'GIF8', b'\xff\xd8\xff',
+    b'\x1f\x8b', b'BZh', b'7z\xbc\xaf', b'Rar!', b'ID3', b'OggS', b'RIFF', b'\x00\x00\x00'
+)
+UNWANTED_ANCESTOR_TAGS = ('nav', 'header', 'footer', 'aside', 'form')
+EARLY_STOP_MIN_SCORE = 2.0
@@ -0,0 +1,248 @@
+"""
+도메인별 본문 추출 템플릿 모듈
+
+같은 사이트를 반복해서 크롤링할 때 매번 전체 정리/점수 계산을 하지 않도록,
+점수 계산에서 선택된 본문 컨테이너의 선택자 경로를 도메인별로 학습합니다.
+여러 페이지에서 같은 선택자가 연속으로 나오면 템플릿으로 확정하고, 이후 페이지는
+select_one으로 바로 본문을 추출합니다. 템플릿이 맞지 않으면 전체 점수 계산으로 돌아갑니다.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlparse
+
+from .html_extractor import HtmlBackend, CONTENT_SELECTORS, clean_extracted_text
+from .metrics import CACHE_REQUESTS
+
+
+class DomainTemplateCache:
+    """
+    도메인별 본문 선택자 템플릿 캐시
+    
+    Args:
+        min_consistent_pages (int): 템플릿으로 확정하기 위해 연속으로 같은 선택자가 나와야 하는 페이지 수
+        max_domains (int): 보관할 최대 도메인 수 (초과 시 가장 오래 사용하지 않은 도메인 제거)
+        max_misses (int): 템플릿이 연속으로 이만큼 실패하면 템플릿을 폐기하고 다시 학습
+    """
+    
+    def __init__(self, min_consistent_pages: int = 3, max_domains: int = 1000, max_misses: int = 3):
+        self.min_consistent_pages = min_consistent_pages
+        self.max_domains = max_domains
+        self.max_misses = max_misses
+        # 도메인 -> {'selector', 'count', 'template', 'misses'}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'lookups': 0, 'hits': 0, 'misses': 0, 'learned': 0, 'invalidated': 0, 'evictions': 0}
+    
+    def lookup(self, domain: str) -> Optional[str]:
+        """
+        도메인의 확정된 템플릿 선택자를 반환
+        
+        Args:
+            domain (str): 도메인
+            
+        Returns:
+            str: 템플릿 선택자 (아직 학습되지 않았으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            self._entries.move_to_end(domain)
+            if entry['template']:
+                self._stats['lookups'] += 1
+            return entry['template']
+    
+    def record_hit(self, domain: str) -> None:
+        """템플릿으로 본문 추출에 성공했음을 기록"""
+        CACHE_REQUESTS.inc('html_template', 'hit')
+        with self._lock:
+            self._stats['hits'] += 1
+            entry = self._entries.get(domain)
+            if entry is not None:
+                entry['misses'] = 0
+    
+    def record_miss(self, domain: str) -> None:
+        """템플릿으로 본문 추출에 실패했음을 기록 (연속 실패 시 템플릿 폐기)"""
+        CACHE_REQUESTS.inc('html_template', 'miss')
+        with self._lock:
+            self._stats['misses'] += 1
+            entry = self._entries.get(domain)
+            if entry is None:
+                return
+            entry['misses'] += 1
+            if entry['misses'] >= self.max_misses:
+                entry.update(template=None, selector=None, count=0, misses=0)
+                self._stats['invalidated'] += 1
+    
+    def observe(self, domain: str, selector: str) -> None:
+        """
+        전체 점수 계산에서 선택된 본문 컨테이너의 선택자를 기록
+        
+        Args:
+            domain (str): 도메인
+            selector (str): 본문 컨테이너의 선택자 경로
+        """
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                entry = {'selector': None, 'count': 0, 'template': None, 'misses': 0}
+                self._entries[domain] = entry
+                self._evict_if_needed()
+            else:
+                self._entries.move_to_end(domain)
+            
+            if entry['selector'] == selector:
+                entry['count'] += 1
+            else:
+                entry['selector'] = selector
+                entry['count'] = 1
+            
+            if entry['count'] >= self.min_consistent_pages and entry['template'] != selector:
+                entry['template'] = selector
+                entry['misses'] = 0
+                self._stats['learned'] += 1
+    
+    def invalidate(self, domain: str) -> None:
+        """도메인의 템플릿과 학습 기록을 삭제"""
+        with self._lock:
+            self._entries.pop(domain, None)
+    
+    def get_template(self, domain: str) -> Optional[str]:
+        """통계에 영향을 주지 않고 도메인의 템플릿 선택자를 반환"""
+        with self._lock:
+            entry = self._entries.get(domain)
+            return entry['template'] if entry else None
+    
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환
+        
+        Returns:
+            dict: 조회/적중/실패 횟수, 적중률, 도메인 및 템플릿 수, 제거 횟수
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['hit_rate'] = stats['hits'] / stats['lookups'] if stats['lookups'] else 0.0
+            stats['domains'] = len(self._entries)
+            stats['templates'] = sum(1 for entry in self._entries.values() if entry['template'])
+            return stats
+    
+    def _evict_if_needed(self) -> None:
+        """최대 도메인 수를 넘으면 가장 오래 사용하지 않은 도메인부터 제거"""
+        while len(self._entries) > self.max_domains:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+
+def get_domain(url: str) -> str:
+    """
+    URL에서 템플릿 캐시 키로 사용할 도메인 추출
+    
+    Args:
+        url (str): 페이지 URL
+        
+    Returns:
+        str: 소문자 도메인 (www. 제외)
+    """
+    netloc = urlparse(url).netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def build_selector_path(html_backend: HtmlBackend, root, element) -> Optional[str]:
+    """
+    본문 컨테이너를 가리키는 선택자 경로를 만드는 함수
+    
+    요소 자신이나 조상 중 CONTENT_SELECTORS와 일치하고 select_one으로 바로 그 요소가
+    선택되는 것이 있으면 그 선택자를 사용하고, 없으면 id가 있는 가장 가까운 조상부터의
+    구조 경로(태그:nth-of-type)를 만듭니다.
+    
+    Args:
+        html_backend (HtmlBackend): 트리를 만든 백엔드
+        root: 문서 루트
+        element: 본문 컨테이너 요소
+        
+    Returns:
+        str: 선택자 경로 (만들 수 없으면 None)
+    """
+    # 1. 일반적인 본문 선택자 확인 (요소 자신과 조상)
+    node = element
+    while node is not None and node is not root:
+        tag, id_name, classes, parent, _ = html_backend.node_info(node)
+        for selector in CONTENT_SELECTORS:
+            if _matches_simple_selector(selector, tag, id_name, classes) \
+                    and html_backend.select_one(root, selector) is node:
+                return selector
+        node = parent
+    
+    # 2. 구조 경로 생성
+    parts = []
+    node = element
+    while node is not None and node is not root:
+        tag, id_name, classes, parent, nth_of_type = html_backend.node_info(node)
+        if not isinstance(tag, str) or tag.startswith('['):
+            break
+        if id_name and _CSS_IDENTIFIER_RE.fullmatch(id_name):
+            parts.append(f'{tag}#{id_name}')
+            break
+        parts.append(f'{tag}:nth-of-type({nth_of_type})' if tag not in ('html', 'body') else tag)
+        node = parent
+    
+    if not parts:
+        return None
+    selector = ' > '.join(reversed(parts))
+    
+    try:
+        if html_backend.select_one(root, selector) is element:
+            return selector
+    except Exception:
+        pass
+    return None
+
+
+def extract_with_template(html_backend: HtmlBackend, root, selector: str,
+                          min_length: int = 200) -> str:
+    """
+    템플릿 선택자로 본문 컨테이너를 찾아 텍스트를 추출하는 함수
+    
+    전체 문서의 점수 계산은 하지 않습니다. 선택자는 불필요한 요소를 제거한 트리에서 학습했으므로
+    문서를 먼저 같은 방법으로 정리해, 제거될 영역(사이드바, 관련 기사 등) 안의 같은 태그가
+    선택되지 않게 합니다.
+    
+    Args:
+        html_backend (HtmlBackend): 트리를 만든 백엔드
+        root: 문서 루트
+        selector (str): 템플릿 선택자
+        min_length (int): 템플릿 결과로 인정할 최소 텍스트 길이
+        
+    Returns:
+        str: 추출된 텍스트 (컨테이너가 없거나 너무 짧으면 빈 문자열)
+    """
+    html_backend.prune(root)
+    
+    try:
+        container = html_backend.select_one(root, selector)
+    except Exception:
+        return ""
+    if container is None:
+        return ""
+    
+    text = html_backend.element_text(container)
+    if len(clean_extracted_text(text)) < min_length:
+        return ""
+    return text
+
+
+def _matches_simple_selector(selector: str, tag: str, id_name: str, classes: list) -> bool:
+    """요소가 단순 선택자('tag', '.class', '#id')와 일치하는지 확인"""
+    if selector.startswith('.'):
+        return selector[1:] in classes
+    if selector.startswith('#'):
+        return selector[1:] == id_name
+    return selector == tag
+
+
+# 상수들
+_CSS_IDENTIFIER_RE = re.compile(r'[A-Za-z][\w-]*')
@@ -0,0 +1,201 @@
+"""
+lxml 기반 HTML 추출 백엔드 모듈
+
+BeautifulSoup 대신 lxml.html 트리에서 직접 불필요한 요소 제거, 점수 계산,
+텍스트 추출을 수행합니다. XPath와 iterwalk 등 C 레벨 순회를 사용하므로
+html.parser 기반 BeautifulSoup보다 빠르게 동작합니다.
+"""
+
+import re
+from typing import List, Tuple
+from lxml import etree
+import lxml.html
+
+from .html_extractor import (
+    HtmlBackend,
+    NodeStats,
+    _score_from_stats,
+    CANDIDATE_TAGS,
+    REMOVE_TAGS,
+    UNWANTED_PATTERNS,
+)
+
+
+def _parse_with_lxml(html_content: str):
+    """
+    HTML 문자열을 lxml.html 트리로 파싱
+    
+    Args:
+        html_content (str): HTML 문자열
+        
+    Returns:
+        lxml.html.HtmlElement: 문서 루트 요소
+    """
+    try:
+        return lxml.html.document_fromstring(html_content)
+    except ValueError:
+        # XML 인코딩 선언이 포함된 문자열은 바이트로 변환하여 다시 파싱
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        return lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+
+
+def _remove_unwanted_elements_lxml(root) -> None:
+    """
+    불필요한 HTML 요소들을 제거하는 함수 (lxml 트리용)
+    
+    Args:
+        root: lxml.html 루트 요소 (또는 정리할 하위 요소)
+    """
+    # 불필요한 태그들 제거 (tail 텍스트는 부모에 남김)
+    for element in root.xpath(_REMOVE_TAGS_XPATH):
+        element.drop_tree()
+    
+    # 클래스나 ID로 불필요한 요소 제거
+    for element in root.xpath('.//*[@class or @id]'):
+        if (_UNWANTED_PATTERN_RE.search(element.get('class', ''))
+                or _UNWANTED_PATTERN_RE.search(element.get('id', ''))):
+            element.drop_tree()
+
+
+def _score_content_elements_lxml(root) -> List[Tuple[float, object, NodeStats]]:
+    """
+    각 요소의 본문 가능성 점수를 계산하는 함수 (lxml 트리용)
+    
+    iterwalk의 start/end 이벤트로 한 번만 순회하며 자식의 통계를 부모에 누적합니다.
+    
+    Args:
+        root: lxml.html 루트 요소
+        
+    Returns:
+        List[Tuple[float, object, NodeStats]]: (점수, 요소, 통계) 튜플 리스트
+    """
+    slots = []
+    # 스택 프레임: [누적값(텍스트 길이, 문장 부호 수, 링크 수), 결과 슬롯]
+    stack = []
+    
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        if event == 'start':
+            acc = [0, 0, 0]
+            _add_text(acc, element.text)
+            # iterwalk는 주석/처리 명령을 건너뛰므로 그 뒤의 텍스트를 직접 더함
+            for child in element.iterchildren(etree.Comment, etree.ProcessingInstruction):
+                _add_text(acc, child.tail)
+            
+            slot = None
+            if element.tag in CANDIDATE_TAGS:
+                slot = len(slots)
+                slots.append(None)
+            stack.append([acc, slot])
+            continue
+        
+        acc, slot = stack.pop()
+        if slot is not None and acc[0] > 0:
+            slots[slot] = (element, NodeStats(acc[0], acc[1], acc[2]))
+        if stack:
+            parent_acc = stack[-1][0]
+            parent_acc[0] += acc[0]
+            parent_acc[1] += acc[1]
+            parent_acc[2] += acc[2] + (1 if element.tag == 'a' else 0)
+            # tail 텍스트는 부모 요소의 텍스트
+            _add_text(parent_acc, element.tail)
+    
+    scored_elements = []
+    for entry in slots:
+        if entry is None:
+            continue
+        element, stats = entry
+        score = _score_from_stats(element.get('class', ''), element.get('id', ''), stats)
+        if score > 0:
+            scored_elements.append((score, element, stats))
+    
+    # 점수순으로 정렬 (동점이면 문서 순서 유지)
+    scored_elements.sort(key=lambda x: x[0], reverse=True)
+    return scored_elements
+
+
+def _add_text(acc: list, text) -> None:
+    """공백을 제거한 텍스트의 길이와 문장 부호 수를 누적값에 더함"""
+    if not text:
+        return
+    stripped = text.strip()
+    if stripped:
+        acc[0] += len(stripped)
+        acc[1] += stripped.count('.') + stripped.count('!') + stripped.count('?')
+
+
+def _element_text_lxml(element) -> str:
+    """lxml 요소의 텍스트 (BeautifulSoup의 get_text(strip=True)와 동일한 형식)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _select_one_lxml(root, selector: str):
+    """
+    CSS 선택자와 일치하는 첫 번째 요소 (없으면 None)
+    
+    템플릿에서 사용하는 단순 선택자(태그, #id, .class, :nth-of-type, '>' 결합)만 지원합니다.
+    """
+    matches = root.xpath(_selector_to_xpath(selector))
+    return matches[0] if matches else None
+
+
+def _node_info_lxml(element) -> Tuple[str, str, List[str], object, int]:
+    """
+    선택자 경로 생성을 위한 lxml 요소 정보
+    
+    Returns:
+        Tuple: (태그명, id, 클래스 리스트, 부모 요소, 같은 태그 형제 중 순서(1부터))
+    """
+    nth_of_type = sum(1 for _ in element.itersiblings(element.tag, preceding=True)) + 1
+    return (element.tag, element.get('id', ''), element.get('class', '').split(),
+            element.getparent(), nth_of_type)
+
+
+def _selector_to_xpath(selector: str) -> str:
+    """
+    단순 CSS 선택자를 XPath로 변환
+    
+    Args:
+        selector (str): 'div#main > article.post:nth-of-type(2)' 형태의 선택자
+        
+    Returns:
+        str: 대응하는 XPath
+        
+    Raises:
+        ValueError: 지원하지 않는 선택자인 경우
+    """
+    steps = []
+    for part in selector.split('>'):
+        match = _SIMPLE_SELECTOR_RE.fullmatch(part.strip())
+        if not match:
+            raise ValueError(f"지원하지 않는 선택자입니다: {selector}")
+        tag, qualifiers, nth = match.group('tag'), match.group('qualifiers'), match.group('nth')
+        
+        step = tag or '*'
+        if nth:
+            step += f'[{int(nth)}]'
+        for kind, name in re.findall(r'([#.])([\w-]+)', qualifiers or ''):
+            if kind == '#':
+                step += f"[@id='{name}']"
+            else:
+                step += f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+        steps.append(step)
+    
+    return '//' + '/'.join(steps)
+
+
+# 상수들
+_REMOVE_TAGS_XPATH = '|'.join(f'.//{tag}' for tag in REMOVE_TAGS)
+_SIMPLE_SELECTOR_RE = re.compile(
+    r'(?P<tag>[a-zA-Z][\w-]*)?(?P<qualifiers>(?:[#.][\w-]+)*)(?::nth-of-type\((?P<nth>\d+)\))?'
+)
+_UNWANTED_PATTERN_RE = re.compile('|'.join(UNWANTED_PATTERNS), re.I)
+
+LXML_BACKEND = HtmlBackend(
+    name='lxml',
+    parse=_parse_with_lxml,
+    prune=_remove_unwanted_elements_lxml,
+    score=_score_content_elements_lxml,
+    element_text=_element_text_lxml,
+    select_one=_select_one_lxml,
+    node_info=_node_info_lxml,
+)
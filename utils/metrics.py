@@ -0,0 +1,290 @@
+"""
+메트릭 모듈
+
+추출 파이프라인의 처리 파일 수, 입출력 크기, 오류, 캐시 적중, 단계별/형식별 처리 시간을
+프로세스 안에서 집계합니다. 집계 결과는 Prometheus 텍스트 형식이나 스냅샷 딕셔너리로
+내보낼 수 있습니다. 기록은 딕셔너리 갱신 한 번이라 처리 경로에 주는 부담이 거의 없고,
+워커 프로세스의 메트릭은 WarmWorkerPool이 작업마다 부모 프로세스의 METRICS로 합칩니다.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Sequence
+
+
+class Counter:
+    """
+    라벨별로 증가만 하는 카운터
+    
+    Args:
+        name (str): 메트릭 이름
+        help_text (str): 설명
+        label_names (Sequence[str]): 라벨 이름들 (inc에 같은 순서로 라벨 값을 전달)
+    """
+    
+    kind = 'counter'
+    
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        # 라벨 값 튜플 -> 누적 값
+        self._values = {}
+    
+    def inc(self, *label_values, amount: float = 1) -> None:
+        """
+        카운터 증가
+        
+        Args:
+            *label_values: 라벨 값들 (label_names 순서)
+            amount (float): 증가량
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+    
+    def value(self, *label_values) -> float:
+        """라벨 값들에 해당하는 현재 값 (기록이 없으면 0)"""
+        with self._lock:
+            return self._values.get(label_values, 0)
+    
+    def _snapshot(self, reset: bool = False) -> list:
+        with self._lock:
+            values = self._values
+            if reset:
+                self._values = {}
+            else:
+                values = dict(values)
+        return [
+            {'labels': dict(zip(self.label_names, key)), 'value': value}
+            for key, value in values.items()
+        ]
+    
+    def _merge(self, samples: list) -> None:
+        with self._lock:
+            for sample in samples:
+                key = tuple(str(sample['labels'].get(name, '')) for name in self.label_names)
+                self._values[key] = self._values.get(key, 0) + sample['value']
+
+
+class Histogram:
+    """
+    라벨별 값 분포 (누적 구간 개수, 합계, 개수)
+    
+    Args:
+        name (str): 메트릭 이름
+        help_text (str): 설명
+        label_names (Sequence[str]): 라벨 이름들
+        buckets (Sequence[float]): 구간 상한값들 (오름차순, +Inf는 자동 추가)
+    """
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = None):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets if buckets is not None else LATENCY_BUCKETS))
+        self._lock = threading.Lock()
+        # 라벨 값 튜플 -> [구간별 개수(마지막은 +Inf), 합계, 개수]
+        self._values = {}
+    
+    def observe(self, value: float, *label_values) -> None:
+        """
+        값 하나를 기록
+        
+        Args:
+            value (float): 관측 값 (처리 시간이면 초 단위)
+            *label_values: 라벨 값들 (label_names 순서)
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+    
+    @contextmanager
+    def time(self, *label_values):
+        """with 블록의 실행 시간을 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *label_values)
+    
+    def _snapshot(self, reset: bool = False) -> list:
+        with self._lock:
+            values = self._values
+            if reset:
+                self._values = {}
+            else:
+                values = {key: [list(counts), total, count] for key, (counts, total, count) in values.items()}
+        return [
+            {'labels': dict(zip(self.label_names, key)), 'buckets': counts, 'sum': total, 'count': count}
+            for key, (counts, total, count) in values.items()
+        ]
+    
+    def _merge(self, samples: list) -> None:
+        with self._lock:
+            for sample in samples:
+                key = tuple(str(sample['labels'].get(name, '')) for name in self.label_names)
+                entry = self._values.get(key)
+                if entry is None:
+                    entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                for index, count in enumerate(sample['buckets'][:len(entry[0])]):
+                    entry[0][index] += count
+                entry[1] += sample['sum']
+                entry[2] += sample['count']
+
+
+class MetricsRegistry:
+    """
+    메트릭 모음 (같은 이름으로 다시 등록하면 기존 메트릭을 반환)
+    
+    Args:
+        namespace (str): Prometheus로 내보낼 때 메트릭 이름 앞에 붙일 접두어
+    """
+    
+    def __init__(self, namespace: str = ''):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._metrics = {}
+    
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        """카운터를 등록하거나 이미 등록된 카운터를 반환"""
+        return self._register(Counter, name, help_text, label_names)
+    
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = None) -> Histogram:
+        """히스토그램을 등록하거나 이미 등록된 히스토그램을 반환"""
+        return self._register(Histogram, name, help_text, label_names, buckets=buckets)
+    
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        현재 값들을 JSON으로 직렬화할 수 있는 딕셔너리로 반환
+        
+        Args:
+            reset (bool): 반환한 값들을 0으로 되돌릴지 여부 (워커에서 변경분만 보낼 때 사용)
+            
+        Returns:
+            dict: {메트릭 이름: {'type', 'help', 'labels', 'samples'}}
+                (히스토그램 샘플의 buckets는 구간별 개수이고 마지막이 +Inf 구간)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        snapshot = {}
+        for metric in metrics:
+            samples = metric._snapshot(reset)
+            entry = {'type': metric.kind, 'help': metric.help_text,
+                     'labels': list(metric.label_names), 'samples': samples}
+            if metric.kind == 'histogram':
+                entry['bucket_bounds'] = list(metric.buckets)
+            snapshot[metric.name] = entry
+        return snapshot
+    
+    def merge(self, snapshot: dict) -> None:
+        """
+        다른 프로세스의 스냅샷 값을 더함 (등록되지 않은 메트릭은 스냅샷 정보로 등록)
+        
+        Args:
+            snapshot (dict): snapshot()이 반환한 딕셔너리
+        """
+        for name, entry in snapshot.items():
+            if not entry['samples']:
+                continue
+            if entry['type'] == 'histogram':
+                metric = self.histogram(name, entry['help'], entry['labels'], entry.get('bucket_bounds'))
+            else:
+                metric = self.counter(name, entry['help'], entry['labels'])
+            metric._merge(entry['samples'])
+    
+    def reset(self) -> None:
+        """모든 값을 0으로 되돌림"""
+        self.snapshot(reset=True)
+    
+    def to_prometheus(self) -> str:
+        """
+        Prometheus 텍스트 형식(0.0.4)으로 내보냄
+        
+        Returns:
+            str: 노출 형식 텍스트
+        """
+        lines = []
+        prefix = f"{self.namespace}_" if self.namespace else ''
+        for name, entry in sorted(self.snapshot().items()):
+            full_name = prefix + name
+            lines.append(f"# HELP {full_name} {_escape_help(entry['help'])}")
+            lines.append(f"# TYPE {full_name} {entry['type']}")
+            for sample in entry['samples']:
+                labels = sample['labels']
+                if entry['type'] == 'counter':
+                    lines.append(f"{full_name}{_format_labels(labels)} {_format_value(sample['value'])}")
+                    continue
+                cumulative = 0
+                bounds = entry['bucket_bounds'] + [float('inf')]
+                for bound, count in zip(bounds, sample['buckets']):
+                    cumulative += count
+                    bucket_labels = dict(labels, le=_format_value(bound))
+                    lines.append(f"{full_name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+                lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+                lines.append(f"{full_name}_count{_format_labels(labels)} {sample['count']}")
+        return '\n'.join(lines) + '\n'
+    
+    def _register(self, metric_class, name: str, help_text: str, label_names: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, help_text, label_names, **kwargs)
+            elif not isinstance(metric, metric_class) or metric.label_names != tuple(label_names):
+                raise ValueError(f"이미 다른 형식으로 등록된 메트릭입니다: {name}")
+            return metric
+
+
+def _format_labels(labels: dict) -> str:
+    """{이름="값",...} 형식의 라벨 문자열 (라벨이 없으면 빈 문자열)"""
+    if not labels:
+        return ''
+    parts = [f'{key}="{_escape_label(value)}"' for key, value in labels.items()]
+    return '{' + ','.join(parts) + '}'
+
+
+def _escape_label(value) -> str:
+    """라벨 값의 역슬래시, 따옴표, 줄바꿈 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _escape_help(text: str) -> str:
+    """HELP 설명의 역슬래시, 줄바꿈 이스케이프"""
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 숫자 표기 (정수는 소수점 없이, 무한대는 +Inf)"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 상수들
+# 처리 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+METRICS_NAMESPACE = 'rag_extraction'
+
+# 프로세스 전체에서 공유하는 기본 메트릭 모음
+METRICS = MetricsRegistry(METRICS_NAMESPACE)
+
+FILES_PROCESSED = METRICS.counter('files_processed_total', '처리한 파일 수', ('file_type', 'status'))
+INPUT_BYTES = METRICS.counter('input_bytes_total', '처리한 입력 파일 크기 합계 (바이트)', ('file_type',))
+OUTPUT_BYTES = METRICS.counter('output_bytes_total', '추출한 텍스트 크기 합계 (UTF-8 바이트)', ('file_type',))
+ERRORS = METRICS.counter('errors_total', '처리 실패 수', ('file_type', 'error_type'))
+CACHE_REQUESTS = METRICS.counter('cache_requests_total', '캐시 조회 수', ('cache', 'result'))
+STAGE_SECONDS = METRICS.histogram('stage_duration_seconds', '단계별 처리 시간 (초)', ('stage', 'file_type'))
@@ -0,0 +1,283 @@
+"""
+유사 중복 문서 탐지 모듈
+
+개정판, 다른 형식으로 다시 내보낸 문서, 공통 머리글/바닥글이 대부분인 웹 페이지처럼 바이트는
+다르지만 내용이 거의 같은 문서를 찾습니다. 문서(또는 청크)마다 단어 n-gram(shingle)의 MinHash
+서명을 numpy로 한꺼번에 계산하고, 서명을 여러 구간(band)으로 나눈 LSH 버킷에서 후보만 골라
+추정 유사도를 확인하므로 모든 쌍을 비교하지 않고 문서 수에 거의 비례하는 시간에 처리합니다.
+기준 이상으로 비슷한 문서는 union-find로 묶고, 묶음에서 가장 먼저 추가된 문서를 대표로 봅니다.
+
+사용법:
+    index = NearDuplicateIndex(threshold=0.8)
+    for key, text in documents:
+        original = index.add(key, text)
+        if original is not None:
+            print(f"{key}는 {original}의 유사 중복")
+"""
+
+import re
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class NearDuplicateIndex:
+    """
+    문서를 하나씩 추가하면서 유사 중복을 찾는 MinHash LSH 색인
+    
+    Args:
+        threshold (float): 유사 중복으로 볼 추정 자카드 유사도 (0~1)
+        num_perm (int): MinHash 서명 길이 (클수록 정확하지만 느리고 메모리를 많이 씀)
+        shingle_size (int): shingle로 묶을 단어 수
+        seed (int): 해시 함수 난수 시드 (같은 시드로 만든 색인끼리만 서명을 비교할 수 있음)
+    """
+    
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold는 0보다 크고 1 이하여야 합니다: {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = max(1, shingle_size)
+        self.bands, self.rows = _optimal_bands(num_perm, threshold)
+        
+        # 곱셈-시프트 해시 계수 (a는 홀수)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        
+        self._keys = []
+        self._positions = {}
+        self._signatures = []
+        self._parents = []
+        # 구간별 {구간 해시: 문서 번호들}
+        self._buckets = [{} for _ in range(self.bands)]
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        문서의 MinHash 서명
+        
+        Args:
+            text (str): 문서 텍스트
+            
+        Returns:
+            np.ndarray or None: uint32 서명 (num_perm개). 단어가 없으면 None
+        """
+        shingles = _shingle_hashes(text, self.shingle_size)
+        if shingles is None:
+            return None
+        signature = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        # (shingle 수 x num_perm) 행렬이 커지지 않도록 나눠서 계산
+        for start in range(0, len(shingles), SHINGLE_BLOCK_SIZE):
+            block = shingles[start:start + SHINGLE_BLOCK_SIZE, None]
+            hashed = (block * self._a + self._b) >> np.uint64(32)
+            np.minimum(signature, hashed.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+    
+    def add(self, key, text: str) -> Optional[object]:
+        """
+        문서를 추가하고, 이미 추가된 문서와 유사 중복이면 그 묶음의 대표 키를 반환
+        
+        Args:
+            key: 문서 키 (파일 경로, 청크 ID 등)
+            text (str): 문서 텍스트
+            
+        Returns:
+            대표 문서 키 (유사 중복이 아니거나 단어가 없는 문서면 None)
+            
+        Raises:
+            ValueError: 이미 추가된 키인 경우
+        """
+        if key in self._positions:
+            raise ValueError(f"이미 추가된 문서입니다: {key}")
+        signature = self.signature(text)
+        position = len(self._keys)
+        self._keys.append(key)
+        self._positions[key] = position
+        self._signatures.append(signature)
+        self._parents.append(position)
+        if signature is None:
+            return None
+        
+        checked = set()
+        for band, buckets in enumerate(self._buckets):
+            band_key = hash(signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            members = buckets.setdefault(band_key, [])
+            for other in members:
+                # 다른 구간에서 이미 비교했거나 이미 같은 묶음이 된 문서는 다시 비교하지 않음
+                if other in checked or self._find(other) == self._find(position):
+                    continue
+                checked.add(other)
+                if self._similarity(signature, self._signatures[other]) >= self.threshold:
+                    self._union(position, other)
+            # 공통 문구가 많은 문서가 한 버킷에 몰려도 비교 횟수가 늘지 않도록 버킷 크기를 제한
+            if len(members) < MAX_BUCKET_SIZE:
+                members.append(position)
+        
+        root = self._find(position)
+        return self._keys[root] if root != position else None
+    
+    def canonical(self, key) -> Optional[object]:
+        """
+        문서가 속한 묶음의 대표 키
+        
+        Args:
+            key: 문서 키
+            
+        Returns:
+            대표 문서 키 (문서 자신이 대표면 자기 키, 추가되지 않은 키면 None)
+        """
+        position = self._positions.get(key)
+        return self._keys[self._find(position)] if position is not None else None
+    
+    def clusters(self) -> List[list]:
+        """
+        유사 중복 묶음들 (문서가 둘 이상인 묶음만, 각 묶음은 대표 키가 먼저)
+        
+        Returns:
+            List[list]: 문서 키 목록들
+        """
+        groups = {}
+        for position, key in enumerate(self._keys):
+            groups.setdefault(self._find(position), []).append(key)
+        return [keys for keys in groups.values() if len(keys) > 1]
+    
+    def _similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """서명으로 추정한 자카드 유사도"""
+        return np.count_nonzero(first == second) / self.num_perm
+    
+    def _find(self, position: int) -> int:
+        parents = self._parents
+        root = position
+        while parents[root] != root:
+            root = parents[root]
+        # 경로 압축
+        while parents[position] != root:
+            parents[position], position = root, parents[position]
+        return root
+    
+    def _union(self, first: int, second: int) -> None:
+        # 먼저 추가된 문서를 대표로 유지
+        first_root, second_root = self._find(first), self._find(second)
+        if first_root != second_root:
+            self._parents[max(first_root, second_root)] = min(first_root, second_root)
+
+
+def find_near_duplicates(documents: Iterable[Tuple[object, str]], threshold: float = 0.8,
+                         num_perm: int = 128, shingle_size: int = 5) -> Dict[object, object]:
+    """
+    유사 중복 문서를 찾는 함수
+    
+    Args:
+        documents (Iterable[Tuple]): (문서 키, 텍스트) 쌍들 (딕셔너리는 .items()로 전달)
+        threshold (float): 유사 중복으로 볼 추정 자카드 유사도
+        num_perm (int): MinHash 서명 길이
+        shingle_size (int): shingle로 묶을 단어 수
+        
+    Returns:
+        Dict: {대표가 아닌 문서 키: 대표 문서 키} (먼저 나온 문서가 대표)
+    """
+    index = NearDuplicateIndex(threshold, num_perm, shingle_size)
+    for key, text in documents:
+        index.add(key, text)
+    return {
+        key: keys[0]
+        for keys in index.clusters()
+        for key in keys[1:]
+    }
+
+
+def mark_near_duplicates(records: Iterable[dict], index: Optional[NearDuplicateIndex] = None,
+                         text_field: str = 'text', key_field: str = 'file_path') -> Iterator[dict]:
+    """
+    결과 레코드를 차례로 색인에 추가하고, 유사 중복이면 near_duplicate_of 필드를 추가하는 제너레이터
+    
+    실패한 결과와 이미 duplicate_of가 있는 복사 결과는 색인에 추가하지 않습니다.
+    
+    Args:
+        records (Iterable[dict]): 메타데이터 결과들 (to_text_data_with_metadata, iter_html_records 등)
+        index (NearDuplicateIndex, optional): 사용할 색인 (기본값은 새 색인)
+        text_field (str): 텍스트 필드 이름
+        key_field (str): 문서 키 필드 이름
+        
+    Yields:
+        dict: 입력 레코드 (유사 중복이면 near_duplicate_of에 대표 문서 키)
+    """
+    index = index if index is not None else NearDuplicateIndex()
+    for record in records:
+        mark_near_duplicate(index, record, text_field, key_field)
+        yield record
+
+
+def mark_near_duplicate(index: NearDuplicateIndex, record: dict, text_field: str = 'text',
+                        key_field: str = 'file_path') -> None:
+    """
+    결과 레코드 하나를 색인에 추가하고, 유사 중복이면 near_duplicate_of 필드를 추가
+    
+    Args:
+        index (NearDuplicateIndex): 색인
+        record (dict): 메타데이터 결과
+        text_field (str): 텍스트 필드 이름
+        key_field (str): 문서 키 필드 이름
+    """
+    if not isinstance(record, dict) or record.get('success') is False or record.get('duplicate_of'):
+        return
+    key = record.get(key_field)
+    if key is None or key in index:
+        return
+    original = index.add(key, record.get(text_field) or '')
+    if original is not None:
+        record['near_duplicate_of'] = original
+
+
+def _shingle_hashes(text: str, shingle_size: int) -> Optional[np.ndarray]:
+    """
+    단어 n-gram의 64비트 해시들 (중복 제거)
+    
+    단어마다 CRC32를 한 번 계산한 뒤, n-gram 해시는 numpy 배열 연산으로 한꺼번에 합칩니다
+    (다항식 해시, uint64 범위에서 자연스럽게 넘침). 단어 수가 n보다 적으면 전체를 shingle 하나로 봅니다.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return None
+    token_hashes = np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens),
+                               dtype=np.uint64, count=len(tokens))
+    size = min(shingle_size, len(tokens))
+    count = len(tokens) - size + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        shingles = shingles * SHINGLE_MULTIPLIER + token_hashes[offset:offset + count]
+    return np.unique(shingles)
+
+
+def _optimal_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    (구간 수, 구간당 행 수) 선택
+    
+    후보가 될 확률이 절반쯤 되는 유사도 (1/b)^(1/r)가 threshold 이하이면서 가장 가까운 값을
+    고릅니다. 그보다 낮은 유사도의 후보는 서명 비교에서 걸러지므로 놓치는 쪽보다 낫습니다.
+    """
+    best = (num_perm, 1)
+    best_gap = float('inf')
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        point = (1 / bands) ** (1 / rows)
+        if point <= threshold and threshold - point < best_gap:
+            best, best_gap = (bands, rows), threshold - point
+    return best
+
+
+# 상수들
+# 한 번에 해시할 shingle 수 (행렬 크기 = 블록 크기 x num_perm x 8바이트)
+SHINGLE_BLOCK_SIZE = 4096
+# LSH 버킷 하나에 보관할 최대 문서 수
+MAX_BUCKET_SIZE = 64
+SHINGLE_MULTIPLIER = np.uint64(1099511628211)
+
+_TOKEN_RE = re.compile(r'\w+')
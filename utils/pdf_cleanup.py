@@ -0,0 +1,152 @@
+"""
+PDF 후처리 모듈
+
+페이지마다 반복되는 머리글, 바닥글, 쪽 번호를 제거하고 PDF 특유의 아티팩트(폼피드,
+줄 끝에서 하이픈으로 나뉜 단어)를 정리합니다. 각 페이지의 처음과 마지막 몇 줄을
+정규화한 해시로 지문을 만들고(쪽 번호 줄만 숫자를 무시), 주변 페이지 창(window) 안에서
+대부분의 페이지에 나오는 줄을 제거하므로 문서 전체를 합치지 않고 페이지 스트림에서 바로 동작합니다.
+"""
+
+import math
+import re
+from collections import Counter, deque
+from typing import Iterable, Iterator, List, Tuple
+
+
+def clean_pdf_pages(pages: Iterable[Tuple[int, str]], window: int = 16,
+                    min_ratio: float = 0.5, edge_lines: int = 2) -> Iterator[Tuple[int, str]]:
+    """
+    페이지 스트림에서 반복되는 머리글/바닥글을 제거하고 아티팩트를 정리하는 함수
+    
+    정리한 뒤 내용이 없는 페이지는 내보내지 않습니다.
+    
+    Args:
+        pages (Iterable[Tuple[int, str]]): (페이지 번호, 텍스트) 스트림
+        window (int): 반복 여부를 판단할 주변 페이지 수
+        min_ratio (float): 창 안의 페이지 중 이 비율 이상에 나오는 줄을 반복 줄로 판단
+        edge_lines (int): 머리글/바닥글 후보로 볼 페이지 처음과 마지막의 줄 수
+        
+    Yields:
+        Tuple[int, str]: (페이지 번호, 정리된 텍스트)
+    """
+    for page_number, page_text in strip_running_lines(pages, window, min_ratio, edge_lines):
+        page_text = clean_pdf_artifacts(page_text)
+        if page_text.strip():
+            yield page_number, page_text
+
+
+def strip_running_lines(pages: Iterable[Tuple[int, str]], window: int = 16,
+                        min_ratio: float = 0.5, edge_lines: int = 2) -> Iterator[Tuple[int, str]]:
+    """
+    페이지 처음/마지막 줄 중 주변 페이지 대부분에 반복되는 줄을 제거하는 함수
+    
+    페이지를 window // 2장 앞서 읽은 뒤 내보내므로 메모리에는 창 크기만큼의 페이지만 남습니다.
+    'Page 3 of 20', '- 3 -'처럼 쪽 번호만 있는 줄은 숫자를 무시하고 지문을 만들기 때문에 반복 줄로
+    판단되지만, 다른 줄은 숫자가 다르면 다른 줄로 봅니다. 처음 줄과 마지막 줄 후보는 겹치지 않으며,
+    비어 있지 않은 줄이 모두 반복 줄이어도 페이지를 비우지 않고 그대로 둡니다.
+    
+    Args:
+        pages (Iterable[Tuple[int, str]]): (페이지 번호, 텍스트) 스트림
+        window (int): 반복 여부를 판단할 주변 페이지 수
+        min_ratio (float): 창 안의 페이지 중 이 비율 이상에 나오는 줄을 반복 줄로 판단
+        edge_lines (int): 머리글/바닥글 후보로 볼 페이지 처음과 마지막의 줄 수
+        
+    Yields:
+        Tuple[int, str]: (페이지 번호, 반복 줄을 제거한 텍스트)
+    """
+    lookahead = max(1, window // 2)
+    window = max(window, 2 * lookahead)
+    counts = Counter()
+    recent = deque()
+    pending = deque()
+    
+    for page_number, page_text in pages:
+        lines = page_text.split('\n')
+        fingerprints = _edge_fingerprints(lines, edge_lines)
+        counts.update(fingerprints)
+        recent.append(fingerprints)
+        pending.append((page_number, lines, fingerprints))
+        
+        if len(recent) > window:
+            counts.subtract(recent.popleft())
+        if len(pending) > lookahead:
+            yield _strip_page(pending.popleft(), counts, len(recent), min_ratio, edge_lines)
+    
+    while pending:
+        yield _strip_page(pending.popleft(), counts, len(recent), min_ratio, edge_lines)
+
+
+def clean_pdf_artifacts(text: str) -> str:
+    """
+    폼피드 문자를 지우고 줄 끝 하이픈으로 나뉜 단어를 합치는 함수 (정규식 한 번으로 처리)
+    
+    Args:
+        text (str): PDF에서 추출한 텍스트
+        
+    Returns:
+        str: 정리된 텍스트
+    """
+    return _ARTIFACT_RE.sub('', text)
+
+
+def _edge_fingerprints(lines: List[str], edge_lines: int) -> frozenset:
+    """페이지 처음과 마지막의 비어 있지 않은 줄들의 (위치, 해시) 지문"""
+    return frozenset(
+        (position, _line_hash(lines[index]))
+        for position, index in _edge_indexes(lines, edge_lines)
+    )
+
+
+def _edge_indexes(lines: List[str], edge_lines: int) -> List[Tuple[str, int]]:
+    """
+    머리글/바닥글 후보 줄의 (위치, 줄 번호) 목록
+    
+    비어 있지 않은 줄 중 처음 edge_lines줄은 'head', 마지막 edge_lines줄은 'tail'이며,
+    줄이 적은 페이지에서도 두 후보가 겹치지 않도록 나머지 줄을 반씩 나눕니다.
+    """
+    edges = [index for index, line in enumerate(lines) if line.strip()]
+    head_count = min(edge_lines, (len(edges) + 1) // 2)
+    tail_count = min(edge_lines, len(edges) - head_count)
+    return ([('head', index) for index in edges[:head_count]] +
+            [('tail', index) for index in edges[len(edges) - tail_count:]])
+
+
+def _line_hash(line: str) -> int:
+    """공백과 대소문자를 정규화한 줄의 해시 (쪽 번호만 있는 줄은 숫자도 정규화)"""
+    normalized = _SPACES_RE.sub(' ', line.strip().lower())
+    if _PAGE_NUMBER_RE.match(normalized):
+        normalized = _DIGITS_RE.sub('#', normalized)
+    return hash(normalized)
+
+
+def _strip_page(entry: tuple, counts: Counter, page_count: int, min_ratio: float,
+                edge_lines: int) -> Tuple[int, str]:
+    """창 안에서 반복 기준을 넘는 머리글/바닥글 줄을 페이지에서 제거"""
+    page_number, lines, fingerprints = entry
+    threshold = max(MIN_REPEAT_PAGES, math.ceil(page_count * min_ratio))
+    repeated = {fingerprint for fingerprint in fingerprints if counts[fingerprint] >= threshold}
+    if not repeated:
+        return page_number, '\n'.join(lines)
+    
+    # 처음 몇 줄은 머리글, 마지막 몇 줄은 바닥글 지문과 비교
+    removed = {
+        index for position, index in _edge_indexes(lines, edge_lines)
+        if (position, _line_hash(lines[index])) in repeated
+    }
+    # 남는 내용이 없으면 본문일 수 있으므로 지우지 않음
+    if all(index in removed or not line.strip() for index, line in enumerate(lines)):
+        return page_number, '\n'.join(lines)
+    
+    kept = [line for index, line in enumerate(lines) if index not in removed]
+    return page_number, '\n'.join(kept).strip()
+
+
+# 상수들
+# 창 안의 페이지가 적어도 이만큼 같은 줄을 가져야 반복 줄로 판단 (짧은 문서 보호)
+MIN_REPEAT_PAGES = 3
+
+_ARTIFACT_RE = re.compile(r'(?<=\w)-\n(?=\w)|\f')
+_DIGITS_RE = re.compile(r'\d+')
+# 쪽 번호만 있는 줄 ('3', '- 3 -', 'page 3 of 20', 'p. 3/20', '3 페이지')
+_PAGE_NUMBER_RE = re.compile(r'^\W*(?:(?:page|p\.|페이지)\s*)?\d+(?:\s*(?:of|/)\s*\d+)?\s*(?:페이지|쪽)?\W*$')
+_SPACES_RE = re.compile(r'\s+')
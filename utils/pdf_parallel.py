@@ -0,0 +1,181 @@
+"""
+페이지 병렬 PDF 추출 모듈
+
+페이지 수가 많은 PDF를 페이지 구간으로 나누어 프로세스 풀에서 추출하고
+페이지 순서대로 다시 합칩니다. 각 워커는 파일을 직접 열기 때문에 페이지 객체를
+프로세스 사이에 주고받지 않습니다. 페이지별 위치 정보(출처 추적용)도 함께 제공합니다.
+"""
+
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import pypdf
+from pypdf import PdfReader
+
+from .budget import ExtractionBudget
+
+
+def extract_pdf_pages(file_path: str, max_workers: Optional[int] = None,
+                      min_parallel_pages: Optional[int] = None,
+                      budget: Optional[ExtractionBudget] = None) -> List[Tuple[int, str]]:
+    """
+    PDF의 페이지별 텍스트를 페이지 순서대로 반환하는 함수
+    
+    페이지 수가 min_parallel_pages 이상이면 페이지 구간별로 프로세스 풀에서 추출합니다.
+    글자 수나 시간 예산이 있으면 예산이 다 되는 즉시 멈출 수 있도록 순서대로 추출합니다.
+    
+    Args:
+        file_path (str): PDF 파일 경로
+        max_workers (int, optional): 프로세스 수. 기본값은 CPU 수 (데몬 프로세스 안에서는 항상 1)
+        min_parallel_pages (int, optional): 병렬 추출을 시작할 최소 페이지 수
+            (기본값 PARALLEL_PDF_MIN_PAGES)
+        budget (ExtractionBudget, optional): 추출 예산 (페이지 범위, 최대 글자 수, 시간 제한)
+            
+    Returns:
+        List[Tuple[int, str]]: (페이지 번호, 텍스트) 리스트 (텍스트는 PyPDFLoader의 page_content와 동일)
+    """
+    max_workers = resolve_max_workers(max_workers)
+    if min_parallel_pages is None:
+        min_parallel_pages = PARALLEL_PDF_MIN_PAGES
+    
+    reader = PdfReader(file_path)
+    page_numbers = budget.select_pages(len(reader.pages)) if budget else list(range(len(reader.pages)))
+    if max_workers == 1 or len(page_numbers) < min_parallel_pages or (budget and budget.stops_early):
+        return _extract_pages_serial(reader, page_numbers, budget)
+    
+    ranges = split_page_ranges(len(page_numbers), max_workers)
+    chunks = [page_numbers[start:end] for start, end in ranges]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        pages = []
+        for chunk, texts in zip(chunks, executor.map(_extract_page_range, [file_path] * len(chunks), chunks)):
+            pages.extend(zip(chunk, texts))
+    return pages
+
+
+def extract_pdf_pages_from_bytes(data: bytes,
+                                 budget: Optional[ExtractionBudget] = None) -> List[Tuple[int, str]]:
+    """
+    메모리에 있는 PDF의 페이지별 텍스트를 반환하는 함수 (현재 프로세스에서 순서대로 추출)
+    
+    Args:
+        data (bytes): PDF 내용
+        budget (ExtractionBudget, optional): 추출 예산
+        
+    Returns:
+        List[Tuple[int, str]]: (페이지 번호, 텍스트) 리스트
+    """
+    reader = PdfReader(io.BytesIO(data))
+    page_numbers = budget.select_pages(len(reader.pages)) if budget else list(range(len(reader.pages)))
+    return _extract_pages_serial(reader, page_numbers, budget)
+
+
+def resolve_max_workers(max_workers: Optional[int] = None) -> int:
+    """
+    프로세스 풀에서 사용할 프로세스 수를 정하는 함수
+    
+    데몬 프로세스(WorkerPool의 워커 등)는 자식 프로세스를 만들 수 없으므로 요청한 수와
+    관계없이 1을 반환해 현재 프로세스에서 순서대로 처리하게 합니다.
+    
+    Args:
+        max_workers (int, optional): 요청한 프로세스 수. 기본값은 CPU 수
+        
+    Returns:
+        int: 사용할 프로세스 수 (1이면 프로세스 풀을 만들지 않음)
+    """
+    if multiprocessing.current_process().daemon:
+        return 1
+    return max_workers or os.cpu_count() or 1
+
+
+def split_page_ranges(page_count: int, max_workers: int) -> List[Tuple[int, int]]:
+    """
+    페이지를 워커들에게 나눠줄 구간으로 분할
+    
+    워커 수보다 조금 더 많은 구간으로 나누어 페이지마다 처리 시간이 달라도
+    워커들이 고르게 바쁘도록 합니다.
+    
+    Args:
+        page_count (int): 전체 페이지 수
+        max_workers (int): 워커 수
+        
+    Returns:
+        List[Tuple[int, int]]: [시작 페이지, 끝 페이지) 구간 리스트
+    """
+    task_count = max_workers * TASKS_PER_WORKER
+    pages_per_task = max(MIN_PAGES_PER_TASK, -(-page_count // task_count))
+    return [
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    ]
+
+
+def join_pages(pages: List[Tuple[int, str]], separator: str = "\n") -> Tuple[str, List[dict]]:
+    """
+    페이지 텍스트를 합치고 페이지별 위치 정보를 만드는 함수
+    
+    Args:
+        pages (List[Tuple[int, str]]): (페이지 번호, 텍스트) 리스트
+        separator (str): 페이지 사이 구분자
+        
+    Returns:
+        Tuple[str, List[dict]]: (합친 텍스트, [{'page', 'char_start', 'char_end'}] 리스트).
+            page는 PyPDFLoader 메타데이터와 같이 0부터 시작합니다.
+    """
+    page_spans = []
+    position = 0
+    for index, (page_number, page_text) in enumerate(pages):
+        if index:
+            position += len(separator)
+        page_spans.append({
+            'page': page_number,
+            'char_start': position,
+            'char_end': position + len(page_text)
+        })
+        position += len(page_text)
+    return separator.join(page_text for _, page_text in pages), page_spans
+
+
+def _extract_pages_serial(reader: PdfReader, page_numbers: List[int],
+                          budget: Optional[ExtractionBudget] = None) -> List[Tuple[int, str]]:
+    """페이지를 순서대로 추출하며 매 페이지 전에 예산을 확인"""
+    pages = []
+    for page_number in page_numbers:
+        if budget and budget.should_stop():
+            break
+        page_text = _extract_page_text(reader.pages[page_number])
+        if budget:
+            budget.consume(page_text)
+        pages.append((page_number, page_text))
+    return pages
+
+
+def _extract_page_range(file_path: str, page_numbers: List[int]) -> List[str]:
+    """
+    페이지 구간의 텍스트를 추출하는 함수 (워커 프로세스에서 실행)
+    
+    Args:
+        file_path (str): PDF 파일 경로 (워커마다 따로 엶)
+        page_numbers (List[int]): 추출할 페이지 번호들
+        
+    Returns:
+        List[str]: 구간의 페이지별 텍스트
+    """
+    reader = PdfReader(file_path)
+    return [_extract_page_text(reader.pages[page_number]) for page_number in page_numbers]
+
+
+def _extract_page_text(page) -> str:
+    """페이지 텍스트 추출 (PyPDFLoader 기본 설정과 같은 'plain' 모드)"""
+    if pypdf.__version__.startswith('3'):
+        # pypdf 3.x에는 extraction_mode 인자가 없음
+        return page.extract_text().strip()
+    return page.extract_text(extraction_mode='plain').strip()
+
+
+# 상수들
+PARALLEL_PDF_MIN_PAGES = 200
+MIN_PAGES_PER_TASK = 16
+TASKS_PER_WORKER = 4
@@ -0,0 +1,202 @@
+"""
+PPTX 직접 추출 모듈
+
+unstructured를 거치지 않고 .pptx(zip) 안의 슬라이드 XML을 바로 읽어 텍스트를 추출합니다.
+슬라이드 순서는 ppt/presentation.xml의 슬라이드 목록과 관계(rels) 파일로 정하고,
+슬라이드마다 본문 텍스트 뒤에 발표자 노트를 붙입니다. 슬라이드가 많은 문서는
+슬라이드 구간별로 프로세스 풀에서 추출합니다.
+"""
+
+import posixpath
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from .budget import ExtractionBudget
+from .pdf_parallel import resolve_max_workers, split_page_ranges
+
+
+def extract_pptx_slides(source: Union[str, BinaryIO], max_workers: Optional[int] = None,
+                        min_parallel_slides: Optional[int] = None,
+                        budget: Optional[ExtractionBudget] = None) -> List[Tuple[int, str]]:
+    """
+    PPTX의 슬라이드별 텍스트(노트 포함)를 슬라이드 순서대로 반환하는 함수
+    
+    파일 경로이고 슬라이드 수가 min_parallel_slides 이상이면 슬라이드 구간별로 프로세스 풀에서
+    추출합니다. 글자 수나 시간 예산이 있으면 예산이 다 되는 즉시 멈출 수 있도록 순서대로 추출합니다.
+    
+    Args:
+        source (str or BinaryIO): .pptx 파일 경로 또는 바이너리 파일 객체
+        max_workers (int, optional): 프로세스 수. 기본값은 CPU 수 (데몬 프로세스 안에서는 항상 1)
+        min_parallel_slides (int, optional): 병렬 추출을 시작할 최소 슬라이드 수
+            (기본값 PARALLEL_PPTX_MIN_SLIDES)
+        budget (ExtractionBudget, optional): 추출 예산 (페이지 범위는 슬라이드 범위로 사용)
+        
+    Returns:
+        List[Tuple[int, str]]: (슬라이드 번호, 텍스트) 리스트 (슬라이드 번호는 0부터 시작)
+        
+    Raises:
+        zipfile.BadZipFile: zip 파일이 아닌 경우
+        KeyError: ppt/presentation.xml이 없는 경우
+    """
+    max_workers = resolve_max_workers(max_workers)
+    if min_parallel_slides is None:
+        min_parallel_slides = PARALLEL_PPTX_MIN_SLIDES
+    
+    with zipfile.ZipFile(source) as archive:
+        slide_parts = list_slide_parts(archive)
+        slide_numbers = budget.select_pages(len(slide_parts)) if budget else list(range(len(slide_parts)))
+        if (not isinstance(source, str) or max_workers == 1 or len(slide_numbers) < min_parallel_slides
+                or (budget and budget.stops_early)):
+            return _extract_slides_serial(archive, slide_parts, slide_numbers, budget)
+    
+    ranges = split_page_ranges(len(slide_numbers), max_workers)
+    chunks = [slide_numbers[start:end] for start, end in ranges]
+    part_chunks = [[slide_parts[number] for number in chunk] for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        slides = []
+        for chunk, texts in zip(chunks, executor.map(_extract_slide_range, [source] * len(chunks), part_chunks)):
+            slides.extend(zip(chunk, texts))
+    return slides
+
+
+def list_slide_parts(archive: zipfile.ZipFile) -> List[str]:
+    """
+    presentation.xml의 슬라이드 목록 순서대로 슬라이드 파트 이름을 반환하는 함수
+    
+    Args:
+        archive (zipfile.ZipFile): 열린 .pptx 파일
+        
+    Returns:
+        List[str]: 'ppt/slides/slide1.xml' 형식의 파트 이름 리스트 (표시 순서)
+    """
+    targets = _read_relationships(archive, PRESENTATION_PART)
+    presentation = etree.fromstring(archive.read(PRESENTATION_PART))
+    return [
+        targets[slide_id.get(R_ID)]
+        for slide_id in presentation.iterfind(f'{P_SLIDE_ID_LIST}/{P_SLIDE_ID}')
+        if slide_id.get(R_ID) in targets
+    ]
+
+
+def _extract_slides_serial(archive: zipfile.ZipFile, slide_parts: List[str], slide_numbers: List[int],
+                           budget: Optional[ExtractionBudget] = None) -> List[Tuple[int, str]]:
+    """슬라이드를 순서대로 추출하며 매 슬라이드 전에 예산을 확인"""
+    slides = []
+    for slide_number in slide_numbers:
+        if budget and budget.should_stop():
+            break
+        slide_text = _slide_text(archive, slide_parts[slide_number])
+        if budget:
+            budget.consume(slide_text)
+        slides.append((slide_number, slide_text))
+    return slides
+
+
+def _extract_slide_range(file_path: str, slide_parts: List[str]) -> List[str]:
+    """
+    슬라이드 구간의 텍스트를 추출하는 함수 (워커 프로세스에서 실행)
+    
+    Args:
+        file_path (str): .pptx 파일 경로 (워커마다 따로 엶)
+        slide_parts (List[str]): 추출할 슬라이드 파트 이름들
+        
+    Returns:
+        List[str]: 구간의 슬라이드별 텍스트
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        return [_slide_text(archive, part) for part in slide_parts]
+
+
+def _slide_text(archive: zipfile.ZipFile, slide_part: str) -> str:
+    """슬라이드 본문 문단들과 발표자 노트를 줄바꿈으로 합친 텍스트"""
+    slide = etree.fromstring(archive.read(slide_part))
+    paragraphs = _paragraph_texts(slide.iter(A_P))
+    
+    notes_part = next(
+        (target for rel_type, target in _read_relationships(archive, slide_part, by_type=True)
+         if rel_type == NOTES_SLIDE_TYPE),
+        None
+    )
+    if notes_part:
+        try:
+            notes = etree.fromstring(archive.read(notes_part))
+        except KeyError:
+            return "\n".join(paragraphs)
+        # 노트 페이지의 슬라이드 이미지, 슬라이드 번호 등은 제외하고 본문 개체 틀만 사용
+        for shape in notes.iter(P_SP):
+            placeholder = shape.find(f'.//{P_PH}')
+            if placeholder is not None and placeholder.get('type') == 'body':
+                paragraphs.extend(_paragraph_texts(shape.iter(A_P)))
+    
+    return "\n".join(paragraphs)
+
+
+def _paragraph_texts(paragraphs) -> List[str]:
+    """DrawingML 문단(a:p)들의 텍스트 (줄바꿈 a:br 포함, 빈 문단 제외)"""
+    texts = []
+    for paragraph in paragraphs:
+        text = ''.join(
+            (node.text or '') if node.tag == A_T else '\n'
+            for node in paragraph.iter(A_T, A_BR)
+        ).strip()
+        if text:
+            texts.append(text)
+    return texts
+
+
+def _read_relationships(archive: zipfile.ZipFile, part: str, by_type: bool = False):
+    """
+    파트의 관계(rels) 파일을 읽는 함수
+    
+    Args:
+        archive (zipfile.ZipFile): 열린 .pptx 파일
+        part (str): 관계를 읽을 파트 이름
+        by_type (bool): True면 (관계 타입, 대상) 리스트, False면 {관계 ID: 대상} 반환
+        
+    Returns:
+        dict or list: 대상 파트 이름은 zip 안의 전체 경로로 변환됨 (rels 파일이 없으면 비어 있음)
+    """
+    directory, name = posixpath.split(part)
+    rels_part = posixpath.join(directory, '_rels', f'{name}.rels')
+    try:
+        rels = etree.fromstring(archive.read(rels_part))
+    except KeyError:
+        return [] if by_type else {}
+    
+    relationships: Dict[str, str] = {}
+    typed = []
+    for relationship in rels.iter(REL_RELATIONSHIP):
+        if relationship.get('TargetMode') == 'External':
+            continue
+        target = relationship.get('Target', '')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(directory, target))
+        relationships[relationship.get('Id')] = target
+        typed.append((relationship.get('Type'), target))
+    return typed if by_type else relationships
+
+
+# 상수들
+PARALLEL_PPTX_MIN_SLIDES = 500
+PRESENTATION_PART = 'ppt/presentation.xml'
+
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+P_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+A_P = f'{{{A_NS}}}p'
+A_T = f'{{{A_NS}}}t'
+A_BR = f'{{{A_NS}}}br'
+P_SP = f'{{{P_NS}}}sp'
+P_PH = f'{{{P_NS}}}ph'
+P_SLIDE_ID_LIST = f'{{{P_NS}}}sldIdLst'
+P_SLIDE_ID = f'{{{P_NS}}}sldId'
+R_ID = f'{{{R_NS}}}id'
+REL_RELATIONSHIP = f'{{{REL_NS}}}Relationship'
+NOTES_SLIDE_TYPE = f'{R_NS}/notesSlide'
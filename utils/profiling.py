@@ -0,0 +1,208 @@
+"""
+문서별 프로파일링 모듈
+
+일괄 처리 중 유난히 느리거나 메모리를 많이 쓰는 파일을 조사하기 위한 선택적 기능입니다.
+문서마다 cProfile과 tracemalloc을 켜고 처리한 뒤, 처리 시간이나 최대 메모리가 기준을 넘은
+문서만 프로파일(.prof)과 요약 보고서(.txt)를 디렉토리에 저장하고 index.jsonl에 한 줄씩
+기록합니다. 기준을 넘지 않은 문서의 측정 결과는 버리므로 디렉토리에는 문제 파일만 남습니다.
+
+사용법:
+    profiler = DocumentProfiler('profiles/', min_seconds=5, min_memory_mb=500)
+    batch_process_files(paths, profiler=profiler)
+    for entry in read_profile_index('profiles/')[:10]:
+        print(entry['seconds'], entry['peak_memory_mb'], entry['file_path'])
+"""
+
+import cProfile
+import io
+import itertools
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+
+
+class DocumentProfiler:
+    """
+    기준을 넘은 문서만 저장하는 문서별 프로파일러
+    
+    pickle할 수 있으므로 WarmWorkerPool의 작업 옵션으로 넘겨 워커 안에서도 사용할 수 있습니다
+    (여러 워커가 같은 디렉토리에 기록해도 파일 이름이 겹치지 않습니다).
+    
+    Args:
+        output_dir (str): 프로파일과 index.jsonl을 저장할 디렉토리
+        min_seconds (float, optional): 이 시간(초) 이상 걸린 문서를 저장
+        min_memory_mb (float, optional): 처리 중 최대 메모리(tracemalloc 기준, MB)가 이 값 이상인 문서를 저장
+            (min_seconds와 min_memory_mb가 모두 None이면 모든 문서를 저장)
+        trace_memory (bool): tracemalloc으로 메모리를 추적할지 여부 (처리 속도가 크게 느려짐)
+        top_functions (int): 보고서에 적을 누적 시간 상위 함수 수
+        top_allocations (int): 보고서에 적을 할당 상위 위치 수
+    """
+    
+    def __init__(self, output_dir: str, min_seconds: Optional[float] = None,
+                 min_memory_mb: Optional[float] = None, trace_memory: bool = True,
+                 top_functions: int = 30, top_allocations: int = 20):
+        self.output_dir = output_dir
+        self.min_seconds = min_seconds
+        self.min_memory_mb = min_memory_mb
+        self.trace_memory = trace_memory
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+    
+    @contextmanager
+    def profile(self, file_path: str):
+        """
+        with 블록에서 처리하는 문서 하나를 측정하고, 기준을 넘으면 결과를 저장
+        
+        이미 다른 프로파일러가 실행 중이면(중첩 호출 등) cProfile 없이 시간과 메모리만 측정합니다.
+        
+        Args:
+            file_path (str): 보고서와 색인에 기록할 문서 이름
+        """
+        profiler = cProfile.Profile()
+        started_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+            baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            profiler.enable()
+        except ValueError:
+            profiler = None
+        
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if profiler is not None:
+                profiler.disable()
+            peak_mb = None
+            snapshot = None
+            if self.trace_memory:
+                peak_mb = max(0, tracemalloc.get_traced_memory()[1] - baseline) / (1024 * 1024)
+                if self._exceeds(seconds, peak_mb):
+                    snapshot = tracemalloc.take_snapshot()
+                if started_tracing:
+                    tracemalloc.stop()
+            
+            if self._exceeds(seconds, peak_mb):
+                try:
+                    self._dump(file_path, seconds, peak_mb, profiler, snapshot)
+                except OSError as e:
+                    print(f"프로파일 저장 중 오류 발생: {e}")
+    
+    def _exceeds(self, seconds: float, peak_mb: Optional[float]) -> bool:
+        """저장 기준을 넘었는지 확인 (기준이 없으면 항상 True)"""
+        if self.min_seconds is None and self.min_memory_mb is None:
+            return True
+        if self.min_seconds is not None and seconds >= self.min_seconds:
+            return True
+        return self.min_memory_mb is not None and peak_mb is not None and peak_mb >= self.min_memory_mb
+    
+    def _dump(self, file_path: str, seconds: float, peak_mb: Optional[float],
+              profiler: Optional[cProfile.Profile], snapshot) -> None:
+        """프로파일, 보고서를 저장하고 색인에 한 줄 추가"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base_name = _profile_base_name(file_path)
+        profile_path = None
+        stats = None
+        if profiler is not None:
+            stats = pstats.Stats(profiler)
+            profile_path = os.path.join(self.output_dir, base_name + '.prof')
+            stats.dump_stats(profile_path)
+        
+        report_path = os.path.join(self.output_dir, base_name + '.txt')
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(f"파일: {file_path}\n처리 시간: {seconds:.3f}초\n")
+            if peak_mb is not None:
+                f.write(f"최대 메모리(tracemalloc): {peak_mb:.1f}MB\n")
+            if stats is not None:
+                f.write(f"\n## 누적 시간 상위 {self.top_functions}개 함수\n")
+                f.write(_format_stats(stats, self.top_functions))
+            if snapshot is not None:
+                f.write(f"\n## 처리가 끝난 시점에 남아 있는 할당 상위 {self.top_allocations}개 위치\n")
+                f.write(_format_allocations(snapshot, self.top_allocations))
+        
+        entry = {
+            'file_path': file_path,
+            'seconds': round(seconds, 6),
+            'peak_memory_mb': round(peak_mb, 3) if peak_mb is not None else None,
+            'profile': os.path.basename(profile_path) if profile_path else None,
+            'report': os.path.basename(report_path),
+            'pid': os.getpid(),
+            'profiled_at': datetime.now().isoformat()
+        }
+        # 한 줄을 한 번에 추가 기록하므로 여러 워커가 같은 색인에 기록해도 줄이 섞이지 않음
+        with open(os.path.join(self.output_dir, PROFILE_INDEX_NAME), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+def read_profile_index(output_dir: str, sort_by: str = 'seconds') -> List[dict]:
+    """
+    프로파일 색인을 읽는 함수
+    
+    Args:
+        output_dir (str): DocumentProfiler의 출력 디렉토리
+        sort_by (str): 내림차순으로 정렬할 필드 ('seconds' 또는 'peak_memory_mb')
+        
+    Returns:
+        List[dict]: 색인 항목 (file_path, seconds, peak_memory_mb, profile, report, pid, profiled_at)
+    """
+    index_path = os.path.join(output_dir, PROFILE_INDEX_NAME)
+    if not os.path.exists(index_path):
+        return []
+    
+    entries = []
+    with open(index_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    entries.sort(key=lambda entry: entry.get(sort_by) or 0, reverse=True)
+    return entries
+
+
+def _profile_base_name(file_path: str) -> str:
+    """겹치지 않는 저장 파일 이름 (시각, pid, 순번, 문서 이름)"""
+    name = _UNSAFE_NAME_RE.sub('_', os.path.basename(str(file_path).rstrip('/\\')) or 'document')
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    return f"{stamp}_{os.getpid()}_{next(_SEQUENCE)}_{name[:MAX_NAME_LENGTH]}"
+
+
+def _format_stats(stats: pstats.Stats, limit: int) -> str:
+    """누적 시간 기준 상위 함수 표"""
+    output = io.StringIO()
+    stats.stream = output
+    stats.sort_stats('cumulative').print_stats(limit)
+    return output.getvalue()
+
+
+def _format_allocations(snapshot, limit: int) -> str:
+    """할당 크기 기준 상위 위치 목록 (tracemalloc과 이 모듈의 할당 제외)"""
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+    lines = []
+    for stat in snapshot.statistics('lineno')[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:10.1f} KiB  {stat.count:8d}개  {frame.filename}:{frame.lineno}\n")
+    return ''.join(lines)
+
+
+# 상수들
+PROFILE_INDEX_NAME = 'index.jsonl'
+MAX_NAME_LENGTH = 80
+
+_UNSAFE_NAME_RE = re.compile(r'[^\w.-]+')
+_SEQUENCE = itertools.count()
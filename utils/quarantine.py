@@ -0,0 +1,139 @@
+"""
+격리 목록 모듈
+
+처리 시간 제한이나 메모리 한도를 넘어 워커를 죽인 파일은 다시 시도해도 같은 결과가 나오므로,
+격리 목록에 기록해 두고 다음 일괄 처리부터는 처리하지 않고 바로 오류 결과를 남깁니다.
+목록은 JSONL 파일에 한 줄씩 추가로 기록되므로 처리 중에 프로세스가 죽어도 남습니다.
+파일 크기나 수정 시각이 바뀌면(파일이 교체되면) 격리가 풀린 것으로 봅니다.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Optional, Union
+
+
+class Quarantine:
+    """
+    다시 처리하지 않을 파일 목록
+    
+    Args:
+        path (str, optional): 목록을 저장할 JSONL 파일 경로 (없으면 메모리에만 보관)
+        error_types (tuple): 격리할 오류 분류 (결과의 error_type 값)
+    """
+    
+    def __init__(self, path: Optional[str] = None, error_types: tuple = None):
+        self.path = path
+        self.error_types = tuple(error_types) if error_types is not None else QUARANTINE_ERROR_TYPES
+        # 파일 경로 -> {'file_path', 'error_type', 'error', 'size', 'mtime_ns', 'quarantined_at'}
+        self._entries = {}
+        if path and os.path.exists(path):
+            self._load(path)
+    
+    def __contains__(self, file_path: str) -> bool:
+        return self.get(file_path) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, file_path: str) -> Optional[dict]:
+        """
+        격리 기록 조회
+        
+        Args:
+            file_path (str): 파일 경로 또는 URL
+            
+        Returns:
+            dict or None: 격리 기록 (격리되지 않았거나 기록 후 파일이 바뀌었으면 None)
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        if entry.get('size') is not None and _file_signature(file_path) != (entry['size'], entry['mtime_ns']):
+            return None
+        return entry
+    
+    def should_quarantine(self, error_type: Optional[str]) -> bool:
+        """이 오류 분류로 실패한 파일을 격리해야 하는지 여부"""
+        return error_type in self.error_types
+    
+    def add(self, file_path: str, error_type: str, error: str) -> None:
+        """
+        파일을 격리 목록에 추가 (저장 경로가 있으면 바로 기록)
+        
+        Args:
+            file_path (str): 파일 경로 또는 URL
+            error_type (str): 오류 분류
+            error (str): 오류 메시지
+        """
+        size, mtime_ns = _file_signature(file_path) or (None, None)
+        entry = {
+            'file_path': file_path,
+            'error_type': error_type,
+            'error': error,
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'quarantined_at': datetime.now().isoformat()
+        }
+        self._entries[file_path] = entry
+        if self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    
+    def remove(self, file_path: str) -> None:
+        """
+        파일의 격리를 해제 (저장 경로가 있으면 해제 기록을 추가)
+        
+        Args:
+            file_path (str): 파일 경로 또는 URL
+        """
+        if self._entries.pop(file_path, None) is not None and self.path:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'file_path': file_path, 'released': True}, ensure_ascii=False) + '\n')
+    
+    def _load(self, path: str) -> None:
+        """저장된 목록을 읽음 (마지막 줄이 완전히 기록되지 않았으면 무시)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('released'):
+                    self._entries.pop(entry.get('file_path'), None)
+                else:
+                    self._entries[entry.get('file_path')] = entry
+
+
+class QuarantinedError(Exception):
+    """격리된 파일이라 처리하지 않음"""
+    error_type = 'quarantined'
+
+
+def open_quarantine(quarantine: Union[str, Quarantine, None]) -> Optional[Quarantine]:
+    """
+    경로나 Quarantine 객체로 격리 목록을 만드는 함수
+    
+    Args:
+        quarantine (str, Quarantine, optional): 목록 파일 경로 또는 격리 목록
+        
+    Returns:
+        Quarantine or None: 격리 목록
+    """
+    if quarantine is None or isinstance(quarantine, Quarantine):
+        return quarantine
+    return Quarantine(os.fspath(quarantine))
+
+
+def _file_signature(file_path: str) -> Optional[tuple]:
+    """파일이 바뀌었는지 확인할 (크기, 수정 시각). URL이나 없는 파일은 None"""
+    try:
+        stat = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+# 상수들
+# 다시 시도해도 같은 결과가 나올 가능성이 높은 오류 분류 (워커를 강제 종료하거나 죽인 경우)
+QUARANTINE_ERROR_TYPES = ('timeout', 'memory_limit', 'worker_crashed')
@@ -0,0 +1,300 @@
+"""
+일괄 처리 스케줄러 모듈
+
+호출한 순서대로 파일을 처리하면 목록 끝에 있는 큰 파일 하나 때문에 다른 워커가 모두 쉬는
+동안 전체 처리가 끝나지 않습니다. 이 모듈은 처리 전에 파일 크기와 타입으로 파일별 처리 비용을
+추정하고, 오래 걸릴 파일부터 먼저 보내(longest-first) 전체 처리 시간(makespan)을 줄입니다.
+비용이 비슷한 파일끼리는 같은 로더를 쓰는 파일을 모아 워커에 준비된 추출기를 다시 쓰게 합니다.
+
+비용 모델은 파일 타입별 MB당 처리 시간을 지수 가중 이동 평균(EWMA)으로 학습하며, JSON 파일에
+저장해 다음 일괄 처리에서 다시 사용할 수 있습니다.
+"""
+
+import heapq
+import json
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .file_detector import is_url
+
+
+class CostModel:
+    """
+    파일 타입별 처리 비용 모델 (비용 = MB당 처리 시간 x 파일 크기)
+    
+    작은 파일도 로더 준비 등 고정 비용이 있으므로 크기는 최소 MIN_COST_BYTES로 계산합니다.
+    
+    Args:
+        path (str, optional): 학습한 값을 저장할 JSON 파일 경로 (있으면 읽어서 시작)
+        alpha (float): 새 측정값의 가중치 (0~1, 클수록 최근 측정을 더 반영)
+    """
+    
+    def __init__(self, path: Optional[str] = None, alpha: float = 0.3):
+        self.path = path
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        # 파일 타입 -> {'seconds_per_mb', 'samples'}
+        self._rates = {}
+        if path and os.path.exists(path):
+            self._load(path)
+    
+    def estimate(self, file_type: Optional[str], size: Optional[int]) -> float:
+        """
+        파일 하나의 처리 시간(초) 추정
+        
+        Args:
+            file_type (str): 파일 타입
+            size (int, optional): 파일 크기 (URL 등 알 수 없으면 None)
+            
+        Returns:
+            float: 추정 처리 시간(초)
+        """
+        return self.seconds_per_mb(file_type) * _cost_megabytes(size)
+    
+    def seconds_per_mb(self, file_type: Optional[str]) -> float:
+        """학습한 MB당 처리 시간 (측정이 없으면 기본값)"""
+        with self._lock:
+            entry = self._rates.get(file_type)
+        if entry is not None:
+            return entry['seconds_per_mb']
+        return DEFAULT_SECONDS_PER_MB.get(file_type, DEFAULT_SECONDS_PER_MB[None])
+    
+    def observe(self, file_type: Optional[str], size: Optional[int], seconds: float) -> None:
+        """
+        실제 처리 시간을 반영
+        
+        Args:
+            file_type (str): 파일 타입
+            size (int, optional): 파일 크기
+            seconds (float): 실제 처리 시간(초)
+        """
+        rate = seconds / _cost_megabytes(size)
+        with self._lock:
+            entry = self._rates.get(file_type)
+            if entry is None:
+                self._rates[file_type] = {'seconds_per_mb': rate, 'samples': 1}
+            else:
+                entry['seconds_per_mb'] += self.alpha * (rate - entry['seconds_per_mb'])
+                entry['samples'] += 1
+    
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        학습한 값을 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 기존 파일 유지)
+        
+        Args:
+            path (str, optional): 저장 경로 (기본값은 생성할 때 지정한 경로)
+        """
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            data = {str(file_type): dict(entry) for file_type, entry in self._rates.items()}
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    
+    def _load(self, path: str) -> None:
+        """저장된 값을 읽음 (형식이 잘못되었으면 기본값으로 시작)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"비용 모델을 읽을 수 없습니다 ({path}): {e}")
+            return
+        for file_type, entry in data.items():
+            self._rates[None if file_type == 'None' else file_type] = {
+                'seconds_per_mb': float(entry['seconds_per_mb']),
+                'samples': int(entry.get('samples', 1))
+            }
+
+
+class BatchScheduler:
+    """
+    비용 추정으로 일괄 처리 순서를 정하고, 실제 처리 시간으로 비용 모델과 보고서를 갱신
+    
+    batch_process_files 등에 scheduler로 넘기면 plan으로 처리 순서를 정하고, 파일마다 record를
+    호출한 뒤 끝나면 finish로 보고서(last_report)를 만들고 비용 모델을 저장합니다.
+    
+    Args:
+        cost_model (CostModel, optional): 비용 모델 (기본값은 저장하지 않는 새 모델)
+        group_by_loader (bool): 비용이 비슷한 파일끼리 같은 로더를 쓰는 파일을 모을지 여부
+    """
+    
+    def __init__(self, cost_model: Optional[CostModel] = None, group_by_loader: bool = True):
+        self.cost_model = cost_model or CostModel()
+        self.group_by_loader = group_by_loader
+        self.last_report = None
+        self._lock = threading.Lock()
+        self._reset()
+    
+    def plan(self, file_paths: List[str], file_types: Dict[str, Optional[str]], workers: int = 1) -> List[str]:
+        """
+        파일 크기를 확인하고 처리 순서를 정함
+        
+        비용을 2배 단위 구간으로 나눠 큰 구간부터 처리하고, 같은 구간 안에서는 로더별로 모은 뒤
+        비용이 큰 순서로 정렬합니다 (구간 안의 차이는 2배 미만이라 longest-first에 가깝게 유지됨).
+        
+        Args:
+            file_paths (List[str]): 입력 순서의 파일 경로들
+            file_types (Dict[str, str]): {파일 경로: 파일 타입}
+            workers (int): 동시에 처리할 워커 수 (보고서의 makespan 계산용)
+            
+        Returns:
+            List[str]: 처리할 순서의 파일 경로들
+        """
+        self._reset()
+        self._workers = max(1, workers)
+        self._input_order = list(file_paths)
+        for file_path in file_paths:
+            if file_path in self._files:
+                continue
+            file_type = file_types.get(file_path)
+            size = _file_size(file_path)
+            self._files[file_path] = {
+                'file_type': file_type,
+                'size': size,
+                'estimate': self.cost_model.estimate(file_type, size),
+                'seconds': None
+            }
+        
+        def sort_key(file_path):
+            info = self._files[file_path]
+            band = math.floor(math.log2(max(info['estimate'], MIN_ESTIMATE_SECONDS)))
+            loader = LOADER_GROUPS.get(info['file_type'], 'other') if self.group_by_loader else ''
+            return (-band, loader, -info['estimate'])
+        
+        self._planned_order = sorted(dict.fromkeys(file_paths), key=sort_key)
+        self._started = time.perf_counter()
+        return list(self._planned_order)
+    
+    def record(self, file_path: str, seconds: Optional[float]) -> None:
+        """
+        파일 하나의 실제 처리 시간을 기록하고 비용 모델에 반영
+        
+        Args:
+            file_path (str): 파일 경로
+            seconds (float, optional): 처리 시간(초). 알 수 없으면 None (보고서에는 추정값 사용)
+        """
+        with self._lock:
+            info = self._files.get(file_path)
+            if info is None or seconds is None:
+                return
+            info['seconds'] = seconds
+        self.cost_model.observe(info['file_type'], info['size'], seconds)
+    
+    def finish(self) -> dict:
+        """
+        보고서를 만들고 비용 모델을 저장
+        
+        Returns:
+            dict: {'workers', 'files', 'makespan_seconds'(실제 경과 시간),
+                'estimated': {'naive', 'scheduled'}, 'simulated': {'naive', 'scheduled'}, 'speedup'}
+                (simulated는 실제 처리 시간으로 두 순서를 다시 계산한 makespan, speedup은 naive / scheduled)
+        """
+        elapsed = time.perf_counter() - self._started if self._started is not None else 0.0
+        naive = [self._files[path] for path in self._input_order if path in self._files]
+        scheduled = [self._files[path] for path in self._planned_order]
+        actual = lambda info: info['seconds'] if info['seconds'] is not None else info['estimate']
+        
+        simulated_naive = simulate_makespan([actual(info) for info in naive], self._workers)
+        simulated_scheduled = simulate_makespan([actual(info) for info in scheduled], self._workers)
+        self.last_report = {
+            'workers': self._workers,
+            'files': len(scheduled),
+            'makespan_seconds': round(elapsed, 3),
+            'estimated': {
+                'naive': round(simulate_makespan([info['estimate'] for info in naive], self._workers), 3),
+                'scheduled': round(simulate_makespan([info['estimate'] for info in scheduled], self._workers), 3),
+            },
+            'simulated': {
+                'naive': round(simulated_naive, 3),
+                'scheduled': round(simulated_scheduled, 3),
+            },
+            'speedup': round(simulated_naive / simulated_scheduled, 3) if simulated_scheduled > 0 else 1.0
+        }
+        try:
+            self.cost_model.save()
+        except OSError as e:
+            print(f"비용 모델 저장 중 오류 발생: {e}")
+        return self.last_report
+    
+    def _reset(self) -> None:
+        # 파일 경로 -> {'file_type', 'size', 'estimate', 'seconds'}
+        self._files = {}
+        self._input_order = []
+        self._planned_order = []
+        self._workers = 1
+        self._started = None
+
+
+def simulate_makespan(costs: List[float], workers: int) -> float:
+    """
+    주어진 순서대로 비어 있는 워커에 하나씩 보낼 때의 전체 처리 시간 계산
+    
+    Args:
+        costs (List[float]): 처리 순서대로의 파일별 처리 시간
+        workers (int): 워커 수
+        
+    Returns:
+        float: makespan (마지막 워커가 끝나는 시각)
+    """
+    finish_times = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(finish_times, finish_times[0] + cost)
+    return max(finish_times)
+
+
+def _file_size(file_path: str) -> Optional[int]:
+    """파일 크기 (URL이거나 확인할 수 없으면 None)"""
+    if is_url(file_path):
+        return None
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return None
+
+
+def _cost_megabytes(size: Optional[int]) -> float:
+    """비용 계산에 쓸 크기(MB). 고정 비용을 반영하도록 최소 MIN_COST_BYTES"""
+    return max(size or 0, MIN_COST_BYTES) / (1024 * 1024)
+
+
+# 상수들
+# 학습 전 파일 타입별 MB당 처리 시간(초) 기본값 (None은 알 수 없는 타입)
+DEFAULT_SECONDS_PER_MB = {
+    'pdf': 1.0,
+    'word': 0.5,
+    'ppt': 0.5,
+    'excel': 1.0,
+    'csv': 0.2,
+    'txt': 0.05,
+    'markdown': 0.05,
+    'json': 0.05,
+    'html': 0.2,
+    'archive': 0.5,
+    'url': 4.0,
+    None: 0.5,
+}
+
+# 같은 추출기(로더)를 쓰는 파일 타입 묶음
+LOADER_GROUPS = {
+    'pdf': 'pdf',
+    'word': 'office',
+    'ppt': 'office',
+    'excel': 'tabular',
+    'csv': 'tabular',
+    'txt': 'text',
+    'markdown': 'text',
+    'json': 'text',
+    'html': 'html',
+    'url': 'html',
+    'archive': 'archive',
+}
+
+# 크기를 모르거나 아주 작은 파일도 이 크기만큼의 고정 비용이 있다고 봄
+MIN_COST_BYTES = 256 * 1024
+MIN_ESTIMATE_SECONDS = 1e-3
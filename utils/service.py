@@ -0,0 +1,343 @@
+"""
+로컬 텍스트 추출 서비스 모듈
+
+여러 파이프라인이 하나의 준비된(warm) 프로세스를 공유할 수 있도록 to_text_data_sync를
+HTTP로 제공합니다. 작업은 크기가 제한된 큐에 들어가 WarmWorkerPool에서 처리되며,
+큐가 가득 차면 429 응답으로 클라이언트가 잠시 후 다시 시도하도록 합니다.
+
+실행:
+    python -m utils.service [--port 8765] [--workers 4] [--max-queue 64]
+
+엔드포인트:
+    POST /jobs          {"path": "...", "options": {...}} -> 202 {"job_id": "..."}
+    POST /batch         {"paths": [...], "options": {...}} -> 202 {"job_ids": [...]}
+    GET  /jobs/<job_id> -> {"job_id", "status", "result", "error"}
+    GET  /health        -> {"status", "outstanding", "capacity", "jobs", "pool"}
+    GET  /metrics       -> Prometheus 텍스트 형식의 추출 메트릭 (워커 메트릭 포함)
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .metrics import METRICS
+from .worker_pool import WarmWorkerPool
+
+
+class ExtractionService:
+    """
+    작업 큐와 워커 풀을 갖춘 로컬 HTTP 추출 서비스
+    
+    Args:
+        host (str): 바인딩할 주소 (기본값은 로컬에서만 접근 가능한 127.0.0.1)
+        port (int): 포트 (0이면 빈 포트를 자동으로 선택)
+        pool (WarmWorkerPool, optional): 사용할 워커 풀. 없으면 새로 만들고 서비스 종료 시 함께 종료
+        max_workers (int, optional): 새로 만들 워커 풀의 프로세스 수
+        max_queue (int): 동시에 받을 수 있는 최대 작업 수 (대기 + 처리 중)
+        max_finished_jobs (int): 결과를 보관할 완료된 작업 수 (초과하면 오래된 것부터 삭제)
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, pool: Optional[WarmWorkerPool] = None,
+                 max_workers: Optional[int] = None, max_queue: int = 64, max_finished_jobs: int = 10000):
+        self.max_queue = max_queue
+        self.max_finished_jobs = max_finished_jobs
+        self._owns_pool = pool is None
+        self.pool = pool or WarmWorkerPool(max_workers=max_workers)
+        
+        self._lock = threading.Lock()
+        # 작업 ID -> {'status', 'path', 'submitted_at', 'finished_at', 'result', 'error'}
+        self._jobs = OrderedDict()
+        # 처리가 끝나지 않은 작업 ID -> 워커 풀 Future
+        self._futures = {}
+        self._outstanding = 0
+        self._accepting = True
+        self._thread = None
+        # serve_forever가 시작되었는지 여부 (시작하지 않은 서버의 shutdown은 끝나지 않음)
+        self._serving = False
+        
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.server.daemon_threads = True
+    
+    @property
+    def address(self) -> str:
+        """서비스 주소 (http://host:port)"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def serve_forever(self) -> None:
+        """현재 스레드에서 요청을 처리 (shutdown이 호출될 때까지)"""
+        print(f"텍스트 추출 서비스 시작: {self.address}")
+        self._serving = True
+        self.server.serve_forever()
+    
+    def start(self) -> 'ExtractionService':
+        """백그라운드 스레드에서 서비스를 시작"""
+        self._thread = threading.Thread(target=self.server.serve_forever, name='ExtractionService', daemon=True)
+        self._serving = True
+        self._thread.start()
+        return self
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        새 작업을 거부하고 서비스를 종료
+        
+        Args:
+            wait (bool): 처리 중인 작업을 기다릴지 여부 (직접 만든 워커 풀만 종료)
+        """
+        with self._lock:
+            self._accepting = False
+        if self._serving:
+            self.server.shutdown()
+            self._serving = False
+        self.server.server_close()
+        if self._owns_pool:
+            self.pool.shutdown(wait=wait)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+    
+    def submit(self, paths: list, options: dict) -> list:
+        """
+        파일들을 작업으로 등록 (모두 받거나 모두 거부)
+        
+        Args:
+            paths (list): 파일 경로 리스트
+            options (dict): to_text_data_sync 옵션
+            
+        Returns:
+            list: 작업 ID 리스트
+            
+        Raises:
+            ServiceBusy: 큐에 자리가 부족하거나 종료 중인 경우
+        """
+        with self._lock:
+            if not self._accepting:
+                raise ServiceBusy(503, "서비스가 종료 중입니다")
+            if self._outstanding + len(paths) > self.max_queue:
+                raise ServiceBusy(429, f"작업 큐가 가득 찼습니다 ({self._outstanding}/{self.max_queue})")
+            
+            job_ids = []
+            for path in paths:
+                job_id = uuid.uuid4().hex
+                self._jobs[job_id] = {
+                    'status': 'queued', 'path': path, 'submitted_at': time.time(),
+                    'finished_at': None, 'result': None, 'error': None
+                }
+                job_ids.append(job_id)
+            self._outstanding += len(paths)
+        
+        for job_id, path in zip(job_ids, paths):
+            try:
+                future = self.pool.submit(path, include_metadata=True, **options)
+            except RuntimeError as e:
+                # 워커 풀이 먼저 종료된 경우
+                future = Future()
+                future.set_exception(e)
+            with self._lock:
+                if job_id in self._jobs and self._jobs[job_id]['finished_at'] is None:
+                    self._futures[job_id] = future
+            future.add_done_callback(lambda done, job_id=job_id: self._finish_job(job_id, done))
+        return job_ids
+    
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """작업 상태 조회 ('queued', 'running', 'done', 'failed'. 없으면 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job = dict(job, job_id=job_id)
+            future = self._futures.get(job_id)
+            if job['status'] == 'queued' and future is not None and future.running():
+                job['status'] = 'running'
+            return job
+    
+    def health(self) -> dict:
+        """서비스 상태 (큐 사용량, 워커 풀 통계)"""
+        with self._lock:
+            return {
+                'status': 'ok' if self._accepting else 'shutting_down',
+                'outstanding': self._outstanding,
+                'capacity': self.max_queue,
+                'jobs': len(self._jobs),
+                'pool': self.pool.stats()
+            }
+    
+    def _finish_job(self, job_id: str, future) -> None:
+        """워커 풀의 Future가 끝나면 작업 결과를 기록 (취소된 작업은 실패로 기록)"""
+        try:
+            result, error = future.result(), None
+        except CancelledError:
+            # 워커 풀이 종료되면서 대기 중인 작업이 취소됨 (예외 메시지가 비어 있으므로 따로 처리)
+            result, error = None, "작업이 취소되었습니다"
+        except Exception as e:
+            result, error = None, str(e) or type(e).__name__
+        
+        with self._lock:
+            self._outstanding -= 1
+            self._futures.pop(job_id, None)
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(
+                status='failed' if error or not result.get('success') else 'done',
+                finished_at=time.time(),
+                result=result,
+                error=error or result.get('error')
+            )
+            self._evict_finished_jobs()
+    
+    def _evict_finished_jobs(self) -> None:
+        """보관 한도를 넘은 오래된 완료 작업 삭제 (self._lock을 잡은 상태에서 호출)"""
+        finished = len(self._jobs) - self._outstanding
+        for job_id in list(self._jobs):
+            if finished <= self.max_finished_jobs:
+                break
+            if self._jobs[job_id]['finished_at'] is not None:
+                del self._jobs[job_id]
+                finished -= 1
+
+
+class ServiceBusy(Exception):
+    """작업을 받을 수 없는 상태 (HTTP 상태 코드 포함)"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def run_service(host: str = '127.0.0.1', port: int = 8765, max_workers: Optional[int] = None,
+                max_queue: int = 64) -> None:
+    """
+    추출 서비스를 실행하는 함수 (Ctrl+C로 종료)
+    
+    Args:
+        host (str): 바인딩할 주소
+        port (int): 포트
+        max_workers (int, optional): 워커 프로세스 수
+        max_queue (int): 최대 작업 수
+    """
+    service = ExtractionService(host, port, max_workers=max_workers, max_queue=max_queue)
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        print("텍스트 추출 서비스 종료 중...")
+    finally:
+        service.shutdown()
+
+
+def _make_handler(service: ExtractionService):
+    """서비스에 연결된 요청 핸들러 클래스 생성"""
+    
+    class ExtractionRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def do_GET(self):
+            if self.path == '/health':
+                self._send_json(200, service.health())
+            elif self.path == '/metrics':
+                self._send_text(200, METRICS.to_prometheus(), PROMETHEUS_CONTENT_TYPE)
+            elif self.path.startswith('/jobs/'):
+                job = service.get_job(self.path[len('/jobs/'):])
+                if job is None:
+                    self._send_json(404, {'error': '작업을 찾을 수 없습니다'})
+                else:
+                    self._send_json(200, job)
+            else:
+                self._send_json(404, {'error': f'알 수 없는 경로입니다: {self.path}'})
+        
+        def do_POST(self):
+            if self.path not in ('/jobs', '/batch'):
+                self._send_json(404, {'error': f'알 수 없는 경로입니다: {self.path}'})
+                return
+            
+            try:
+                body = self._read_json()
+                options = _validate_options(body.get('options') or {})
+                if self.path == '/jobs':
+                    paths = [body['path']]
+                else:
+                    paths = body['paths']
+                if not isinstance(paths, list) or not paths or not all(isinstance(path, str) for path in paths):
+                    raise ValueError("경로는 비어 있지 않은 문자열 목록이어야 합니다")
+            except (KeyError, ValueError, TypeError) as e:
+                self._send_json(400, {'error': f'잘못된 요청입니다: {e}'})
+                return
+            
+            try:
+                job_ids = service.submit(paths, options)
+            except ServiceBusy as e:
+                self._send_json(e.status, {'error': str(e)}, {'Retry-After': str(RETRY_AFTER_SECONDS)})
+                return
+            
+            if self.path == '/jobs':
+                self._send_json(202, {'job_id': job_ids[0]})
+            else:
+                self._send_json(202, {'job_ids': job_ids})
+        
+        def _read_json(self) -> dict:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_REQUEST_BYTES:
+                raise ValueError("요청 본문이 너무 큽니다")
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("JSON 객체가 필요합니다")
+            return body
+        
+        def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+            self._send_text(status, json.dumps(payload, ensure_ascii=False), 'application/json; charset=utf-8',
+                            headers)
+        
+        def _send_text(self, status: int, text: str, content_type: str, headers: Optional[dict] = None) -> None:
+            data = text.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def log_message(self, format, *args):
+            # 요청마다 로그를 출력하지 않음
+            pass
+    
+    return ExtractionRequestHandler
+
+
+def _validate_options(options: dict) -> dict:
+    """요청의 추출 옵션 확인 (허용된 옵션만 전달)"""
+    if not isinstance(options, dict):
+        raise ValueError("options는 JSON 객체여야 합니다")
+    unknown = set(options) - set(ALLOWED_OPTIONS)
+    if unknown:
+        raise ValueError(f"지원하지 않는 옵션입니다: {', '.join(sorted(unknown))}")
+    return options
+
+
+# 상수들
+# 요청에서 to_text_data_sync로 전달할 수 있는 옵션
+ALLOWED_OPTIONS = ('file_type', 'pages', 'max_chars', 'time_budget', 'office_backend')
+
+MAX_REQUEST_BYTES = 10 * 1024 * 1024
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+RETRY_AFTER_SECONDS = 1
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='로컬 텍스트 추출 서비스')
+    parser.add_argument('--host', default='127.0.0.1', help='바인딩할 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수')
+    parser.add_argument('--max-queue', type=int, default=64, help='최대 작업 수 (대기 + 처리 중)')
+    args = parser.parse_args()
+    run_service(args.host, args.port, args.workers, args.max_queue)
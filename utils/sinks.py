@@ -0,0 +1,237 @@
+"""
+결과 저장(sink) 모듈
+
+일괄 처리 결과를 메모리의 딕셔너리에 모으지 않고, 파일 하나가 끝날 때마다 바로
+JSONL, 압축 JSONL, Parquet 파일이나 사용자 콜백으로 내보냅니다. 기록할 때마다
+버퍼를 비우므로 처리 중에 프로세스가 죽어도 이미 끝난 결과는 남습니다.
+"""
+
+import gzip
+import json
+import os
+from typing import Callable, Optional, Union
+
+
+class ResultSink:
+    """
+    결과 저장소 기본 클래스 (with 문으로 사용하면 끝날 때 close 호출)
+    """
+    
+    def write(self, record: dict) -> None:
+        """결과 하나를 기록"""
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """남은 내용을 기록하고 저장소를 닫음"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    """
+    JSONL 파일 저장소 (결과 하나당 한 줄)
+    
+    Args:
+        path (str): 출력 파일 경로
+        append (bool): 기존 파일 뒤에 이어서 기록할지 여부
+        flush_every (int): 몇 개 기록할 때마다 버퍼를 비울지 (1이면 매번)
+        fsync (bool): 버퍼를 비울 때 디스크 동기화까지 할지 여부 (전원 장애 대비, 느림)
+    """
+    
+    def __init__(self, path: str, append: bool = False, flush_every: int = 1, fsync: bool = False):
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self.fsync = fsync
+        self.count = 0
+        self._file = self._open(path, 'a' if append else 'w')
+    
+    def _open(self, path: str, mode: str):
+        return open(path, mode, encoding='utf-8')
+    
+    def write(self, record: dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+    
+    def flush(self) -> None:
+        """버퍼의 내용을 파일에 기록"""
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+    
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class GzipJsonlSink(JsonlSink):
+    """
+    gzip으로 압축한 JSONL 파일 저장소
+    
+    버퍼를 비울 때마다 압축 스트림을 동기화(Z_SYNC_FLUSH)하므로 중간에 죽어도 그때까지의
+    줄은 읽을 수 있습니다. 동기화가 잦으면 압축률이 떨어지므로 flush_every 기본값이 JSONL보다 큽니다.
+    
+    Args:
+        path (str): 출력 파일 경로 (.jsonl.gz)
+        append (bool): 기존 파일 뒤에 새 gzip 멤버로 이어서 기록할지 여부
+        flush_every (int): 몇 개 기록할 때마다 압축 스트림을 동기화할지
+        compresslevel (int): 압축 수준 (1~9)
+    """
+    
+    def __init__(self, path: str, append: bool = False, flush_every: int = 64, compresslevel: int = 6):
+        self.compresslevel = compresslevel
+        super().__init__(path, append, flush_every)
+    
+    def _open(self, path: str, mode: str):
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=self.compresslevel)
+    
+    def flush(self) -> None:
+        # 텍스트 래퍼와 gzip 스트림을 모두 비움
+        self._file.flush()
+        self._file.buffer.flush()
+
+
+class ParquetSink(ResultSink):
+    """
+    Parquet(열 기반) 파일 저장소 (pyarrow 필요)
+    
+    batch_size개씩 모아 row group 하나로 기록합니다. 기본 메타데이터 필드는 각각의 열로,
+    나머지 필드(페이지 위치 정보 등)는 JSON 문자열 'extra' 열로 저장합니다.
+    
+    Args:
+        path (str): 출력 파일 경로 (.parquet)
+        batch_size (int): row group 하나에 모을 결과 수
+        
+    Raises:
+        ImportError: pyarrow가 설치되지 않은 경우
+    """
+    
+    def __init__(self, path: str, batch_size: int = 1000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("Parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow") from e
+        
+        self._pa = pyarrow
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.count = 0
+        self._rows = []
+        self._schema = pyarrow.schema([(name, column_type(pyarrow)) for name, column_type in PARQUET_COLUMNS])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+    
+    def write(self, record: dict) -> None:
+        row = {name: record.get(name) for name, _ in PARQUET_COLUMNS[:-1]}
+        extra = {key: value for key, value in record.items() if key not in row}
+        row['extra'] = json.dumps(extra, ensure_ascii=False) if extra else None
+        self._rows.append(row)
+        self.count += 1
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """모아 둔 결과를 row group 하나로 기록"""
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+    
+    def close(self) -> None:
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+
+class CallbackSink(ResultSink):
+    """
+    결과마다 사용자 함수를 호출하는 저장소
+    
+    Args:
+        callback (Callable[[dict], None]): 결과 하나를 받는 함수
+    """
+    
+    def __init__(self, callback: Callable[[dict], None]):
+        self.callback = callback
+        self.count = 0
+    
+    def write(self, record: dict) -> None:
+        self.callback(record)
+        self.count += 1
+
+
+def open_sink(target: Union[str, Callable[[dict], None], ResultSink], append: bool = False) -> ResultSink:
+    """
+    경로, 함수 또는 저장소 객체로 결과 저장소를 만드는 함수
+    
+    경로는 확장자로 형식을 정합니다 (.jsonl.gz/.gz -> 압축 JSONL, .parquet -> Parquet,
+    그 외 -> JSONL).
+    
+    Args:
+        target (str, Callable, ResultSink): 출력 파일 경로, 결과를 받을 함수 또는 저장소
+        append (bool): 파일 저장소일 때 기존 파일에 이어서 기록할지 여부 (Parquet 제외)
+        
+    Returns:
+        ResultSink: 결과 저장소
+        
+    Raises:
+        TypeError: 지원하지 않는 대상인 경우
+    """
+    if isinstance(target, ResultSink):
+        return target
+    if isinstance(target, (str, os.PathLike)):
+        path = os.fspath(target)
+        lowered = path.lower()
+        if lowered.endswith('.gz'):
+            return GzipJsonlSink(path, append=append)
+        if lowered.endswith('.parquet'):
+            return ParquetSink(path)
+        return JsonlSink(path, append=append)
+    if callable(target):
+        return CallbackSink(target)
+    raise TypeError(f"지원하지 않는 결과 저장 대상입니다: {type(target).__name__}")
+
+
+def result_summary(record: dict) -> dict:
+    """
+    저장소에 기록한 결과 대신 메모리에 남길 요약 (텍스트 제외)
+    
+    Args:
+        record (dict): 메타데이터 결과
+        
+    Returns:
+        dict: {'file_type', 'char_count', 'success', 'error', 'error_type'}
+    """
+    return {key: record.get(key) for key in SUMMARY_FIELDS}
+
+
+# 상수들
+# Parquet 열 이름과 타입 (마지막 'extra' 열에 나머지 필드를 JSON으로 저장)
+PARQUET_COLUMNS = [
+    ('file_path', lambda pa: pa.string()),
+    ('text', lambda pa: pa.large_string()),
+    ('file_type', lambda pa: pa.string()),
+    ('char_count', lambda pa: pa.int64()),
+    ('word_count', lambda pa: pa.int64()),
+    ('line_count', lambda pa: pa.int64()),
+    ('token_estimate', lambda pa: pa.int64()),
+    ('hangul_ratio', lambda pa: pa.float64()),
+    ('latin_ratio', lambda pa: pa.float64()),
+    ('non_printable_ratio', lambda pa: pa.float64()),
+    ('processed_at', lambda pa: pa.string()),
+    ('truncated', lambda pa: pa.bool_()),
+    ('success', lambda pa: pa.bool_()),
+    ('error', lambda pa: pa.string()),
+    ('error_type', lambda pa: pa.string()),
+    ('extra', lambda pa: pa.string()),
+]
+
+SUMMARY_FIELDS = ('file_type', 'char_count', 'success', 'error', 'error_type')
+
+SinkTarget = Optional[Union[str, Callable[[dict], None], ResultSink]]
@@ -8,156 +8,284 @@ PDF, Word, PPT, CSV, Excel, 텍스트 파일, URL 등을 처리할 수 있습니
 import pandas as pd
 import chardet
 import os
+import io
+import csv
+import codecs
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import contextmanager
 from datetime import datetime
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_community.document_loaders import UnstructuredWordDocumentLoader
-from langchain_community.document_loaders import UnstructuredPowerPointLoader
+from typing import BinaryIO, Iterable, Optional, Union
 from langchain_community.document_loaders import CSVLoader
 
-from .file_detector import extract_file_type
-from .html_extractor import extract_html_content
-from .encoding_utils import fix_encoding_issues
+from .file_detector import extract_file_type, extract_file_type_with_stat, detect_file_types, detect_bytes_type, is_url
+from .html_extractor import extract_html_content, extract_content_from_html, DEFAULT_MAX_CONTENT_LENGTH
+from .encoding_utils import fix_encoding_issues, decode_html_bytes
+from .pdf_parallel import extract_pdf_pages, extract_pdf_pages_from_bytes, join_pages
+from .pdf_cleanup import clean_pdf_pages, clean_pdf_artifacts
+from .metrics import ERRORS, FILES_PROCESSED, INPUT_BYTES, OUTPUT_BYTES, STAGE_SECONDS
+from .sinks import ResultSink, SinkTarget, open_sink, result_summary
+from .quarantine import Quarantine, QuarantinedError, open_quarantine
+from .profiling import DocumentProfiler
+from .scheduler import BatchScheduler
+from .dedup import duplicate_result, split_duplicates
+from .near_dedup import NearDuplicateIndex, mark_near_duplicate
+from .text_stats import TextStats
+from .worker_pool import WarmWorkerPool
+from .budget import ExtractionBudget, make_budget
+from .docx_extractor import extract_docx_text
+from .pptx_extractor import extract_pptx_slides
 
 
-async def to_text_data(file_path: str, include_metadata: bool = False):
+async def to_text_data(file_path: Union[str, 'FileInput'], include_metadata: bool = False,
+                       file_type: str = None, name: Optional[str] = None,
+                       pages: Union[int, Iterable[int], None] = None, max_chars: Optional[int] = None,
+                       time_budget: Optional[float] = None, office_backend: Optional[str] = None,
+                       archive_workers: Optional[int] = None):
     """
     파일을 텍스트 데이터로 변환하는 비동기 함수
     
     Args:
-        file_path (str): 파일 경로 또는 URL
+        file_path (str, bytes, memoryview, BinaryIO): 파일 경로, URL 또는 메모리에 있는 파일 내용
         include_metadata (bool): 메타데이터 포함 여부
+        file_type (str, optional): 미리 감지한 파일 타입 (지정하면 타입 감지를 건너뜀)
+        name (str, optional): 메모리 입력의 원래 파일 이름 (타입 감지와 결과의 file_path에 사용)
+        pages (int or Iterable[int], optional): 정수 N이면 앞쪽 N페이지(슬라이드), 목록이면 해당
+            페이지들만 추출 (0부터 시작)
+        max_chars (int, optional): 최대 글자 수. 도달하면 나머지를 읽지 않고 중단
+        time_budget (float, optional): 추출에 쓸 최대 시간(초). 지나면 그때까지의 결과 반환
+        office_backend (str, optional): Word/PowerPoint 추출 백엔드 ('native' 또는 'unstructured').
+            기본값은 native 후 실패하면 unstructured
+        archive_workers (int, optional): 압축 파일 멤버를 추출할 프로세스 수. 기본값은 CPU 수
+            (일괄 처리와 워커 풀에서는 1)
         
     Returns:
         str or dict: include_metadata=False시 텍스트, True시 메타데이터 포함 딕셔너리
+            (예산 때문에 일부만 추출했으면 메타데이터의 truncated가 True)
         
     Raises:
         ValueError: 지원하지 않는 파일 형식인 경우
         FileNotFoundError: 파일을 찾을 수 없는 경우
     """
+    budget = make_budget(pages, max_chars, time_budget)
+    if _is_buffer_input(file_path):
+        return _to_text_from_buffer(file_path, include_metadata, file_type, name, budget, office_backend,
+                                    archive_workers)
+    
+    started = time.perf_counter()
     try:
-        file_type = extract_file_type(file_path)
+        if not file_type:
+            file_type = extract_file_type(file_path, deep=True)
+            STAGE_SECONDS.observe(time.perf_counter() - started, 'detect', file_type)
+        extracting = time.perf_counter()
+        extra_metadata = None
         
         if file_type == 'pdf':
-            text = await _process_pdf_async(file_path)
+            # 페이지별 위치 정보를 출처 추적용 메타데이터로 보관
+            text, page_spans = await _process_pdf_with_pages_async(file_path, budget)
+            extra_metadata = {'pages': page_spans}
         elif file_type == 'word':
-            text = await _process_word_async(file_path)
+            text = await _process_word_async(file_path, budget, office_backend)
         elif file_type == 'ppt':
-            text = await _process_ppt_async(file_path)
+            # 슬라이드별 위치 정보 (직접 추출한 경우에만 있음)
+            text, slide_spans = await _process_ppt_with_slides_async(file_path, budget, office_backend)
+            if slide_spans is not None:
+                extra_metadata = {'pages': slide_spans}
         elif file_type == 'csv':
-            text = await _process_csv_async(file_path)
-        elif file_type == 'txt':
-            text = await _process_txt_async(file_path)
+            text = await _process_csv_async(file_path, budget)
+        elif file_type in ('txt', 'markdown', 'json'):
+            text = await _process_txt_async(file_path, budget)
         elif file_type == 'excel':
-            text = await _process_excel_async(file_path)
+            text = await _process_excel_async(file_path, budget)
+        elif file_type == 'html':
+            text = await _process_html_async(file_path, budget)
+        elif file_type == 'archive':
+            text = await _process_archive_async(file_path, budget, archive_workers)
         elif file_type == 'url':
-            text = await _process_url_async(file_path)
+            text = await _process_url_async(file_path, budget)
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
         
+        if budget:
+            text, extra_metadata = _finish_budget(budget, text, extra_metadata)
+        _record_success(file_type, text, extracting, _input_size(file_path))
+        
         if include_metadata:
-            return _create_metadata_response(file_path, text, file_type)
+            return _create_metadata_response(file_path, text, file_type, extra_metadata)
         else:
             return text
             
     except Exception as e:
         print(f"파일 처리 중 오류 발생: {e}")
+        _record_failure(file_type, e)
         if include_metadata:
-            return _create_error_response(file_path, str(e))
+            return create_error_response(file_path, str(e) or type(e).__name__, classify_error(e))
         else:
             raise
 
 
-def to_text_data_sync(file_path: str, include_metadata: bool = False):
+def to_text_data_sync(file_path: Union[str, 'FileInput'], include_metadata: bool = False,
+                      file_type: str = None, name: Optional[str] = None,
+                      pages: Union[int, Iterable[int], None] = None, max_chars: Optional[int] = None,
+                      time_budget: Optional[float] = None, office_backend: Optional[str] = None,
+                      profiler: Optional[DocumentProfiler] = None, archive_workers: Optional[int] = None):
     """
     파일을 텍스트 데이터로 변환하는 동기 함수 (비동기가 필요없는 경우)
     
+    bytes, memoryview, 바이너리 파일 객체를 넘기면 디스크에 쓰지 않고 메모리에서
+    타입을 감지하고 처리합니다.
+    
     Args:
-        file_path (str): 파일 경로 또는 URL
+        file_path (str, bytes, memoryview, BinaryIO): 파일 경로, URL 또는 메모리에 있는 파일 내용
         include_metadata (bool): 메타데이터 포함 여부
+        file_type (str, optional): 미리 감지한 파일 타입 (지정하면 타입 감지를 건너뜀)
+        name (str, optional): 메모리 입력의 원래 파일 이름 (타입 감지와 결과의 file_path에 사용)
+        pages (int or Iterable[int], optional): 정수 N이면 앞쪽 N페이지(슬라이드), 목록이면 해당
+            페이지들만 추출 (0부터 시작)
+        max_chars (int, optional): 최대 글자 수. 도달하면 나머지를 읽지 않고 중단
+        time_budget (float, optional): 추출에 쓸 최대 시간(초). 지나면 그때까지의 결과 반환
+        office_backend (str, optional): Word/PowerPoint 추출 백엔드 ('native' 또는 'unstructured').
+            기본값은 native 후 실패하면 unstructured
+        profiler (DocumentProfiler, optional): 지정하면 cProfile/tracemalloc으로 측정하고
+            기준을 넘은 경우 프로파일을 저장
+        archive_workers (int, optional): 압축 파일 멤버를 추출할 프로세스 수. 기본값은 CPU 수
+            (일괄 처리와 워커 풀에서는 1)
         
     Returns:
         str or dict: include_metadata=False시 텍스트, True시 메타데이터 포함 딕셔너리
+            (예산 때문에 일부만 추출했으면 메타데이터의 truncated가 True)
         
     Raises:
         ValueError: 지원하지 않는 파일 형식인 경우
         FileNotFoundError: 파일을 찾을 수 없는 경우
     """
+    if profiler is not None:
+        profile_name = file_path if isinstance(file_path, str) else name or MEMORY_INPUT_NAME
+        with profiler.profile(profile_name):
+            return to_text_data_sync(file_path, include_metadata, file_type, name, pages, max_chars,
+                                     time_budget, office_backend, archive_workers=archive_workers)
+    
+    budget = make_budget(pages, max_chars, time_budget)
+    if _is_buffer_input(file_path):
+        return _to_text_from_buffer(file_path, include_metadata, file_type, name, budget, office_backend,
+                                    archive_workers)
+    
+    started = time.perf_counter()
     try:
-        file_type = extract_file_type(file_path)
+        if not file_type:
+            file_type = extract_file_type(file_path, deep=True)
+            STAGE_SECONDS.observe(time.perf_counter() - started, 'detect', file_type)
+        extracting = time.perf_counter()
+        extra_metadata = None
         
         if file_type == 'pdf':
-            text = _process_pdf_sync(file_path)
+            # 페이지별 위치 정보를 출처 추적용 메타데이터로 보관
+            text, page_spans = _process_pdf_with_pages_sync(file_path, budget)
+            extra_metadata = {'pages': page_spans}
         elif file_type == 'word':
-            text = _process_word_sync(file_path)
+            text = _process_word_sync(file_path, budget, office_backend)
         elif file_type == 'ppt':
-            text = _process_ppt_sync(file_path)
+            # 슬라이드별 위치 정보 (직접 추출한 경우에만 있음)
+            text, slide_spans = _process_ppt_with_slides_sync(file_path, budget, office_backend)
+            if slide_spans is not None:
+                extra_metadata = {'pages': slide_spans}
         elif file_type == 'csv':
-            text = _process_csv_sync(file_path)
-        elif file_type == 'txt':
-            text = _process_txt_sync(file_path)
+            text = _process_csv_sync(file_path, budget)
+        elif file_type in ('txt', 'markdown', 'json'):
+            text = _process_txt_sync(file_path, budget)
         elif file_type == 'excel':
-            text = _process_excel_sync(file_path)
+            text = _process_excel_sync(file_path, budget)
+        elif file_type == 'html':
+            text = _process_html_sync(file_path, budget)
+        elif file_type == 'archive':
+            text = _process_archive_sync(file_path, budget, archive_workers)
         elif file_type == 'url':
-            text = _process_url_sync(file_path)
+            text = _process_url_sync(file_path, budget)
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
         
+        if budget:
+            text, extra_metadata = _finish_budget(budget, text, extra_metadata)
+        _record_success(file_type, text, extracting, _input_size(file_path))
+        
         if include_metadata:
-            return _create_metadata_response(file_path, text, file_type)
+            return _create_metadata_response(file_path, text, file_type, extra_metadata)
         else:
             return text
             
     except Exception as e:
         print(f"파일 처리 중 오류 발생: {e}")
+        _record_failure(file_type, e)
         if include_metadata:
-            return _create_error_response(file_path, str(e))
+            return create_error_response(file_path, str(e) or type(e).__name__, classify_error(e))
         else:
             raise
 
 
-def extract_text_only(file_path: str) -> str:
+def extract_text_only(file_path: Union[str, 'FileInput'], name: Optional[str] = None,
+                      pages: Union[int, Iterable[int], None] = None, max_chars: Optional[int] = None,
+                      time_budget: Optional[float] = None) -> str:
     """
     텍스트만 추출하는 간단한 함수 (메타데이터 없음)
     
     Args:
-        file_path (str): 파일 경로 또는 URL
+        file_path (str, bytes, memoryview, BinaryIO): 파일 경로, URL 또는 메모리에 있는 파일 내용
+        name (str, optional): 메모리 입력의 원래 파일 이름
+        pages (int or Iterable[int], optional): 추출할 페이지 (to_text_data_sync 참고)
+        max_chars (int, optional): 최대 글자 수
+        time_budget (float, optional): 추출에 쓸 최대 시간(초)
         
     Returns:
         str: 추출된 텍스트
     """
-    return to_text_data_sync(file_path, include_metadata=False)
+    return to_text_data_sync(file_path, include_metadata=False, name=name, pages=pages,
+                             max_chars=max_chars, time_budget=time_budget)
 
 
-def to_text_data_with_metadata(file_path: str) -> dict:
+def to_text_data_with_metadata(file_path: Union[str, 'FileInput'], name: Optional[str] = None,
+                               pages: Union[int, Iterable[int], None] = None,
+                               max_chars: Optional[int] = None,
+                               time_budget: Optional[float] = None) -> dict:
     """
     메타데이터와 함께 텍스트를 추출하는 함수
     
     Args:
-        file_path (str): 파일 경로 또는 URL
+        file_path (str, bytes, memoryview, BinaryIO): 파일 경로, URL 또는 메모리에 있는 파일 내용
+        name (str, optional): 메모리 입력의 원래 파일 이름
+        pages (int or Iterable[int], optional): 추출할 페이지 (to_text_data_sync 참고)
+        max_chars (int, optional): 최대 글자 수
+        time_budget (float, optional): 추출에 쓸 최대 시간(초)
         
     Returns:
         dict: 메타데이터가 포함된 결과
     """
-    return to_text_data_sync(file_path, include_metadata=True)
+    return to_text_data_sync(file_path, include_metadata=True, name=name, pages=pages,
+                             max_chars=max_chars, time_budget=time_budget)
 
 
-def _create_metadata_response(file_path: str, text: str, file_type: str) -> dict:
-    """메타데이터가 포함된 응답 생성"""
-    return {
+def _create_metadata_response(file_path: str, text: str, file_type: str,
+                               extra_metadata: Optional[dict] = None) -> dict:
+    """메타데이터가 포함된 응답 생성 (extra_metadata는 파일 형식별 추가 정보)"""
+    response = {
         'file_path': file_path,
         'text': text,
         'file_type': file_type,
-        'char_count': len(text),
-        'word_count': len(text.split()) if text else 0,
-        'line_count': len(text.split('\n')) if text else 0,
+        # 글자/단어/줄 수, 추정 토큰 수, 문자 구성 비율 (단어/줄 목록을 만들지 않고 계산)
+        **TextStats.from_text(text).as_metadata(),
         'processed_at': datetime.now().isoformat(),
+        'truncated': False,
         'success': True,
         'error': None
     }
+    if extra_metadata:
+        response.update(extra_metadata)
+    return response
 
 
-def _create_error_response(file_path: str, error_msg: str) -> dict:
-    """오류 응답 생성"""
+def create_error_response(file_path: str, error_msg: str, error_type: str = 'error') -> dict:
+    """오류 응답 생성 (error_type: 'error', 'timeout', 'memory_limit', 'worker_crashed', 'quarantined')"""
     return {
         'file_path': file_path,
         'text': '',
@@ -166,112 +294,284 @@ def _create_error_response(file_path: str, error_msg: str) -> dict:
         'word_count': 0,
         'line_count': 0,
         'processed_at': datetime.now().isoformat(),
+        'truncated': False,
         'success': False,
-        'error': error_msg
+        'error': error_msg,
+        'error_type': error_type
     }
 
 
+def _record_success(file_type: str, text: str, started: float, input_bytes: Optional[int]) -> None:
+    """성공한 추출을 메트릭에 기록 (추출 시간, 파일 수, 입출력 크기)"""
+    STAGE_SECONDS.observe(time.perf_counter() - started, 'extract', file_type)
+    FILES_PROCESSED.inc(file_type, 'success')
+    OUTPUT_BYTES.inc(file_type, amount=len(text.encode('utf-8', 'surrogatepass')))
+    if input_bytes:
+        INPUT_BYTES.inc(file_type, amount=input_bytes)
+
+
+def _record_failure(file_type: Optional[str], error: BaseException, status: str = 'failed') -> None:
+    """실패한 추출을 메트릭에 기록 (파일 타입별, 오류 분류별. 격리로 건너뛴 파일은 status='skipped')"""
+    file_type = file_type or 'unknown'
+    FILES_PROCESSED.inc(file_type, status)
+    ERRORS.inc(file_type, classify_error(error))
+
+
+def _input_size(file_path: str) -> Optional[int]:
+    """입력 파일 크기 (URL이거나 크기를 알 수 없으면 None)"""
+    if is_url(file_path):
+        return None
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return None
+
+
+def classify_error(error: BaseException) -> str:
+    """예외를 결과의 error_type 분류로 변환"""
+    if isinstance(error, MemoryError):
+        return 'memory_limit'
+    return getattr(error, 'error_type', 'error')
+
+
 # 비동기 처리 함수들
-async def _process_pdf_async(file_path: str) -> str:
+async def _process_pdf_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """PDF 파일을 비동기로 처리"""
-    loader = PyPDFLoader(file_path)
-    pages = []
-    async for page in loader.alazy_load():
-        pages.append(page.page_content)
-    return "\n".join(pages)
+    text, _ = await _process_pdf_with_pages_async(file_path, budget)
+    return text
+
+
+async def _process_pdf_with_pages_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> tuple:
+    """PDF 파일을 비동기로 처리 (페이지 추출은 이벤트 루프를 막지 않도록 별도 스레드에서 실행)"""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _process_pdf_with_pages_sync, file_path, budget)
 
 
-async def _process_word_async(file_path: str) -> str:
+async def _process_word_async(file_path: str, budget: Optional[ExtractionBudget] = None,
+                              backend: Optional[str] = None) -> str:
     """Word 파일을 비동기로 처리"""
-    loader = UnstructuredWordDocumentLoader(
-        file_path=file_path,
-        mode="elements",
-        strategy="fast",
-    )
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    return _process_word_sync(file_path, budget, backend)
 
 
-async def _process_ppt_async(file_path: str) -> str:
+async def _process_ppt_async(file_path: str, budget: Optional[ExtractionBudget] = None,
+                             backend: Optional[str] = None) -> str:
     """PowerPoint 파일을 비동기로 처리"""
-    loader = UnstructuredPowerPointLoader(
-        file_path=file_path,
-        mode="elements",
-        strategy="fast",
-    )
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    text, _ = await _process_ppt_with_slides_async(file_path, budget, backend)
+    return text
+
 
+async def _process_ppt_with_slides_async(file_path: str, budget: Optional[ExtractionBudget] = None,
+                                         backend: Optional[str] = None) -> tuple:
+    """PowerPoint 파일을 비동기로 처리 (슬라이드 추출은 이벤트 루프를 막지 않도록 별도 스레드에서 실행)"""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _process_ppt_with_slides_sync, file_path, budget, backend)
 
-async def _process_csv_async(file_path: str) -> str:
+
+async def _process_csv_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """CSV 파일을 비동기로 처리"""
     loader = CSVLoader(file_path=file_path)
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    return _join_documents(loader.lazy_load(), budget)
 
 
-async def _process_txt_async(file_path: str) -> str:
+async def _process_txt_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """텍스트 파일을 비동기로 처리"""
-    return _process_txt_sync(file_path)
+    return _process_txt_sync(file_path, budget)
 
 
-async def _process_excel_async(file_path: str) -> str:
+async def _process_excel_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """Excel 파일을 비동기로 처리"""
-    return _process_excel_sync(file_path)
+    return _process_excel_sync(file_path, budget)
+
 
+async def _process_html_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
+    """저장된 HTML 파일을 비동기로 처리"""
+    return _process_html_sync(file_path, budget)
 
-async def _process_url_async(file_path: str) -> str:
+
+async def _process_archive_async(file_path: str, budget: Optional[ExtractionBudget] = None,
+                                 max_workers: Optional[int] = None) -> str:
+    """압축 파일을 비동기로 처리"""
+    return _process_archive_sync(file_path, budget, max_workers)
+
+
+async def _process_url_async(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """URL을 비동기로 처리"""
-    return extract_html_content(file_path)
+    return _process_url_sync(file_path, budget)
 
 
 # 동기 처리 함수들
-def _process_pdf_sync(file_path: str) -> str:
+def _process_pdf_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """PDF 파일을 동기로 처리"""
-    loader = PyPDFLoader(file_path)
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    text, _ = _process_pdf_with_pages_sync(file_path, budget)
+    return text
 
 
-def _process_word_sync(file_path: str) -> str:
-    """Word 파일을 동기로 처리"""
-    loader = UnstructuredWordDocumentLoader(
-        file_path=file_path,
-        mode="elements",
-        strategy="fast",
-    )
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+def _process_pdf_with_pages_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> tuple:
+    """
+    PDF 파일을 동기로 처리하고 페이지별 위치 정보를 함께 반환
+    
+    페이지 수가 많으면 페이지 구간별로 여러 프로세스에서 추출합니다.
+    
+    Returns:
+        tuple: (텍스트, [{'page', 'char_start', 'char_end'}] 리스트)
+    """
+    return join_pages(extract_pdf_pages(file_path, budget=budget))
+
+
+def _process_word_sync(file_path: str, budget: Optional[ExtractionBudget] = None,
+                       backend: Optional[str] = None) -> str:
+    """Word 파일을 동기로 처리 (.docx는 기본적으로 document.xml을 직접 읽음)"""
+    text, _ = _process_office_sync(file_path, 'word', budget, backend)
+    return text
 
 
-def _process_ppt_sync(file_path: str) -> str:
+def _process_ppt_sync(file_path: str, budget: Optional[ExtractionBudget] = None,
+                      backend: Optional[str] = None) -> str:
     """PowerPoint 파일을 동기로 처리"""
-    loader = UnstructuredPowerPointLoader(
-        file_path=file_path,
-        mode="elements",
-        strategy="fast",
-    )
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    text, _ = _process_ppt_with_slides_sync(file_path, budget, backend)
+    return text
+
+
+def _process_ppt_with_slides_sync(file_path: str, budget: Optional[ExtractionBudget] = None,
+                                  backend: Optional[str] = None) -> tuple:
+    """
+    PowerPoint 파일을 동기로 처리하고 슬라이드별 위치 정보를 함께 반환
+    
+    .pptx는 기본적으로 슬라이드 XML을 직접 읽으며, 슬라이드가 많으면 여러 프로세스에서 추출합니다.
+    
+    Returns:
+        tuple: (텍스트, [{'page', 'char_start', 'char_end'}] 리스트). page는 0부터 시작하는
+            슬라이드 번호이며, unstructured로 처리한 경우 위치 정보는 None
+    """
+    return _process_office_sync(file_path, 'ppt', budget, backend)
+
+
+def _process_office_sync(source: Union[str, bytes], file_type: str,
+                         budget: Optional[ExtractionBudget] = None,
+                         backend: Optional[str] = None, name: str = '') -> tuple:
+    """
+    Word/PowerPoint 문서를 백엔드 순서대로 시도하여 처리
+    
+    backend를 지정하지 않으면 DEFAULT_OFFICE_BACKENDS 순서대로 시도하며, 직접 추출이
+    실패하면 unstructured로 넘어갑니다. ZIP 기반이 아닌 구 버전 문서(.doc, .ppt)는
+    바로 unstructured로 처리합니다. backend를 지정하면 그 백엔드의 오류를 그대로 전달합니다.
+    
+    Args:
+        source (str or bytes): 파일 경로 또는 메모리에 있는 파일 내용
+        file_type (str): 'word' 또는 'ppt'
+        budget (ExtractionBudget, optional): 추출 예산
+        backend (str, optional): 사용할 백엔드 이름 ('native' 또는 'unstructured')
+        name (str): 메모리 입력의 원래 파일 이름 (임시 파일 확장자 결정에 사용)
+        
+    Returns:
+        tuple: (추출된 텍스트, 슬라이드별 위치 정보 또는 None)
+        
+    Raises:
+        ValueError: 알 수 없는 백엔드이거나 직접 추출할 수 없는 문서인 경우
+    """
+    if backend is not None and backend not in OFFICE_BACKENDS:
+        raise ValueError(f"지원하지 않는 문서 추출 백엔드입니다: {backend}")
+    
+    backend_names = [backend] if backend else DEFAULT_OFFICE_BACKENDS
+    for backend_name in backend_names:
+        if backend_name == 'unstructured':
+            return _process_with_unstructured(source, file_type, budget, name), None
+        
+        native_source = io.BytesIO(source) if isinstance(source, bytes) else source
+        if file_type not in NATIVE_OFFICE_EXTRACTORS or not zipfile.is_zipfile(native_source):
+            if backend:
+                raise ValueError(f"직접 추출을 지원하지 않는 문서입니다: {file_type}")
+            continue
+        
+        # 실패 후 다른 백엔드가 처음부터 다시 추출할 수 있도록 사용한 글자 수를 기억
+        char_count = budget.char_count if budget else 0
+        try:
+            return NATIVE_OFFICE_EXTRACTORS[file_type](native_source, budget)
+        except Exception as e:
+            if backend:
+                raise
+            print(f"native 백엔드로 문서 처리 실패, unstructured로 다시 시도합니다: {e}")
+            if budget:
+                budget.char_count = char_count
+    
+    raise ValueError(f"문서를 처리할 백엔드가 없습니다: {file_type}")
+
+
+def _extract_docx_native(source: Union[str, BinaryIO], budget: Optional[ExtractionBudget] = None) -> tuple:
+    """.docx 직접 추출 (위치 정보 없음)"""
+    return extract_docx_text(source, budget), None
+
 
+def _extract_pptx_native(source: Union[str, BinaryIO], budget: Optional[ExtractionBudget] = None) -> tuple:
+    """.pptx 직접 추출 (슬라이드별 위치 정보 포함)"""
+    return join_pages(extract_pptx_slides(source, budget=budget))
 
-def _process_csv_sync(file_path: str) -> str:
-    """CSV 파일을 동기로 처리"""
+
+def _process_with_unstructured(source: Union[str, bytes], file_type: str,
+                               budget: Optional[ExtractionBudget] = None, name: str = '') -> str:
+    """
+    unstructured 로더로 Word/PowerPoint 문서를 처리 (import가 무거우므로 필요할 때만 불러옴)
+    
+    Args:
+        source (str or bytes): 파일 경로 또는 메모리에 있는 파일 내용 (임시 파일로 씀)
+        file_type (str): 'word' 또는 'ppt'
+        budget (ExtractionBudget, optional): 추출 예산
+        name (str): 메모리 입력의 원래 파일 이름
+        
+    Returns:
+        str: 요소들을 줄바꿈으로 합친 텍스트
+    """
+    if isinstance(source, bytes):
+        with _temporary_path(source, _temporary_suffix(name, file_type, source)) as path:
+            return _process_with_unstructured(path, file_type, budget)
+    
+    if file_type == 'word':
+        from langchain_community.document_loaders import UnstructuredWordDocumentLoader as loader_class
+        page_of = None
+    else:
+        from langchain_community.document_loaders import UnstructuredPowerPointLoader as loader_class
+        page_of = _element_page
+    
+    loader = loader_class(file_path=source, **LOADER_SETTINGS[file_type])
+    return _join_documents(loader.lazy_load(), budget, page_of)
+
+
+def _process_csv_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
+    """CSV 파일을 동기로 처리 (행 단위로 읽으며 예산이 다 되면 중단)"""
     loader = CSVLoader(file_path=file_path)
-    docs = loader.load()
-    return "\n".join([doc.page_content for doc in docs])
+    return _join_documents(loader.lazy_load(), budget)
+
 
+def _process_txt_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
+    """텍스트 파일을 동기로 처리 (인코딩 감지 포함, 최대 글자 수가 있으면 앞부분만 읽음)"""
+    with open(file_path, 'rb') as f:
+        if budget is None or budget.max_chars is None:
+            return _decode_text_bytes(f.read())
+        
+        raw_data = f.read(budget.max_chars * MAX_BYTES_PER_CHAR)
+        has_more = bool(f.read(1))
+    
+    if has_more:
+        budget.truncated = True
+    return _decode_text_bytes(raw_data, final=not has_more)
 
-def _process_txt_sync(file_path: str) -> str:
-    """텍스트 파일을 동기로 처리 (인코딩 감지 포함)"""
+
+def _decode_text_bytes(raw_data: bytes, final: bool = True) -> str:
+    """
+    텍스트 파일 내용을 디코딩 (UTF-8 실패시 인코딩 감지)
+    
+    Args:
+        raw_data (bytes): 파일 내용
+        final (bool): 파일 끝까지의 내용인지 여부 (False면 잘린 마지막 문자를 무시)
+    """
     try:
-        # 먼저 UTF-8로 시도
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        # 먼저 UTF-8로 시도 (텍스트 모드로 읽을 때처럼 줄바꿈 통일)
+        text = codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=final)
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
     except UnicodeDecodeError:
         # UTF-8 실패시 인코딩 감지
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
         detected = chardet.detect(raw_data)
         encoding = detected.get('encoding', 'utf-8')
         text = raw_data.decode(encoding, errors='ignore')
@@ -280,19 +580,328 @@ def _process_txt_sync(file_path: str) -> str:
     return fix_encoding_issues(text)
 
 
-def _process_excel_sync(file_path: str) -> str:
-    """Excel 파일을 동기로 처리"""
+def _process_excel_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
+    """Excel 파일을 동기로 처리 (글자 수나 시간 예산이 있으면 앞쪽 행부터 나눠 읽음)"""
+    if budget and budget.stops_early:
+        return _read_excel_within_budget(file_path, budget)
     df = pd.read_excel(file_path)
     return df.to_string(index=False)
 
 
-def _process_url_sync(file_path: str) -> str:
+def _read_excel_within_budget(source, budget: ExtractionBudget) -> str:
+    """
+    읽을 행 수를 EXCEL_ROW_GROWTH배씩 늘려 가며 첫 시트를 읽다가 예산이 다 되면 중단
+    
+    pandas는 nrows만큼의 행만 파싱하므로 큰 통합 문서도 예산에 필요한 앞부분만 읽습니다.
+    매번 처음부터 다시 읽지만, 다시 읽는 행 수의 합은 마지막으로 읽은 행 수의 1/(EXCEL_ROW_GROWTH - 1)
+    이하입니다. 결과 형식은 예산이 없을 때와 같은 DataFrame.to_string이며, 최대 글자 수에 맞춰
+    자르는 것은 _finish_budget에서 합니다.
+    
+    Args:
+        source: Excel 파일 경로 또는 바이너리 파일 객체
+        budget (ExtractionBudget): 추출 예산
+        
+    Returns:
+        str: 추출된 텍스트
+    """
+    nrows = EXCEL_INITIAL_ROWS
+    while True:
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        df = pd.read_excel(source, nrows=nrows)
+        text = df.to_string(index=False)
+        if len(df) < nrows:
+            # 시트 끝까지 읽음
+            return text
+        if budget.max_chars is not None and len(text) >= budget.max_chars:
+            budget.truncated = True
+            return text
+        if budget.should_stop():
+            return text
+        nrows *= EXCEL_ROW_GROWTH
+
+
+def _process_html_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
+    """저장된 HTML 파일을 동기로 처리 (네트워크 사용 안 함)"""
+    with open(file_path, 'rb') as f:
+        html_content = decode_html_bytes(f.read())
+    return extract_content_from_html(html_content, max_length=_html_max_length(budget))
+
+
+def _process_archive_sync(file_path: str, budget: Optional[ExtractionBudget] = None,
+                          max_workers: Optional[int] = None) -> str:
+    """압축 파일(ZIP/TAR)의 문서들을 멤버 순서대로 처리하여 합침 (max_workers는 extract_archive 참고)"""
+    from .archive_ingest import extract_archive
+    
+    if budget and budget.stops_early:
+        # 예산이 다 되면 남은 멤버를 읽지 않도록 순서대로 하나씩 처리
+        results = []
+        for result in extract_archive(file_path, max_workers=1):
+            results.append(result)
+            budget.consume(result['text'])
+            if budget.should_stop():
+                break
+    else:
+        results = sorted(extract_archive(file_path, max_workers=max_workers),
+                         key=lambda result: result['member_index'])
+    
+    for result in results:
+        if not result['success']:
+            print(f"{result['file_path']} 처리 실패: {result['error']}")
+    return "\n".join(result['text'] for result in results if result['success'] and result['text'])
+
+
+def _process_url_sync(file_path: str, budget: Optional[ExtractionBudget] = None) -> str:
     """URL을 동기로 처리"""
-    return extract_html_content(file_path)
+    return extract_html_content(file_path, max_length=_html_max_length(budget))
+
+
+# 추출 예산 처리 함수들
+def _join_documents(docs, budget: Optional[ExtractionBudget] = None, page_of=None) -> str:
+    """
+    로더가 반환하는 문서(요소, 행)들의 내용을 합침
+    
+    예산이 있으면 페이지 범위 밖의 요소는 건너뛰고, 글자 수/시간 예산이 다 되면
+    남은 요소를 읽지 않고 중단합니다.
+    
+    Args:
+        docs: Document 이터레이터
+        budget (ExtractionBudget, optional): 추출 예산
+        page_of (function, optional): 문서의 페이지 번호(0부터)를 반환하는 함수
+        
+    Returns:
+        str: 줄바꿈으로 합친 텍스트
+    """
+    if budget is None:
+        return "\n".join([doc.page_content for doc in docs])
+    
+    parts = []
+    for doc in docs:
+        if page_of is not None and not budget.accepts_page(page_of(doc)):
+            continue
+        if budget.should_stop():
+            break
+        budget.consume(doc.page_content)
+        parts.append(doc.page_content)
+    return "\n".join(parts)
+
+
+def _element_page(doc) -> Optional[int]:
+    """unstructured 요소의 페이지(슬라이드) 번호를 0부터 시작하는 값으로 변환"""
+    page_number = doc.metadata.get('page_number')
+    return page_number - 1 if page_number else None
+
+
+def _html_max_length(budget: Optional[ExtractionBudget]) -> int:
+    """HTML 본문 점수 계산에 사용할 최대 텍스트 길이 (작을수록 점수 계산이 일찍 끝남)"""
+    if budget is None or budget.max_chars is None:
+        return DEFAULT_MAX_CONTENT_LENGTH
+    return min(budget.max_chars, DEFAULT_MAX_CONTENT_LENGTH)
+
+
+def _finish_budget(budget: ExtractionBudget, text: str, extra_metadata: Optional[dict]) -> tuple:
+    """
+    최대 글자 수에 맞게 텍스트를 자르고 잘림 여부를 메타데이터에 추가
+    
+    Returns:
+        tuple: (텍스트, 추가 메타데이터)
+    """
+    text = budget.apply(text)
+    extra_metadata = dict(extra_metadata or {})
+    if 'pages' in extra_metadata:
+        # 잘린 텍스트 범위를 벗어난 페이지 위치 정보 정리
+        extra_metadata['pages'] = [
+            dict(span, char_end=min(span['char_end'], len(text)))
+            for span in extra_metadata['pages'] if span['char_start'] <= len(text)
+        ]
+    extra_metadata['truncated'] = budget.truncated
+    return text, extra_metadata
+
+
+# 메모리 입력 처리 함수들
+def _to_text_from_buffer(source: 'FileInput', include_metadata: bool = False,
+                         file_type: str = None, name: Optional[str] = None,
+                         budget: Optional[ExtractionBudget] = None,
+                         office_backend: Optional[str] = None, archive_workers: Optional[int] = None):
+    """
+    메모리에 있는 파일 내용을 텍스트 데이터로 변환
+    
+    Args:
+        source (bytes, memoryview, BinaryIO): 파일 내용 또는 바이너리 파일 객체
+        include_metadata (bool): 메타데이터 포함 여부
+        file_type (str, optional): 미리 감지한 파일 타입
+        name (str, optional): 원래 파일 이름
+        budget (ExtractionBudget, optional): 추출 예산
+        office_backend (str, optional): Word/PowerPoint 추출 백엔드
+        archive_workers (int, optional): 압축 파일 멤버를 추출할 프로세스 수
+        
+    Returns:
+        str or dict: include_metadata=False시 텍스트, True시 메타데이터 포함 딕셔너리
+    """
+    if name is None and isinstance(getattr(source, 'name', None), str):
+        name = source.name
+    display_name = name or MEMORY_INPUT_NAME
+    
+    try:
+        data = _read_buffer(source)
+        started = time.perf_counter()
+        if not file_type:
+            file_type = detect_bytes_type(data, name or '')
+            STAGE_SECONDS.observe(time.perf_counter() - started, 'detect', file_type)
+        extracting = time.perf_counter()
+        text = _process_bytes_sync(data, file_type, name or '', budget, office_backend, archive_workers)
+        extra_metadata = None
+        if budget:
+            text, extra_metadata = _finish_budget(budget, text, extra_metadata)
+        _record_success(file_type, text, extracting, len(data))
+        
+        if include_metadata:
+            return _create_metadata_response(display_name, text, file_type, extra_metadata)
+        else:
+            return text
+            
+    except Exception as e:
+        print(f"파일 처리 중 오류 발생: {e}")
+        _record_failure(file_type, e)
+        if include_metadata:
+            return create_error_response(display_name, str(e) or type(e).__name__, classify_error(e))
+        else:
+            raise
+
+
+def _is_buffer_input(file_input) -> bool:
+    """경로 문자열이 아닌 메모리 입력(bytes, memoryview, 바이너리 파일 객체)인지 확인"""
+    return isinstance(file_input, (bytes, bytearray, memoryview)) or hasattr(file_input, 'read')
+
+
+def _read_buffer(source: 'FileInput') -> bytes:
+    """
+    메모리 입력을 bytes로 변환 (bytes 및 bytes 전체를 가리키는 memoryview는 복사하지 않음)
+    
+    Raises:
+        TypeError: 파일 객체가 텍스트 모드로 열린 경우
+    """
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, memoryview):
+        if isinstance(source.obj, bytes) and source.contiguous and source.nbytes == len(source.obj):
+            return source.obj
+        return source.tobytes()
+    if isinstance(source, bytearray):
+        return bytes(source)
+    
+    data = source.read()
+    if not isinstance(data, bytes):
+        raise TypeError("파일 객체는 바이너리 모드('rb')로 열어야 합니다")
+    return data
+
+
+def _process_bytes_sync(data: bytes, file_type: str, name: str = '',
+                        budget: Optional[ExtractionBudget] = None,
+                        office_backend: Optional[str] = None, archive_workers: Optional[int] = None) -> str:
+    """
+    메모리에 있는 파일 내용을 동기로 처리
+    
+    PDF, CSV, 텍스트, Excel, HTML, .docx는 메모리에서 바로 파싱하고, 경로가 필요한
+    unstructured 로더와 압축 파일(ZIP/TAR)만 임시 파일을 사용합니다.
+    
+    Args:
+        data (bytes): 파일 내용
+        file_type (str): 파일 타입
+        name (str): 원래 파일 이름 (임시 파일 확장자 결정에 사용)
+        budget (ExtractionBudget, optional): 추출 예산
+        office_backend (str, optional): Word/PowerPoint 추출 백엔드
+        archive_workers (int, optional): 압축 파일 멤버를 추출할 프로세스 수
+        
+    Returns:
+        str: 추출된 텍스트
+        
+    Raises:
+        ValueError: 지원하지 않는 파일 형식인 경우
+    """
+    if file_type == 'pdf':
+        return _process_pdf_bytes(data, budget)
+    elif file_type in ('word', 'ppt'):
+        text, _ = _process_office_sync(data, file_type, budget, office_backend, name)
+        return text
+    elif file_type == 'csv':
+        return _process_csv_bytes(data, budget)
+    elif file_type in ('txt', 'markdown', 'json'):
+        return _decode_text_bytes(data)
+    elif file_type == 'excel':
+        if budget and budget.stops_early:
+            return _read_excel_within_budget(io.BytesIO(data), budget)
+        df = pd.read_excel(io.BytesIO(data))
+        return df.to_string(index=False)
+    elif file_type == 'html':
+        return extract_content_from_html(decode_html_bytes(data), max_length=_html_max_length(budget))
+    elif file_type == 'archive':
+        # 멤버 목록을 읽으려면 임의 위치 접근이 필요하므로 임시 파일 사용 (형식은 내용으로 판단)
+        with _temporary_path(data, os.path.splitext(name)[1]) as path:
+            return _process_archive_sync(path, budget, archive_workers)
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+
+
+def _process_pdf_bytes(data: bytes, budget: Optional[ExtractionBudget] = None) -> str:
+    """메모리에 있는 PDF를 처리 (PyPDFLoader와 같은 페이지 텍스트)"""
+    text, _ = join_pages(extract_pdf_pages_from_bytes(data, budget))
+    return text
+
+
+def _process_csv_bytes(data: bytes, budget: Optional[ExtractionBudget] = None) -> str:
+    """메모리에 있는 CSV를 처리 (CSVLoader와 같은 '열: 값' 형식)"""
+    with io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', newline='') as csvfile:
+        rows = []
+        for row in csv.DictReader(csvfile):
+            if budget and budget.should_stop():
+                break
+            rows.append("\n".join(
+                f"{key.strip() if key is not None else key}: {_format_csv_value(value)}"
+                for key, value in row.items()
+            ))
+            if budget:
+                budget.consume(rows[-1])
+    return "\n".join(rows)
+
+
+def _format_csv_value(value) -> str:
+    """CSV 값 포맷 (남는 열은 쉼표로 연결)"""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, list):
+        return ",".join(map(str.strip, value))
+    return value
+
+
+@contextmanager
+def _temporary_path(data: bytes, suffix: str):
+    """경로가 필요한 로더를 위해 내용을 임시 파일로 쓰고 경로를 반환 (사용 후 삭제)"""
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+        f.write(data)
+    try:
+        yield f.name
+    finally:
+        os.unlink(f.name)
+
+
+def _temporary_suffix(name: str, file_type: str, data: bytes) -> str:
+    """임시 파일 확장자 결정 (원래 이름의 확장자 또는 ZIP/OLE 여부로 판단)"""
+    extension = os.path.splitext(name)[1].lower()
+    if extension in TEMP_FILE_SUFFIXES[file_type]:
+        return extension
+    ooxml_suffix, ole_suffix = TEMP_FILE_SUFFIXES[file_type]
+    return ooxml_suffix if data[:4] == b'PK\x03\x04' else ole_suffix
 
 
 # 일괄 처리 및 유틸리티 함수들
-def batch_process_files(file_paths: list, use_async: bool = False, include_metadata: bool = True) -> dict:
+def batch_process_files(file_paths: list, use_async: bool = False, include_metadata: bool = True,
+                        pool=None, sink: SinkTarget = None, timeout: Optional[float] = None,
+                        memory_limit_mb: Optional[float] = None,
+                        quarantine: Union[str, Quarantine, None] = None,
+                        profiler: Optional[DocumentProfiler] = None,
+                        scheduler: Optional[BatchScheduler] = None, dedup: bool = False,
+                        near_duplicates: Optional[NearDuplicateIndex] = None) -> dict:
     """
     여러 파일을 일괄 처리
     
@@ -300,78 +909,132 @@ def batch_process_files(file_paths: list, use_async: bool = False, include_metad
         file_paths (list): 처리할 파일 경로 리스트
         use_async (bool): 비동기 처리 여부
         include_metadata (bool): 메타데이터 포함 여부
+        pool (WarmWorkerPool, optional): 지정하면 상주 워커 풀에서 처리 (use_async는 무시)
+        sink (str, Callable, ResultSink, optional): 결과를 끝나는 대로 기록할 저장소
+            (파일 경로면 확장자로 형식 결정). 지정하면 항상 메타데이터 결과를 기록하고,
+            반환값에는 텍스트 없이 요약만 남김
+        timeout (float, optional): 파일당 최대 처리 시간(초). 넘으면 워커를 강제 종료하고
+            error_type이 'timeout'인 오류 결과를 남김
+        memory_limit_mb (float, optional): 워커의 메모리 한도(MB). 넘으면 워커를 강제 종료하고
+            error_type이 'memory_limit'인 오류 결과를 남김 (pool을 지정하면 풀을 만들 때 지정)
+        quarantine (str, Quarantine, optional): 격리 목록 (또는 목록 파일 경로). 제한을 넘은
+            파일을 기록하고, 이미 격리된 파일은 처리하지 않고 'quarantined' 오류 결과를 남김
+        profiler (DocumentProfiler, optional): 파일마다 프로파일링하고 기준을 넘은 파일만 저장
+            (지정하면 use_async는 무시하고 동기로 처리)
+        scheduler (BatchScheduler, optional): 지정하면 예상 처리 시간이 긴 파일부터 처리하고,
+            끝나면 scheduler.last_report에 입력 순서 대비 makespan 보고서를 남김
+            (반환값은 입력 순서를 유지)
+        dedup (bool): 내용이 같은 파일은 한 번만 추출하고 결과를 나머지 경로에 복사
+            (복사한 메타데이터 결과의 duplicate_of에 실제로 추출한 파일 경로를 기록)
+        near_duplicates (NearDuplicateIndex, optional): 유사 중복 색인. 성공한 메타데이터 결과를
+            처리 순서대로 추가하고, 먼저 처리한 문서와 내용이 거의 같으면 near_duplicate_of에
+            그 문서의 경로를 기록 (여러 일괄 처리에 같은 색인을 넘기면 이전 결과와도 비교)
         
     Returns:
-        dict: {파일_경로: 결과} 형태의 딕셔너리
+        dict: {파일_경로: 결과} 형태의 딕셔너리 (sink를 지정하면 {파일_경로: 요약})
+        
+    Raises:
+        ValueError: pool과 memory_limit_mb를 함께 지정한 경우
     """
     results = {}
+    include_metadata = include_metadata or sink is not None
+    file_types = detect_file_types(file_paths, expand_directories=False, deep=True)
     
-    for file_path in file_paths:
-        try:
-            if use_async:
-                # 비동기 처리는 별도의 이벤트 루프에서 실행해야 함
-                import asyncio
-                result = asyncio.run(to_text_data(file_path, include_metadata))
-            else:
-                result = to_text_data_sync(file_path, include_metadata)
-            
-            results[file_path] = result
-            
-        except Exception as e:
-            print(f"{file_path} 처리 실패: {e}")
-            if include_metadata:
-                results[file_path] = _create_error_response(file_path, str(e))
-            else:
-                results[file_path] = ""
+    with _batch_pool(pool, timeout, memory_limit_mb) as pool, _open_batch_sink(sink) as output:
+        batch_results = _iter_batch_results(file_paths, file_types, include_metadata, pool, use_async,
+                                            timeout, open_quarantine(quarantine), profiler, scheduler, dedup,
+                                            near_duplicates)
+        for file_path, result, error in batch_results:
+            if error is not None:
+                print(f"{file_path} 처리 실패: {error}")
+                result = create_error_response(file_path, str(error), classify_error(error)) if include_metadata else ""
+            _store_result(results, output, file_path, result)
     
-    return results
+    return _in_input_order(results, file_paths)
 
 
-def batch_process_with_progress(file_paths: list, callback=None) -> dict:
+def batch_process_with_progress(file_paths: list, callback=None, pool=None,
+                                sink: SinkTarget = None, timeout: Optional[float] = None,
+                                memory_limit_mb: Optional[float] = None,
+                                quarantine: Union[str, Quarantine, None] = None,
+                                profiler: Optional[DocumentProfiler] = None,
+                                scheduler: Optional[BatchScheduler] = None, dedup: bool = False,
+                                near_duplicates: Optional[NearDuplicateIndex] = None) -> dict:
     """
     진행 상황을 보여주면서 일괄 처리
     
     Args:
         file_paths (list): 처리할 파일 경로 리스트
         callback (function): 진행 상황 콜백 함수
+        pool (WarmWorkerPool, optional): 지정하면 상주 워커 풀에서 처리
+        sink (str, Callable, ResultSink, optional): 결과를 끝나는 대로 기록할 저장소
+            (지정하면 반환값에는 텍스트 없이 요약만 남김)
+        timeout (float, optional): 파일당 최대 처리 시간(초)
+        memory_limit_mb (float, optional): 워커의 메모리 한도(MB)
+        quarantine (str, Quarantine, optional): 격리 목록 (또는 목록 파일 경로)
+        profiler (DocumentProfiler, optional): 파일마다 프로파일링하고 기준을 넘은 파일만 저장
+        scheduler (BatchScheduler, optional): 예상 처리 시간이 긴 파일부터 처리 (진행 상황은
+            끝나는 순서대로 알리고, 반환값은 입력 순서를 유지)
+        dedup (bool): 내용이 같은 파일은 한 번만 추출하고 결과를 나머지 경로에 복사
+        near_duplicates (NearDuplicateIndex, optional): 유사 중복이면 near_duplicate_of를 기록할 색인
         
     Returns:
         dict: 처리 결과
     """
     results = {}
     total = len(file_paths)
+    file_types = detect_file_types(file_paths, expand_directories=False, deep=True)
     
-    for i, file_path in enumerate(file_paths, 1):
-        try:
-            result = to_text_data_sync(file_path, include_metadata=True)
-            results[file_path] = result
-            
-            # 진행 상황 출력
-            if callback:
-                callback(i, total, file_path, True)
-            else:
-                print(f"진행률: {i}/{total} - 완료: {file_path}")
+    with _batch_pool(pool, timeout, memory_limit_mb) as pool, _open_batch_sink(sink) as output:
+        batch_results = _iter_batch_results(file_paths, file_types, pool=pool, timeout=timeout,
+                                            quarantine=open_quarantine(quarantine), profiler=profiler,
+                                            scheduler=scheduler, dedup=dedup, near_duplicates=near_duplicates)
+        for i, (file_path, result, error) in enumerate(batch_results, 1):
+            if error is None:
+                _store_result(results, output, file_path, result)
                 
-        except Exception as e:
-            results[file_path] = _create_error_response(file_path, str(e))
-            
-            if callback:
-                callback(i, total, file_path, False, str(e))
+                # 진행 상황 출력
+                if callback:
+                    callback(i, total, file_path, True)
+                else:
+                    print(f"진행률: {i}/{total} - 완료: {file_path}")
             else:
-                print(f"진행률: {i}/{total} - 실패: {file_path} ({e})")
+                _store_result(results, output, file_path,
+                              create_error_response(file_path, str(error), classify_error(error)))
+                
+                if callback:
+                    callback(i, total, file_path, False, str(error))
+                else:
+                    print(f"진행률: {i}/{total} - 실패: {file_path} ({error})")
     
-    return results
+    return _in_input_order(results, file_paths)
 
 
-def smart_batch_processing(file_paths: list) -> dict:
+def smart_batch_processing(file_paths: list, pool=None, sink: SinkTarget = None,
+                           timeout: Optional[float] = None, memory_limit_mb: Optional[float] = None,
+                           quarantine: Union[str, Quarantine, None] = None,
+                           profiler: Optional[DocumentProfiler] = None,
+                           scheduler: Optional[BatchScheduler] = None, dedup: bool = False,
+                           near_duplicates: Optional[NearDuplicateIndex] = None) -> dict:
     """
     파일 타입에 따른 스마트 일괄 처리
     
     Args:
         file_paths (list): 처리할 파일 경로 리스트
+        pool (WarmWorkerPool, optional): 지정하면 상주 워커 풀에서 처리
+        sink (str, Callable, ResultSink, optional): 후처리한 결과를 끝나는 대로 기록할 저장소
+            (지정하면 results에는 텍스트 없이 요약만 남김)
+        timeout (float, optional): 파일당 최대 처리 시간(초)
+        memory_limit_mb (float, optional): 워커의 메모리 한도(MB)
+        quarantine (str, Quarantine, optional): 격리 목록 (또는 목록 파일 경로)
+        profiler (DocumentProfiler, optional): 파일마다 프로파일링하고 기준을 넘은 파일만 저장
+        scheduler (BatchScheduler, optional): 예상 처리 시간이 긴 파일부터 처리
+        dedup (bool): 내용이 같은 파일은 한 번만 추출하고 결과를 나머지 경로에 복사
+        near_duplicates (NearDuplicateIndex, optional): 유사 중복이면 near_duplicate_of를 기록할 색인
+            (후처리 전 텍스트로 비교)
         
     Returns:
-        dict: 처리 결과와 통계
+        dict: 처리 결과와 통계 (scheduler를 지정하면 'schedule'에 makespan 보고서 포함)
     """
     results = {}
     stats = {
@@ -381,10 +1044,18 @@ def smart_batch_processing(file_paths: list) -> dict:
         'by_type': {}
     }
     
-    for file_path in file_paths:
-        try:
-            result = to_text_data_sync(file_path, include_metadata=True)
-            results[file_path] = result
+    file_types = detect_file_types(file_paths, expand_directories=False, deep=True)
+    
+    with _batch_pool(pool, timeout, memory_limit_mb) as pool, _open_batch_sink(sink) as output:
+        batch_results = _iter_batch_results(file_paths, file_types, pool=pool, timeout=timeout,
+                                            quarantine=open_quarantine(quarantine), profiler=profiler,
+                                            scheduler=scheduler, dedup=dedup, near_duplicates=near_duplicates)
+        for file_path, result, error in batch_results:
+            if error is not None:
+                _store_result(results, output, file_path,
+                              create_error_response(file_path, str(error), classify_error(error)))
+                stats['failed'] += 1
+                continue
             
             # 통계 업데이트
             stats['success'] += 1
@@ -394,31 +1065,222 @@ def smart_batch_processing(file_paths: list) -> dict:
             # 파일 타입별 후처리
             text = result['text']
             if file_type == 'pdf':
-                # PDF 특수 문자 정리
-                text = _clean_pdf_artifacts(text)
+                # 페이지별로 반복되는 머리글/바닥글 제거 및 PDF 특수 문자 정리
+                with STAGE_SECONDS.time('postprocess', file_type):
+                    text, page_spans = _clean_pdf_text(text, result.get('pages'))
+                if page_spans is not None:
+                    result['pages'] = page_spans
             elif file_type == 'url':
                 # HTML 노이즈 제거
-                text = _remove_html_noise(text)
+                with STAGE_SECONDS.time('postprocess', file_type):
+                    text = _remove_html_noise(text)
             
             result['text'] = text
-            
-        except Exception as e:
-            results[file_path] = _create_error_response(file_path, str(e))
-            stats['failed'] += 1
+            _store_result(results, output, file_path, result)
     
+    results = _in_input_order(results, file_paths)
+    if scheduler is None:
+        return {
+            'results': results,
+            'statistics': stats
+        }
     return {
         'results': results,
-        'statistics': stats
+        'statistics': stats,
+        'schedule': scheduler.last_report
     }
 
 
+def _iter_batch_results(file_paths: list, file_types: dict, include_metadata: bool = True,
+                        pool=None, use_async: bool = False, timeout: Optional[float] = None,
+                        quarantine: Optional[Quarantine] = None, profiler: Optional[DocumentProfiler] = None,
+                        scheduler: Optional[BatchScheduler] = None, dedup: bool = False,
+                        near_duplicates: Optional[NearDuplicateIndex] = None):
+    """
+    일괄 처리 결과를 끝나는 순서대로 하나씩 반환하는 제너레이터
+    
+    워커 풀을 사용하면 풀에 미리 넣어 두는 작업 수를 제한하므로, 파일 수와 관계없이
+    메모리에 남는 결과 수가 일정합니다. 오래 걸리는 파일이 있어도 끝난 작업의 결과를 먼저
+    반환하고 그만큼 새 작업을 넣어 워커가 쉬지 않게 합니다. 격리 목록이 있으면 격리된 파일은 건너뛰고,
+    제한을 넘어 실패한 파일은 목록에 추가합니다. 스케줄러가 있으면 스케줄러가 정한
+    순서대로 처리하며, 파일별 처리 시간을 스케줄러에 기록합니다. dedup이면
+    내용이 같은 파일은 대표 파일만 처리하고, 대표 파일 결과 바로 뒤에 복사한 결과를 반환합니다.
+    유사 중복 색인이 있으면 성공한 메타데이터 결과를 색인에 추가하고 near_duplicate_of를 기록합니다.
+    
+    Yields:
+        tuple: (파일 경로, 결과, 예외). 성공하면 예외가 None, 실패하면 결과가 None
+    """
+    copies = {}
+    if dedup:
+        file_paths, copies = split_duplicates(file_paths)
+    if scheduler is not None:
+        file_paths = scheduler.plan(file_paths, file_types, pool.max_workers if pool is not None else 1)
+    raw_results = _iter_raw_batch_results(file_paths, file_types, include_metadata,
+                                          pool, use_async, timeout, quarantine, profiler)
+    try:
+        for file_path, result, error, seconds in raw_results:
+            if quarantine is not None:
+                update_quarantine(quarantine, file_path, result, error)
+            if scheduler is not None:
+                scheduler.record(file_path, seconds)
+            if near_duplicates is not None:
+                mark_near_duplicate(near_duplicates, result)
+            # 호출한 쪽이 대표 파일 결과를 고치기 전에 복사
+            duplicates = [(path, duplicate_result(result, path, file_path)) for path in copies.get(file_path, ())]
+            yield file_path, result, error
+            for path, copied in duplicates:
+                yield path, copied, error
+    finally:
+        if scheduler is not None:
+            scheduler.finish()
+
+
+def _iter_raw_batch_results(file_paths: list, file_types: dict, include_metadata: bool,
+                            pool, use_async: bool, timeout: Optional[float],
+                            quarantine: Optional[Quarantine], profiler: Optional[DocumentProfiler]):
+    """
+    격리된 파일을 제외하고 처리한 결과를 끝나는 순서대로 반환 (_iter_batch_results 참고)
+    
+    Yields:
+        tuple: (파일 경로, 결과, 예외, 처리 시간). 처리하지 않았거나 시간을 모르면 처리 시간은 None
+    """
+    if pool is None:
+        for file_path in file_paths:
+            if quarantine is not None and file_path in quarantine:
+                yield file_path, None, quarantined_error(quarantine, file_path, file_types.get(file_path)), None
+                continue
+            started = time.perf_counter()
+            try:
+                if use_async and profiler is None:
+                    # 비동기 처리는 별도의 이벤트 루프에서 실행해야 함
+                    import asyncio
+                    result = asyncio.run(to_text_data(file_path, include_metadata, file_types.get(file_path),
+                                                      archive_workers=1))
+                else:
+                    result = to_text_data_sync(file_path, include_metadata, file_types.get(file_path),
+                                               profiler=profiler, archive_workers=1)
+            except Exception as e:
+                yield file_path, None, e, time.perf_counter() - started
+                continue
+            yield file_path, result, None, time.perf_counter() - started
+        return
+    
+    max_pending = pool.max_workers * POOL_TASKS_PER_WORKER
+    # Future -> 파일 경로
+    pending = {}
+    for file_path in file_paths:
+        if quarantine is not None and file_path in quarantine:
+            yield file_path, None, quarantined_error(quarantine, file_path, file_types.get(file_path)), None
+            continue
+        future = pool.submit(file_path, timeout=timeout, include_metadata=include_metadata,
+                             file_type=file_types.get(file_path), profiler=profiler)
+        pending[future] = file_path
+        if len(pending) >= max_pending:
+            yield from _collect_pool_results(pending)
+    while pending:
+        yield from _collect_pool_results(pending)
+
+
+def _collect_pool_results(pending: dict):
+    """끝난 풀 작업이 생길 때까지 기다린 뒤 그 결과들을 반환 (워커에서의 처리 시간 포함)"""
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        file_path = pending.pop(future)
+        try:
+            result, error = future.result(), None
+        except Exception as e:
+            result, error = None, e
+        yield file_path, result, error, getattr(future, 'elapsed', None)
+
+
+def update_quarantine(quarantine: Quarantine, file_path: str, result, error: Optional[Exception]) -> None:
+    """제한을 넘어 실패한 파일을 격리 목록에 추가 (예외 또는 메타데이터 오류 결과)"""
+    if error is not None:
+        error_type, error_msg = classify_error(error), str(error)
+    elif isinstance(result, dict) and not result.get('success'):
+        error_type, error_msg = result.get('error_type'), result.get('error')
+    else:
+        return
+    if quarantine.should_quarantine(error_type):
+        quarantine.add(file_path, error_type, error_msg)
+
+
+def quarantined_error(quarantine: Quarantine, file_path: str, file_type: Optional[str] = None) -> QuarantinedError:
+    """격리된 파일의 오류 (처음 실패한 원인 포함, 건너뛴 파일로 메트릭에 기록)"""
+    entry = quarantine.get(file_path)
+    error = QuarantinedError(f"격리된 파일입니다 ({entry['error_type']}: {entry['error']})")
+    _record_failure(file_type, error, status='skipped')
+    return error
+
+
+@contextmanager
+def _batch_pool(pool, timeout: Optional[float], memory_limit_mb: Optional[float]):
+    """
+    제한이 필요하면 일괄 처리 동안만 쓸 워커 풀을 만들고 끝나면 종료
+    
+    처리 시간이나 메모리 한도는 워커 프로세스를 강제 종료하는 방식이므로, 풀 없이
+    현재 프로세스에서 처리할 때는 제한을 적용할 수 없어 임시 풀을 사용합니다.
+    """
+    if pool is not None:
+        if memory_limit_mb is not None:
+            raise ValueError("pool을 지정한 경우 memory_limit_mb는 WarmWorkerPool을 만들 때 지정하세요")
+        yield pool
+        return
+    if timeout is None and memory_limit_mb is None:
+        yield None
+        return
+    with WarmWorkerPool(task_timeout=timeout, memory_limit_mb=memory_limit_mb) as batch_pool:
+        yield batch_pool
+
+
+@contextmanager
+def _open_batch_sink(sink: SinkTarget):
+    """일괄 처리용 결과 저장소를 열고, 함수 안에서 연 저장소는 끝날 때 닫음"""
+    if sink is None:
+        yield None
+        return
+    output = open_sink(sink)
+    try:
+        yield output
+    finally:
+        if output is not sink:
+            output.close()
+
+
+def _in_input_order(results: dict, file_paths: list) -> dict:
+    """끝나는 순서로 모인 결과를 입력 순서로 다시 정렬"""
+    return {file_path: results[file_path] for file_path in file_paths if file_path in results}
+
+
+def _store_result(results: dict, output: Optional[ResultSink], file_path: str, result) -> None:
+    """결과를 저장소에 기록하고 반환값에는 요약만 남김 (저장소가 없으면 결과 전체를 보관)"""
+    if output is None:
+        results[file_path] = result
+    else:
+        output.write(result)
+        results[file_path] = result_summary(result)
+
+
+def _clean_pdf_text(text: str, page_spans: Optional[list]) -> tuple:
+    """
+    PDF 텍스트를 페이지 단위로 정리 (반복되는 머리글/바닥글, 쪽 번호, 아티팩트 제거)
+    
+    Args:
+        text (str): 추출된 텍스트
+        page_spans (list, optional): 페이지별 위치 정보 (없으면 아티팩트만 정리)
+        
+    Returns:
+        tuple: (정리된 텍스트, 다시 계산한 페이지별 위치 정보 또는 None)
+    """
+    if not page_spans:
+        return _clean_pdf_artifacts(text), None
+    pages = ((span['page'], text[span['char_start']:span['char_end']]) for span in page_spans)
+    return join_pages(list(clean_pdf_pages(pages)))
+
+
 def _clean_pdf_artifacts(text: str) -> str:
-    """PDF 특유의 아티팩트 정리"""
-    # PDF에서 자주 나타나는 불필요한 문자 제거
-    import re
-    text = re.sub(r'\f', '', text)  # 폼피드 문자 제거
-    text = re.sub(r'(\w)-\n(\w)', r'\1\2', text)  # 하이픈으로 나뉜 단어 합치기
-    return text
+    """PDF 특유의 아티팩트 정리 (폼피드 제거, 하이픈으로 나뉜 단어 합치기)"""
+    return clean_pdf_artifacts(text)
 
 
 def _remove_html_noise(text: str) -> str:
@@ -439,7 +1301,7 @@ def get_supported_file_types() -> list:
     Returns:
         list: 지원하는 파일 형식 리스트
     """
-    return ['pdf', 'word', 'ppt', 'csv', 'txt', 'excel', 'url']
+    return ['pdf', 'word', 'ppt', 'csv', 'txt', 'excel', 'html', 'markdown', 'json', 'archive', 'url']
 
 
 def validate_file_path(file_path: str) -> bool:
@@ -470,7 +1332,8 @@ def get_file_info(file_path: str) -> dict:
         dict: 파일 정보
     """
     try:
-        file_type = extract_file_type(file_path)
+        # 타입 감지에 사용한 stat 결과를 그대로 재사용
+        file_type, stat_result = extract_file_type_with_stat(file_path)
         
         if file_type == 'url':
             return {
@@ -484,8 +1347,8 @@ def get_file_info(file_path: str) -> dict:
             return {
                 'file_path': file_path,
                 'file_type': file_type,
-                'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else None,
-                'exists': os.path.exists(file_path),
+                'file_size': stat_result.st_size,
+                'exists': True,
                 'is_url': False
             }
     except Exception as e:
@@ -507,9 +1370,45 @@ SUPPORTED_FORMATS = {
     'csv': 'Comma-Separated Values',
     'txt': 'Plain Text File',
     'excel': 'Microsoft Excel Spreadsheet',
+    'html': 'Saved HTML Page',
+    'markdown': 'Markdown Document',
+    'json': 'JSON Document',
+    'archive': 'ZIP/TAR Archive',
     'url': 'Web URL'
 }
 
+# 메모리 입력 타입 (bytes, memoryview, 바이너리 파일 객체)
+FileInput = Union[bytes, bytearray, memoryview, BinaryIO]
+
+# 최대 글자 수만큼 읽을 때 글자당 최대 바이트 수 (UTF-8 기준)
+MAX_BYTES_PER_CHAR = 4
+
+# 이름 없이 메모리로 들어온 입력의 결과 file_path 값
+MEMORY_INPUT_NAME = '<memory>'
+
+# 경로가 필요한 로더용 임시 파일 확장자 (ZIP 기반, OLE 기반)
+TEMP_FILE_SUFFIXES = {
+    'word': ('.docx', '.doc'),
+    'ppt': ('.pptx', '.ppt')
+}
+
+# Word/PowerPoint 추출 백엔드 (기본 시도 순서)
+OFFICE_BACKENDS = ('native', 'unstructured')
+DEFAULT_OFFICE_BACKENDS = ['native', 'unstructured']
+
+# 파일 타입별 직접 추출 함수 (ZIP 기반 문서용, (텍스트, 위치 정보) 반환)
+NATIVE_OFFICE_EXTRACTORS = {
+    'word': _extract_docx_native,
+    'ppt': _extract_pptx_native
+}
+
+# 워커 풀을 사용할 때 워커당 미리 넣어 둘 작업 수
+POOL_TASKS_PER_WORKER = 4
+
+# 예산이 있을 때 Excel을 나눠 읽는 행 수 (처음 읽을 행 수, 다음에 읽을 행 수의 배수)
+EXCEL_INITIAL_ROWS = 1000
+EXCEL_ROW_GROWTH = 4
+
 LOADER_SETTINGS = {
     'word': {'mode': 'elements', 'strategy': 'fast'},
     'ppt': {'mode': 'elements', 'strategy': 'fast'}
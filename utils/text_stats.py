@@ -0,0 +1,191 @@
+"""
+텍스트 통계 모듈
+
+추출한 텍스트의 글자/단어/줄 수, 문자 구성(한글과 라틴 문자 비율), 추정 토큰 수, 출력할 수 없는
+문자 비율을 계산합니다. 텍스트를 고정 크기 조각으로 나눠 차례로 한 번만 훑습니다. 조각마다 문자
+코드를 numpy 배열로 바꿔 조회표로 문자 종류(줄바꿈, 한글, 라틴, 출력할 수 없는 문자)를 한꺼번에
+세고, 단어 수만 조각 크기의 split으로 세므로 문서 전체 크기의 단어 목록이나 줄 목록을 만들지 않습니다.
+스트리밍으로 받은 조각에 update를 반복 호출해도 문서 전체에 한 번에 계산한 것과 같은 결과가 나옵니다.
+
+사용법:
+    stats = TextStats.from_text(text)
+    print(stats.word_count, stats.hangul_ratio)
+    
+    stats = TextStats()
+    for chunk in chunks:
+        stats.update(chunk)
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class TextStats:
+    """
+    텍스트 통계 (update로 조각을 차례로 추가)
+    
+    단어는 공백이 아닌 문자가 이어진 구간(str.split()과 같은 기준)이고, 줄 수는 줄바꿈 수 + 1
+    (빈 텍스트는 0)입니다. 조각 경계에서 끊긴 단어는 한 단어로 셉니다.
+    """
+    
+    def __init__(self):
+        self.char_count = 0
+        self.word_count = 0
+        self.newline_count = 0
+        self.hangul_count = 0
+        self.latin_count = 0
+        self.non_printable_count = 0
+        # 마지막 조각이 단어 중간에서 끝났는지 여부
+        self._in_word = False
+    
+    @classmethod
+    def from_text(cls, text: Optional[str]) -> 'TextStats':
+        """
+        문서 하나의 통계
+        
+        Args:
+            text (str): 텍스트
+            
+        Returns:
+            TextStats: 통계
+        """
+        stats = cls()
+        if text:
+            for start in range(0, len(text), STATS_CHUNK_SIZE):
+                stats.update(text[start:start + STATS_CHUNK_SIZE])
+        return stats
+    
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[str]) -> 'TextStats':
+        """
+        스트리밍으로 받은 조각들의 통계
+        
+        Args:
+            chunks (Iterable[str]): 텍스트 조각들 (문서 순서대로)
+            
+        Returns:
+            TextStats: 통계
+        """
+        stats = cls()
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+    
+    def update(self, chunk: str) -> 'TextStats':
+        """
+        텍스트 조각 하나를 통계에 추가
+        
+        조각이 크면 STATS_CHUNK_SIZE 크기로 나눠 처리하므로 한 번에 만드는 임시 목록의 크기가 일정합니다.
+        
+        Args:
+            chunk (str): 텍스트 조각
+            
+        Returns:
+            TextStats: 자기 자신 (연쇄 호출용)
+        """
+        if len(chunk) > STATS_CHUNK_SIZE:
+            for start in range(0, len(chunk), STATS_CHUNK_SIZE):
+                self._update(chunk[start:start + STATS_CHUNK_SIZE])
+        elif chunk:
+            self._update(chunk)
+        return self
+    
+    def _update(self, chunk: str) -> None:
+        words = len(chunk.split())
+        # 앞 조각의 마지막 단어가 이 조각으로 이어지면 한 단어로 셈
+        if self._in_word and not chunk[0].isspace():
+            words -= 1
+        self._in_word = not chunk[-1].isspace()
+        
+        # 기본 다국어 평면 밖의 문자는 조회표의 마지막 칸(기타)으로 봄
+        codes = np.frombuffer(chunk.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        counts = np.bincount(_CHAR_CLASSES[np.minimum(codes, 0xFFFF)], minlength=_CLASS_COUNT)
+        self.char_count += len(chunk)
+        self.word_count += words
+        self.newline_count += int(counts[_NEWLINE])
+        self.hangul_count += int(counts[_HANGUL])
+        self.latin_count += int(counts[_LATIN])
+        self.non_printable_count += int(counts[_NON_PRINTABLE])
+    
+    @property
+    def line_count(self) -> int:
+        """줄 수 (빈 텍스트는 0)"""
+        return self.newline_count + 1 if self.char_count else 0
+    
+    @property
+    def hangul_ratio(self) -> float:
+        """한글과 라틴 문자 중 한글 비율 (둘 다 없으면 0)"""
+        letters = self.hangul_count + self.latin_count
+        return self.hangul_count / letters if letters else 0.0
+    
+    @property
+    def latin_ratio(self) -> float:
+        """한글과 라틴 문자 중 라틴 문자 비율 (둘 다 없으면 0)"""
+        letters = self.hangul_count + self.latin_count
+        return self.latin_count / letters if letters else 0.0
+    
+    @property
+    def non_printable_ratio(self) -> float:
+        """전체 글자 중 제어 문자, 보이지 않는 서식 문자, 대체 문자(U+FFFD)의 비율"""
+        return self.non_printable_count / self.char_count if self.char_count else 0.0
+    
+    @property
+    def token_estimate(self) -> int:
+        """
+        LLM 토큰 수 추정값 (한글은 글자당 HANGUL_TOKENS_PER_CHAR, 나머지는 CHARS_PER_TOKEN 글자당 1개)
+        
+        실제 토크나이저보다 훨씬 빠른 대략적인 값이며, 청크 크기나 임베딩 비용을 가늠하는 데 사용합니다.
+        """
+        other = self.char_count - self.hangul_count
+        return round(self.hangul_count * HANGUL_TOKENS_PER_CHAR + other / CHARS_PER_TOKEN)
+    
+    def as_metadata(self) -> dict:
+        """
+        메타데이터 결과에 넣을 통계 필드
+        
+        Returns:
+            dict: {'char_count', 'word_count', 'line_count', 'token_estimate',
+                'hangul_ratio', 'latin_ratio', 'non_printable_ratio'} (비율은 소수점 4자리)
+        """
+        return {
+            'char_count': self.char_count,
+            'word_count': self.word_count,
+            'line_count': self.line_count,
+            'token_estimate': self.token_estimate,
+            'hangul_ratio': round(self.hangul_ratio, 4),
+            'latin_ratio': round(self.latin_ratio, 4),
+            'non_printable_ratio': round(self.non_printable_ratio, 4),
+        }
+
+
+def _build_char_classes() -> np.ndarray:
+    """문자 종류 조회표 생성 (기본 다국어 평면의 문자 코드 -> 종류)"""
+    classes = np.full(0x10000, _OTHER, dtype=np.uint8)
+    # 줄바꿈/탭을 제외한 제어 문자, 폭 없는 서식 문자, 단어 결합자, BOM, 대체 문자
+    for start, end in ((0x00, 0x08), (0x0B, 0x0C), (0x0E, 0x1F), (0x7F, 0x9F), (0x200B, 0x200F),
+                       (0x2060, 0x2060), (0xFEFF, 0xFEFF), (0xFFFD, 0xFFFD)):
+        classes[start:end + 1] = _NON_PRINTABLE
+    # 기본 라틴 문자와 악센트가 있는 라틴 문자 (곱셈/나눗셈 기호 제외)
+    for start, end in ((0x41, 0x5A), (0x61, 0x7A), (0xC0, 0xD6), (0xD8, 0xF6), (0xF8, 0x24F)):
+        classes[start:end + 1] = _LATIN
+    # 한글 음절, 자모, 호환 자모
+    for start, end in ((0xAC00, 0xD7A3), (0x1100, 0x11FF), (0x3130, 0x318F)):
+        classes[start:end + 1] = _HANGUL
+    classes[0x0A] = _NEWLINE
+    classes[0xFFFF] = _OTHER
+    return classes
+
+
+# 상수들
+# 한 번에 처리할 조각 크기 (글자 수)
+STATS_CHUNK_SIZE = 64 * 1024
+
+# 토큰 수 추정 계수
+HANGUL_TOKENS_PER_CHAR = 1.0
+CHARS_PER_TOKEN = 4.0
+
+# 문자 종류
+_OTHER, _NEWLINE, _HANGUL, _LATIN, _NON_PRINTABLE = range(5)
+_CLASS_COUNT = 5
+_CHAR_CLASSES = _build_char_classes()
@@ -0,0 +1,481 @@
+"""
+상주 워커 풀 모듈
+
+Word/PowerPoint 로더(unstructured)는 import와 초기화 비용이 커서 짧은 작업에서는
+문서 처리보다 프로세스 준비 시간이 더 오래 걸립니다. 이 모듈은 무거운 모듈을 한 번만
+불러온 fork 서버에서 워커들을 미리 만들어 두고, 로컬 큐로 작업을 나눠줍니다.
+워커는 일정 개수의 문서를 처리했거나 최대 메모리 사용량을 넘으면 종료되고
+새 워커로 교체됩니다 (교체된 워커도 fork 서버에서 만들어지므로 이미 준비된 상태입니다).
+
+문제가 있는 문서 하나가 전체 일괄 처리를 멈추지 않도록 문서별 처리 시간(task_timeout)과
+워커 메모리(memory_limit_mb: RSS, address_space_limit_mb: 주소 공간)를 제한할 수 있습니다.
+제한을 넘은 워커는 강제 종료되고, 해당 작업의 Future는 원인별 예외(TaskTimeoutError,
+TaskMemoryError, WorkerCrashedError)로 실패합니다.
+"""
+
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Iterator, List, Optional, Tuple
+
+from .metrics import ERRORS, FILES_PROCESSED, METRICS
+
+try:
+    import resource
+except ImportError:
+    # Windows에는 resource 모듈이 없음 (메모리 기준 교체 비활성화)
+    resource = None
+
+
+class WarmWorkerPool:
+    """
+    무거운 로더를 미리 불러온 상주 워커 프로세스 풀
+    
+    Args:
+        max_workers (int, optional): 워커 프로세스 수. 기본값은 CPU 수
+        max_tasks_per_worker (int, optional): 워커 하나가 처리할 최대 문서 수 (넘으면 교체, None이면 무제한)
+        max_memory_mb (float, optional): 워커의 최대 메모리 사용량(MB). 문서 처리 후 최대 RSS가
+            이 값을 넘으면 교체 (None이면 확인하지 않음)
+        warm_modules (List[str], optional): 워커를 만들기 전에 불러올 모듈 이름들
+            (기본값 WARM_MODULES)
+        task_timeout (float, optional): 문서 하나의 최대 처리 시간(초). 넘으면 워커를 강제 종료하고
+            TaskTimeoutError로 실패 (None이면 제한 없음, submit에서 작업별로 지정 가능)
+        memory_limit_mb (float, optional): 문서 처리 중 워커의 RSS 한도(MB). 넘으면 워커를 강제
+            종료하고 TaskMemoryError로 실패 (Linux의 /proc에서 WORKER_CHECK_INTERVAL마다 확인)
+        address_space_limit_mb (float, optional): 워커의 주소 공간 한도(MB, RLIMIT_AS).
+            할당이 한도를 넘으면 워커 안에서 MemoryError가 발생 (확인 주기 사이의 급격한
+            메모리 증가도 막음). 불러온 모듈과 스레드 스택을 포함한 가상 메모리 전체이므로
+            memory_limit_mb보다 넉넉하게 지정
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_tasks_per_worker: Optional[int] = 200,
+                 max_memory_mb: Optional[float] = None, warm_modules: Optional[List[str]] = None,
+                 task_timeout: Optional[float] = None, memory_limit_mb: Optional[float] = None,
+                 address_space_limit_mb: Optional[float] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_memory_mb = max_memory_mb
+        self.warm_modules = list(warm_modules) if warm_modules is not None else WARM_MODULES
+        self.task_timeout = task_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.address_space_limit_mb = address_space_limit_mb
+        
+        self._context = _get_context(self.warm_modules)
+        self._tasks = self._context.Queue()
+        self._messages = self._context.Queue()
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        # 작업 ID -> Future, 작업 ID -> 처리 시간 제한, 워커 pid -> Process,
+        # 워커 pid -> (처리 중인 작업 ID, 시작 시각), 워커 pid -> 강제 종료한 이유 (작업 ID, 예외 클래스, 메시지)
+        self._futures = {}
+        self._timeouts = {}
+        # 작업 ID -> 파일 타입 (워커를 강제 종료한 실패를 메트릭에 기록할 때 사용)
+        self._file_types = {}
+        self._workers = {}
+        self._in_flight = {}
+        self._killed = {}
+        self._closed = False
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'workers_started': 0,
+                       'workers_recycled': 0, 'workers_crashed': 0, 'timeouts': 0, 'memory_exceeded': 0}
+        
+        for _ in range(self.max_workers):
+            self._start_worker()
+        
+        self._collector = threading.Thread(target=self._collect, name='WarmWorkerPool-collector', daemon=True)
+        self._collector.start()
+    
+    def submit(self, file_path: str, timeout: Optional[float] = None, **options) -> Future:
+        """
+        파일 하나의 텍스트 추출 작업을 큐에 넣음
+        
+        Args:
+            file_path (str): 파일 경로 또는 URL
+            timeout (float, optional): 이 작업의 최대 처리 시간(초). 기본값은 task_timeout
+                (큐에서 기다린 시간은 포함하지 않음)
+            **options: to_text_data_sync에 전달할 옵션 (include_metadata, file_type, max_chars 등).
+                워커는 자식 프로세스를 만들 수 없으므로 archive_workers의 기본값은 1
+            
+        Returns:
+            Future: to_text_data_sync의 결과를 담을 Future (실패하면 WorkerTaskError 또는 그 하위 예외).
+                워커에서 처리를 시작한 작업은 elapsed 속성에 처리 시간(초)이 기록됨
+            
+        Raises:
+            RuntimeError: 이미 종료된 풀인 경우
+        """
+        options.setdefault('archive_workers', 1)
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("종료된 워커 풀에는 작업을 추가할 수 없습니다")
+            task_id = next(self._task_ids)
+            self._futures[task_id] = future
+            self._file_types[task_id] = options.get('file_type')
+            timeout = timeout if timeout is not None else self.task_timeout
+            if timeout is not None:
+                self._timeouts[task_id] = timeout
+            self._stats['submitted'] += 1
+        self._tasks.put((task_id, file_path, options))
+        return future
+    
+    def map_files(self, file_paths: List[str], include_metadata: bool = True,
+                  file_types: Optional[dict] = None, **options) -> Iterator[Tuple[str, object]]:
+        """
+        여러 파일을 풀에서 처리하고 입력 순서대로 결과를 반환
+        
+        Args:
+            file_paths (List[str]): 파일 경로 리스트
+            include_metadata (bool): 메타데이터 포함 여부
+            file_types (dict, optional): {파일 경로: 미리 감지한 파일 타입}
+            **options: to_text_data_sync에 전달할 추가 옵션
+            
+        Yields:
+            Tuple[str, object]: (파일 경로, 결과)
+        """
+        file_types = file_types or {}
+        futures = [
+            (file_path, self.submit(file_path, include_metadata=include_metadata,
+                                    file_type=file_types.get(file_path), **options))
+            for file_path in file_paths
+        ]
+        for file_path, future in futures:
+            yield file_path, future.result()
+    
+    def stats(self) -> dict:
+        """작업 및 워커 교체 통계 (현재 살아 있는 워커 수와 대기 중인 작업 수 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['workers'] = len(self._workers)
+            stats['pending'] = len(self._futures)
+        return stats
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        풀을 종료 (wait=True면 큐에 남은 작업을 모두 처리한 뒤 종료)
+        
+        Args:
+            wait (bool): 남은 작업을 기다릴지 여부. False면 워커를 바로 종료하고
+                남은 작업은 취소합니다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker_count = len(self._workers)
+        
+        if wait:
+            # 워커마다 종료 신호 하나씩 (큐의 작업이 모두 처리된 뒤에 전달됨)
+            for _ in range(worker_count):
+                self._tasks.put(None)
+            self._collector.join()
+        else:
+            with self._lock:
+                workers = list(self._workers.values())
+            for process in workers:
+                process.terminate()
+            self._collector.join()
+        
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+            self._timeouts.clear()
+            self._file_types.clear()
+        for future in pending:
+            future.cancel()
+        self._tasks.close()
+        self._messages.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=exc_type is None)
+    
+    def _start_worker(self) -> None:
+        """워커 프로세스 하나를 시작"""
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._tasks, self._messages, self.max_tasks_per_worker, self.max_memory_mb,
+                  self.warm_modules, self.address_space_limit_mb),
+            daemon=True
+        )
+        process.start()
+        self._workers[process.pid] = process
+        self._stats['workers_started'] += 1
+    
+    def _collect(self) -> None:
+        """워커가 보낸 메시지로 Future를 완료하고, 종료된 워커를 교체하는 스레드"""
+        while True:
+            try:
+                self._handle_message(self._messages.get(timeout=WORKER_CHECK_INTERVAL))
+            except queue.Empty:
+                pass
+            
+            with self._lock:
+                self._kill_over_limit()
+                self._reap_workers()
+                if self._closed and not self._workers:
+                    return
+    
+    def _handle_message(self, message: tuple) -> None:
+        """워커 메시지 처리 ('ready', 'start', 'metrics', 'done', 'exit')"""
+        kind, pid, task_id, payload = message
+        if kind == 'ready':
+            return
+        if kind == 'metrics':
+            # 워커에서 작업 하나를 처리하는 동안 바뀐 메트릭을 이 프로세스의 메트릭에 합침
+            METRICS.merge(payload)
+            return
+        with self._lock:
+            if kind == 'start':
+                self._in_flight[pid] = (task_id, time.monotonic())
+                future = self._futures.get(task_id)
+            elif kind == 'exit':
+                self._stats['workers_recycled'] += payload
+                return
+            else:
+                started = self._in_flight.pop(pid, None)
+                self._timeouts.pop(task_id, None)
+                self._file_types.pop(task_id, None)
+                future = self._futures.pop(task_id, None)
+                ok, value = payload
+                self._stats['completed' if ok else 'failed'] += 1
+        
+        if kind == 'start':
+            # 워커가 작업을 시작하면 Future.running()이 True가 됨 (이미 취소된 작업은 결과를 버림)
+            if future is not None:
+                future.set_running_or_notify_cancel()
+            return
+        
+        if future is None or future.cancelled():
+            return
+        if started is not None and started[0] == task_id:
+            future.elapsed = time.monotonic() - started[1]
+        if ok:
+            future.set_result(value)
+        else:
+            error_type, error_msg = value
+            future.set_exception(WORKER_ERRORS.get(error_type, WorkerTaskError)(error_msg))
+    
+    def _reap_workers(self) -> None:
+        """종료된 워커를 정리하고 필요하면 새 워커를 시작 (self._lock을 잡은 상태에서 호출)"""
+        dead = [pid for pid, process in self._workers.items() if not process.is_alive()]
+        if not dead:
+            return
+        
+        # 워커가 종료 직전에 보낸 완료 메시지를 먼저 처리
+        self._lock.release()
+        try:
+            while True:
+                try:
+                    self._handle_message(self._messages.get_nowait())
+                except queue.Empty:
+                    break
+        finally:
+            self._lock.acquire()
+        
+        for pid in dead:
+            self._workers.pop(pid).join()
+            in_flight = self._in_flight.pop(pid, None)
+            killed = self._killed.pop(pid, None)
+            if in_flight is not None:
+                # 문서 처리 중에 종료된 워커 (제한 초과로 강제 종료했거나 비정상 종료)
+                task_id = in_flight[0]
+                if killed is not None and killed[0] == task_id:
+                    error_class, error_msg = killed[1:]
+                else:
+                    error_class, error_msg = WorkerCrashedError, f"워커 프로세스가 비정상 종료되었습니다 (pid {pid})"
+                if error_class is WorkerCrashedError:
+                    self._stats['workers_crashed'] += 1
+                self._stats['failed'] += 1
+                self._timeouts.pop(task_id, None)
+                # 워커 안에서 난 오류는 워커가 기록하지만, 강제 종료나 비정상 종료는 여기서만 알 수 있음
+                file_type = self._file_types.pop(task_id, None) or 'unknown'
+                FILES_PROCESSED.inc(file_type, 'failed')
+                ERRORS.inc(file_type, error_class.error_type)
+                future = self._futures.pop(task_id, None)
+                if future is not None and not future.cancelled():
+                    future.elapsed = time.monotonic() - in_flight[1]
+                    future.set_exception(error_class(error_msg))
+            if not self._closed:
+                self._start_worker()
+    
+    def _kill_over_limit(self) -> None:
+        """처리 시간이나 RSS 한도를 넘은 워커를 강제 종료 (self._lock을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        for pid, (task_id, started_at) in self._in_flight.items():
+            if pid in self._killed or pid not in self._workers:
+                continue
+            
+            timeout = self._timeouts.get(task_id)
+            if timeout is not None and now - started_at > timeout:
+                self._stats['timeouts'] += 1
+                self._killed[pid] = (task_id, TaskTimeoutError, f"처리 시간 제한({timeout:g}초)을 넘었습니다")
+            elif self.memory_limit_mb is not None:
+                rss_mb = _rss_mb(pid)
+                if rss_mb is None or rss_mb <= self.memory_limit_mb:
+                    continue
+                self._stats['memory_exceeded'] += 1
+                self._killed[pid] = (task_id, TaskMemoryError,
+                                     f"메모리 한도({self.memory_limit_mb:g}MB)를 넘었습니다 (RSS {rss_mb:.0f}MB)")
+            else:
+                continue
+            # 다음 확인 주기에 _reap_workers가 작업을 실패 처리하고 워커를 교체
+            self._workers[pid].kill()
+
+
+class WorkerTaskError(RuntimeError):
+    """워커에서 작업이 실패함 (error_type은 결과의 error_type 필드에 기록할 분류)"""
+    error_type = 'error'
+
+
+class TaskTimeoutError(WorkerTaskError):
+    """처리 시간 제한을 넘어 워커를 강제 종료함"""
+    error_type = 'timeout'
+
+
+class TaskMemoryError(WorkerTaskError):
+    """메모리 한도를 넘어 워커를 강제 종료했거나 워커 안에서 MemoryError가 발생함"""
+    error_type = 'memory_limit'
+
+
+class WorkerCrashedError(WorkerTaskError):
+    """문서 처리 중에 워커 프로세스가 비정상 종료됨 (세그폴트, OOM killer 등)"""
+    error_type = 'worker_crashed'
+
+
+def _get_context(warm_modules: List[str]):
+    """
+    워커를 만들 multiprocessing 컨텍스트를 반환
+    
+    fork 서버를 지원하면 무거운 모듈을 fork 서버에 미리 불러와 워커가 이미 준비된 상태로
+    시작되도록 하고, 지원하지 않으면(Windows) 각 워커가 시작할 때 모듈을 불러옵니다.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    
+    context = multiprocessing.get_context('forkserver')
+    # fork 서버가 이미 실행 중이면 무시되므로 워커에서도 다시 불러옴
+    context.set_forkserver_preload(warm_modules)
+    return context
+
+
+def _worker_main(tasks, messages, max_tasks: Optional[int], max_memory_mb: Optional[float],
+                 warm_modules: List[str], address_space_limit_mb: Optional[float] = None) -> None:
+    """
+    워커 프로세스 본체: 큐에서 작업을 받아 to_text_data_sync로 처리
+    
+    Args:
+        tasks: 작업 큐 ((작업 ID, 파일 경로, 옵션) 또는 종료 신호 None)
+        messages: 결과 메시지 큐
+        max_tasks (int, optional): 처리할 최대 문서 수
+        max_memory_mb (float, optional): 최대 메모리 사용량(MB)
+        warm_modules (List[str]): 미리 불러올 모듈 이름들
+        address_space_limit_mb (float, optional): 주소 공간 한도(MB)
+    """
+    _warm_up(warm_modules)
+    from .text_processor import to_text_data_sync
+    
+    pid = os.getpid()
+    # 메시지 큐의 전송 스레드는 첫 put에서 만들어지므로 주소 공간을 제한하기 전에 시작
+    messages.put(('ready', pid, None, None))
+    _limit_address_space(address_space_limit_mb)
+    
+    handled = 0
+    recycled = 0
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        
+        task_id, file_path, options = task
+        messages.put(('start', pid, task_id, None))
+        try:
+            result = to_text_data_sync(file_path, **options)
+            payload = (True, result)
+            # 메타데이터 결과로 보고된 MemoryError 이후에는 메모리가 조각나 있을 수 있으므로 교체
+            out_of_memory = isinstance(result, dict) and result.get('error_type') == 'memory_limit'
+        except MemoryError as e:
+            payload = (False, ('memory_limit', f"MemoryError: {e}"))
+            out_of_memory = True
+        except Exception as e:
+            # 예외 객체는 pickle되지 않을 수 있으므로 (분류, 메시지)로 전달
+            payload = (False, ('error', f"{type(e).__name__}: {e}"))
+            out_of_memory = False
+        # Future가 완료되기 전에 부모 프로세스의 메트릭에 반영되도록 결과보다 먼저 보냄
+        messages.put(('metrics', pid, task_id, METRICS.snapshot(reset=True)))
+        messages.put(('done', pid, task_id, payload))
+        
+        handled += 1
+        if (max_tasks is not None and handled >= max_tasks) or out_of_memory or _over_memory_limit(max_memory_mb):
+            recycled = 1
+            break
+    
+    messages.put(('exit', pid, None, recycled))
+
+
+def _warm_up(warm_modules: List[str]) -> None:
+    """무거운 모듈을 미리 불러옴 (설치되지 않은 선택적 모듈은 건너뜀)"""
+    import importlib
+    for module_name in warm_modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"워커 준비 중 모듈을 불러올 수 없습니다 ({module_name}): {e}")
+
+
+def _limit_address_space(address_space_limit_mb: Optional[float]) -> None:
+    """워커의 주소 공간 한도(RLIMIT_AS)를 설정 (resource 모듈이 없으면 경고만 출력)"""
+    if address_space_limit_mb is None:
+        return
+    if resource is None or not hasattr(resource, 'RLIMIT_AS'):
+        print("이 플랫폼에서는 주소 공간 한도를 설정할 수 없습니다")
+        return
+    limit = int(address_space_limit_mb * 1024 * 1024)
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    """워커의 현재 RSS(MB). /proc이 없는 플랫폼이거나 이미 종료된 경우 None"""
+    try:
+        with open(f'/proc/{pid}/statm', 'rb') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * PAGE_SIZE / (1024 * 1024)
+
+
+def _over_memory_limit(max_memory_mb: Optional[float]) -> bool:
+    """워커의 최대 RSS(high-water mark)가 제한을 넘었는지 확인"""
+    if max_memory_mb is None or resource is None:
+        return False
+    # Linux는 KB, macOS는 바이트 단위
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_mb = max_rss / (1024 * 1024) if os.uname().sysname == 'Darwin' else max_rss / 1024
+    return max_rss_mb > max_memory_mb
+
+
+# 상수들
+WORKER_CHECK_INTERVAL = 0.2
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# 워커가 보낸 오류 분류 -> Future에 설정할 예외 클래스
+WORKER_ERRORS = {
+    'error': WorkerTaskError,
+    'memory_limit': TaskMemoryError,
+}
+
+# 워커를 만들기 전에 미리 불러올 모듈 (Word/PowerPoint 로더 포함)
+WARM_MODULES = [
+    f'{__package__}.text_processor',
+    'langchain_community.document_loaders',
+    'unstructured.partition.docx',
+    'unstructured.partition.pptx',
+]